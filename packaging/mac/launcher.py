@@ -1,6 +1,7 @@
 # Same as Windows launcher but for Mac file paths
 import sys
 import os
+import multiprocessing
 
 # Go up two levels to project root, then find src
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -11,4 +12,6 @@ sys.path.insert(0, src_path)
 from text_ranking_tool.main import main  # noqa: E402
 
 if __name__ == "__main__":
+    # Required for process pools in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
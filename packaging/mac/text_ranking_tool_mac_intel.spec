@@ -20,6 +20,7 @@ a = Analysis(
         'text_ranking_tool.main',
         'text_ranking_tool.algorithms.recursive_median.recursive_median_core',
         'text_ranking_tool.algorithms.tournament.tournament_core',
+        'text_ranking_tool.algorithms.transitive_quick.transitive_quick_core',
     ],
     hookspath=[],
     hooksconfig={},
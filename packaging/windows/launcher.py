@@ -1,6 +1,7 @@
 # C:\gitprojects\text_ranking_app_v1\launcher.py
 import sys
 import os
+import multiprocessing
 
 # Add the src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -9,4 +10,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from text_ranking_tool.main import main
 
 if __name__ == "__main__":
+    # Required for process pools in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
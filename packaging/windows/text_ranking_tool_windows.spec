@@ -23,8 +23,10 @@ a = Analysis(
         'text_ranking_tool.algorithms',
         'text_ranking_tool.algorithms.recursive_median',
         'text_ranking_tool.algorithms.tournament',
+        'text_ranking_tool.algorithms.transitive_quick',
         'text_ranking_tool.algorithms.recursive_median.recursive_median_core',
         'text_ranking_tool.algorithms.tournament.tournament_core',
+        'text_ranking_tool.algorithms.transitive_quick.transitive_quick_core',
     ],
     hookspath=[],
     hooksconfig={},
@@ -1,12 +1,6 @@
 # src/text_ranking_tool/algorithms/__init__.py
-
-# This file ensures all algorithms are registered when the package is imported.
-
-# First, import the now-simple registry object.
+# Algorithms are declared in manifest.json (built-ins) or through the
+# `text_ranking_tool.algorithms` entry point group (plugins). The registry
+# reads those declarations and imports an algorithm's module only when it
+# is first created, so importing this package stays cheap.
 from .registry import algorithm_registry  # noqa: F401
-
-# Now, import each algorithm's module. The act of importing these files
-# will execute the @algorithm_registry.register decorator inside them.
-from .tournament import tournament_core
-from .recursive_median import recursive_median_core
-from .transitive_quick import transitive_quick_core
@@ -28,3 +28,9 @@ class SortingAlgorithm(ABC):
     def reset_counters(self):
         """Reset comparison counters"""
         self.comparison_count = 0
+    
+    def prepare_next_comparison(self, text_id: str, other_id: str):
+        """Tell the comparison engine which pair is asked next so its screen can be rendered early"""
+        prepare = getattr(self.comparison_engine, "prepare_comparison", None)
+        if prepare is not None:
+            prepare(text_id, other_id)
@@ -14,9 +14,9 @@ for optimal divide-and-conquer performance, living up to its "Recursive Median"
 """
 
 import random
-import statistics
 from ..base import SortingAlgorithm
 from ..registry import algorithm_registry
+from ...data.dataset import Dataset, as_dataset
 from typing import List, Dict, Any, Optional
 
 
@@ -37,12 +37,12 @@ class RecursiveMedianSort(SortingAlgorithm):
             self.ALGORITHM_ID,
             self.SCHEMA_KEY
         )
-        self.text_data = {}  # Store for pivot selection
+        self.dataset: Optional[Dataset] = None  # Store for pivot selection
         self.comparison_engine = None  # Will be set during initialization
 
     def initialize_from_data(self, data: List[Dict[str, Any]], **kwargs) -> bool:
         """Store text data for pivot selection"""
-        self.text_data = {item['id']: item for item in data}
+        self.dataset = as_dataset(data)
         return True
 
     def sort(self, ids: List[str], use_valence_pivot: bool = True) -> List[str]:
@@ -67,7 +67,9 @@ class RecursiveMedianSort(SortingAlgorithm):
 
         above, below = [], []
         # Loop over the new, shuffled list
-        for text_id in non_pivots:
+        for position, text_id in enumerate(non_pivots):
+            if position + 1 < len(non_pivots):
+                self.prepare_next_comparison(non_pivots[position + 1], pivot_id)
             self.comparison_count += 1
             if self.ask_if_more_negative(text_id, pivot_id):
                 below.append(text_id)
@@ -84,20 +86,9 @@ class RecursiveMedianSort(SortingAlgorithm):
         if not ids:
             return None
 
-        try:
-            vals = [float(self.text_data[i]['valence']) for i in ids if i in self.text_data]
-            if not vals:
-                return random.choice(ids)
-
-            median_val = statistics.median(vals)
-            closest_id = min(
-                ids,
-                key=lambda i: abs(float(self.text_data[i].get('valence', 0)) - median_val)
-                if i in self.text_data else float('inf')
-            )
-            return closest_id
-        except (KeyError, ValueError, TypeError):
-            return random.choice(ids)
+        # Selection over the dataset's precomputed valence ranks (no float parsing per partition)
+        pivot_id = self.dataset.median_valence_id(ids) if self.dataset is not None else None
+        return pivot_id if pivot_id is not None else random.choice(ids)
 
     def ask_if_more_negative(self, text_id: str, pivot_id: str) -> bool:
         """Use comparison engine for intelligent caching"""
@@ -1,43 +1,126 @@
 # src/text_ranking_tool/algorithms/registry.py
 # type: ignore
-from typing import Dict, Type, Any
-from .base import SortingAlgorithm
+"""
+Algorithm registry with lazy discovery
+Algorithms are declared, not imported: built-ins in manifest.json next to this
+file, third-party packages through the `text_ranking_tool.algorithms` entry
+point group (`<algorithm_id> = package.module:AlgorithmClass`). Listing reads
+only those declarations; an algorithm's module is imported the first time it
+is created.
+"""
+
+import importlib
+import json
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, Type, Any
+
+if TYPE_CHECKING:
+    from .base import SortingAlgorithm
+
+MANIFEST_FILE = Path(__file__).parent / "manifest.json"
+ENTRY_POINT_GROUP = "text_ranking_tool.algorithms"
+
+
+class AlgorithmSpec(NamedTuple):
+    """Declared algorithm: metadata plus where to import it from"""
+    algorithm_id: str
+    name: str
+    description: str
+    module: str        # relative modules resolve against this package
+    class_name: str
+    source: str        # "manifest" or the providing distribution
+
 
 class AlgorithmRegistry:
-    """Simple registry for auto-discovering ranking algorithms"""
+    """Registry of declared ranking algorithms, imported on first use"""
     def __init__(self):
-        self._algorithms: Dict[str, Type[SortingAlgorithm]] = {}
+        self._algorithms: Dict[str, Type['SortingAlgorithm']] = {}
+        self._specs: Optional[Dict[str, AlgorithmSpec]] = None
     
-    def register(self, algorithm_class: Type[SortingAlgorithm]):
-        """Decorator for auto-registering algorithm classes"""
+    def register(self, algorithm_class: Type['SortingAlgorithm']):
+        """Decorator for registering algorithm classes as their modules are imported"""
         # Using the class attribute directly avoids creating an instance here
         self._algorithms[algorithm_class.ALGORITHM_ID] = algorithm_class
         return algorithm_class
     
-    def get_algorithm(self, algorithm_id: str) -> Type[SortingAlgorithm]:
-        """Get algorithm class by ID"""
-        if algorithm_id not in self._algorithms:
+    def _discover(self) -> Dict[str, AlgorithmSpec]:
+        """Read the manifest and entry point declarations once, without importing anything"""
+        if self._specs is not None:
+            return self._specs
+        
+        specs: Dict[str, AlgorithmSpec] = {}
+        try:
+            with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                for algo_id, entry in json.load(f).items():
+                    specs[algo_id] = AlgorithmSpec(algo_id, entry["name"], entry["description"],
+                                                   entry["module"], entry["class"], "manifest")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: Could not read algorithm manifest {MANIFEST_FILE}: {e}")
+        
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            if entry_point.name in specs:
+                print(f"Warning: Ignoring plugin algorithm '{entry_point.name}' (ID already declared)")
+                continue
+            module, _, class_name = entry_point.value.partition(':')
+            if not module.strip() or not class_name.strip():
+                print(f"Warning: Ignoring plugin algorithm '{entry_point.name}' "
+                      f"(entry point must be 'module:AlgorithmClass', got '{entry_point.value}')")
+                continue
+            dist = entry_point.dist
+            source = dist.name if dist else ENTRY_POINT_GROUP
+            summary = (dist.metadata.get("Summary") if dist else None) or f"Plugin algorithm from {source}"
+            specs[entry_point.name] = AlgorithmSpec(entry_point.name, entry_point.name, summary,
+                                                    module.strip(), class_name.strip(), source)
+        
+        self._specs = specs
+        return specs
+    
+    def _load(self, spec: AlgorithmSpec) -> Type['SortingAlgorithm']:
+        """Import a declared algorithm's module and return its class"""
+        module = importlib.import_module(spec.module, package=__package__)
+        algorithm_class = getattr(module, spec.class_name, None)
+        if algorithm_class is None:
+            raise ValueError(f"Algorithm '{spec.algorithm_id}': {spec.module} has no class '{spec.class_name}'")
+        if algorithm_class.ALGORITHM_ID != spec.algorithm_id:
+            print(f"Warning: {spec.class_name} declares ALGORITHM_ID '{algorithm_class.ALGORITHM_ID}', "
+                  f"registered as '{spec.algorithm_id}'")
+        self._algorithms[spec.algorithm_id] = algorithm_class
+        return algorithm_class
+    
+    def get_algorithm(self, algorithm_id: str) -> Type['SortingAlgorithm']:
+        """Get algorithm class by ID, importing its module on first use"""
+        if algorithm_id in self._algorithms:
+            return self._algorithms[algorithm_id]
+        spec = self._discover().get(algorithm_id)
+        if spec is None:
             raise ValueError(f"Algorithm '{algorithm_id}' not found")
-        return self._algorithms[algorithm_id]
+        return self._load(spec)
     
     def list_algorithms(self) -> Dict[str, Dict[str, Any]]:
-        """List all registered algorithms with metadata"""
+        """List all declared and registered algorithms with metadata (no imports)"""
         algorithms = {}
-        for algo_id, algo_class in self._algorithms.items():
-            # Using class attributes directly for efficiency
+        for algo_id, spec in self._discover().items():
             algorithms[algo_id] = {
+                "name": spec.name,
+                "description": spec.description,
+                "algorithm_id": algo_id,
+                "source": spec.source
+            }
+        for algo_id, algo_class in self._algorithms.items():
+            # Classes registered by import only (not declared anywhere)
+            algorithms.setdefault(algo_id, {
                 "name": algo_class.NAME,
                 "description": algo_class.DESCRIPTION,
-                "algorithm_id": algo_class.ALGORITHM_ID
-            }
+                "algorithm_id": algo_class.ALGORITHM_ID,
+                "source": algo_class.__module__
+            })
         return algorithms
     
-    def create_algorithm(self, algorithm_id: str) -> SortingAlgorithm:
+    def create_algorithm(self, algorithm_id: str) -> 'SortingAlgorithm':
         """Create new instance of algorithm"""
         algorithm_class = self.get_algorithm(algorithm_id)
         return algorithm_class()
 
 # Global registry instance
 algorithm_registry = AlgorithmRegistry()
-
-# THE DISCOVERY LOGIC HAS BEEN REMOVED FROM THIS FILE
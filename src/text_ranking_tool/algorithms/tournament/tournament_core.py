@@ -15,9 +15,11 @@ Optional ranking-based seeding available for strategic bracket placement.
 """
 
 import random
+import numpy as np
 from ..base import SortingAlgorithm
 from ..registry import algorithm_registry
-from typing import List, Dict, Any
+from ...data.dataset import Dataset, as_dataset
+from typing import List, Dict, Any, Optional
 
 @algorithm_registry.register
 class TournamentSort(SortingAlgorithm):
@@ -35,12 +37,12 @@ class TournamentSort(SortingAlgorithm):
             self.ALGORITHM_ID, 
             self.SCHEMA_KEY
         )
-        self.text_data = {}
+        self.dataset: Optional[Dataset] = None
         self.comparison_engine = None
 
     def initialize_from_data(self, data: List[Dict[str, Any]], **kwargs) -> bool:
         """Store text data for tournament"""
-        self.text_data = {item['id']: item for item in data}
+        self.dataset = as_dataset(data)
         return True
 
     def sort(self, ids: List[str], use_ranking_seed: bool = False) -> List[str]:
@@ -69,12 +71,11 @@ class TournamentSort(SortingAlgorithm):
 
     def _seed_tournament(self, ids: List[str], use_ranking_seed: bool) -> List[str]:
         """Seed tournament bracket"""
-        if use_ranking_seed and self.text_data:
-            # Seed by existing ranking (best vs worst, etc.)
-            try:
-                return sorted(ids, key=lambda x: float(self.text_data[x].get('ranking', 0)))
-            except (KeyError, ValueError):
-                pass
+        if use_ranking_seed and self.dataset:
+            # Seed by existing ranking (best vs worst, etc.); unknown or unparsable rankings fall back to random
+            rankings = self.dataset.rankings(ids)
+            if not np.isnan(rankings).any():
+                return [ids[i] for i in np.argsort(rankings, kind='stable')]
         
         # Random seeding
         seeded = ids.copy()
@@ -89,6 +90,8 @@ class TournamentSort(SortingAlgorithm):
         for i in range(0, len(competitors) - 1, 2):
             competitor1 = competitors[i]
             competitor2 = competitors[i + 1]
+            if i + 3 < len(competitors):
+                self.prepare_next_comparison(competitors[i + 2], competitors[i + 3])
             
             self.comparison_count += 1
             
@@ -11,10 +11,10 @@ Requires ~7-10 comparisons for 10 texts.
 """
 
 import random
-import statistics
 from ..base import SortingAlgorithm
 from ..registry import algorithm_registry
-from typing import List, Dict, Any
+from ...data.dataset import Dataset, as_dataset
+from typing import List, Dict, Any, Optional
 
 @algorithm_registry.register
 class TransitiveQuickRank(SortingAlgorithm):
@@ -27,18 +27,22 @@ class TransitiveQuickRank(SortingAlgorithm):
 
     def __init__(self):
         super().__init__(self.NAME, self.DESCRIPTION, self.ALGORITHM_ID, self.SCHEMA_KEY)
-        self.text_data = {}
+        self.dataset: Optional[Dataset] = None
         self.comparison_engine = None
 
     def initialize_from_data(self, data: List[Dict[str, Any]], **kwargs) -> bool:
-        self.text_data = {item['id']: item for item in data}
+        self.dataset = as_dataset(data)
         return True
 
-    def sort(self, ids: List[str], use_smart_anchors: bool = True) -> List[str]:
+    def sort(self, ids: List[str], use_smart_anchors: bool = True, deep_valence_pivots: bool = False) -> List[str]:
+        """
+        Sort with a valence-predicted pivot at the top level; with
+        deep_valence_pivots every recursive partition uses one too.
+        """
         self.reset_counters()
-        return self._hybrid_sort(ids, use_smart_pivot=use_smart_anchors)
+        return self._hybrid_sort(ids, use_smart_pivot=use_smart_anchors, deep=deep_valence_pivots)
 
-    def _hybrid_sort(self, ids: List[str], use_smart_pivot: bool) -> List[str]:
+    def _hybrid_sort(self, ids: List[str], use_smart_pivot: bool, deep: bool = False) -> List[str]:
         if len(ids) <= 1:
             return ids
 
@@ -47,37 +51,34 @@ class TransitiveQuickRank(SortingAlgorithm):
             # FIX #2: Use the valence prediction directly, with 0 comparisons.
             pivot = self._predict_middle(ids)
         else:
-            # On smaller recursive calls, a random pivot is fine.
+            # On smaller recursive calls, a random pivot is fine (unless deep pivoting).
             pivot = random.choice(ids)
         
         # --- EFFICIENT PARTITION LOGIC ---
         # FIX #1: Use a single loop to partition with n-1 comparisons.
         left = []
         right = []
-        for item in ids:
-            if item == pivot:
-                continue
+        others = [item for item in ids if item != pivot]
+        for position, item in enumerate(others):
+            if position + 1 < len(others):
+                self.prepare_next_comparison(others[position + 1], pivot)
             if self.ask_if_more_negative(item, pivot):
                 left.append(item)
             else:
                 right.append(item)
         
         # Recursively sort the left and right sides
-        sorted_left = self._hybrid_sort(left, use_smart_pivot=False)
-        sorted_right = self._hybrid_sort(right, use_smart_pivot=False)
+        sorted_left = self._hybrid_sort(left, use_smart_pivot=use_smart_pivot and deep, deep=deep)
+        sorted_right = self._hybrid_sort(right, use_smart_pivot=use_smart_pivot and deep, deep=deep)
         
         return sorted_left + [pivot] + sorted_right
 
     # --- This method is now only used for the smart pivot ---
     def _predict_middle(self, ids: List[str]) -> str:
         if not ids: return ""
-        try:
-            vals = [float(self.text_data[x].get('valence', 0)) for x in ids]
-            median_val = statistics.median(vals)
-            # Find the ID whose valence is closest to the calculated median
-            return min(ids, key=lambda x: abs(float(self.text_data[x].get('valence', 0)) - median_val))
-        except: 
-            return random.choice(ids)
+        # Median-valence ID by selection over the dataset's precomputed valence ranks
+        pivot = self.dataset.median_valence_id(ids) if self.dataset is not None else None
+        return pivot if pivot is not None else random.choice(ids)
 
     # --- This method now correctly increments the counter ---
     def ask_if_more_negative(self, text_id: str, other_id: str) -> bool:
@@ -56,6 +56,11 @@ REQUIRED_COLUMNS = _config["required_columns"]
 _text_formatting = _config.get("text_formatting")
 TEXT_FORMATTING_RULE: Optional[Dict[str, Any]] = _text_formatting if _text_formatting else None
 
+# ── INPUT MODE (optional) ─────────────────────
+# "line" (default): type the answer and press Enter
+# "keystroke": A/B/U/Q are accepted as soon as the key is pressed (POSIX terminals)
+INPUT_MODE: str = _config.get("input_mode", "line")
+
 # Helper functions
 def get_user_id(display_name: str) -> str:
     return USER_MAPPING.get(display_name, display_name.replace(" ", ""))
@@ -70,14 +75,20 @@ def set_algorithm(algorithm_name: str) -> bool:
     Returns True if successful, False if algorithm not available.
     """
     global CONFIGURED_ALGORITHM
-    if algorithm_name in AVAILABLE_ALGORITHMS:
+    if algorithm_name in get_available_algorithms():
         CONFIGURED_ALGORITHM = algorithm_name
         return True
     return False
 
 def get_available_algorithms() -> list:
-    """Get list of available algorithms."""
-    return AVAILABLE_ALGORITHMS.copy()
+    """
+    IDs of every algorithm the registry declares (built-ins and installed
+    plugins), in config.json's available_algorithms order, then the rest.
+    """
+    from ..algorithms.registry import algorithm_registry
+    declared = list(algorithm_registry.list_algorithms())
+    return [algo for algo in AVAILABLE_ALGORITHMS if algo in declared] + \
+           [algo for algo in declared if algo not in AVAILABLE_ALGORITHMS]
 
 def get_configured_algorithm() -> str:
     """Get the current configured algorithm - always returns latest value"""
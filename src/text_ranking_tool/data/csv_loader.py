@@ -1,36 +1,96 @@
 # src/text_ranking_tool/data/csv_loader.py
 
 import csv
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import Iterator, List, Dict, Any, Optional, Sequence, Tuple
 from ..config.constants import REQUIRED_COLUMNS
+from .dataset_cache import get_dataset_cache
 
-def load_ranking_data(file_path: str) -> Optional[List[Dict[str, Any]]]:
+# Fields of a loaded text item, in file order
+RANKING_COLUMNS = ('id', 'valence', 'ranking', 'text')
+
+def short_row_message(file_path, line_num: int, found: int, needed: int) -> str:
+    """Error text for a ragged CSV row"""
+    return f"{Path(file_path).name} line {line_num}: row has {found} fields, expected at least {needed}"
+
+def iter_csv_columns(file_path: str, columns: Sequence[str]) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield the requested columns of every CSV row as a tuple (values unstripped).
+    Unrequested fields are dropped as each row is read and never retained.
+    Raises KeyError if a requested column is missing from the header and
+    ValueError for a row too short to hold every requested column.
+    """
+    with open(file_path, 'r', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None) or []
+
+        # Last occurrence wins for duplicated headers, as with csv.DictReader
+        column_index = {name: i for i, name in enumerate(header)}
+        missing = [col for col in columns if col not in column_index]
+        if missing:
+            raise KeyError(f"CSV file missing columns: {missing}")
+        indices = [column_index[col] for col in columns]
+        min_length = max(indices, default=-1) + 1
+
+        for row in reader:
+            if row:  # csv.DictReader skips blank lines too
+                if len(row) < min_length:
+                    raise ValueError(short_row_message(file_path, reader.line_num, len(row), min_length))
+                yield tuple(row[i] for i in indices)
+
+def _parse_ranking_columns(file_path: Path, columns: Sequence[str]) -> Optional[Dict[str, List[str]]]:
+    """Parse the requested columns (stripped) in one pass; None if required columns are missing"""
+    with open(file_path, 'r', encoding='utf-8') as csvfile:
+        fieldnames = next(csv.reader(csvfile), None)
+
+    # Validate required columns exist
+    if not fieldnames or not all(col in fieldnames for col in REQUIRED_COLUMNS):
+        print(f"Error: CSV file missing required columns: {REQUIRED_COLUMNS}")
+        return None
+
+    parsed: Dict[str, List[str]] = {col: [] for col in columns}
+    appenders = [parsed[col].append for col in columns]
+    for values in iter_csv_columns(file_path, columns):
+        for append, value in zip(appenders, values):
+            append(value.strip())
+    return parsed
+
+def load_ranking_data(file_path: str, columns: Optional[Sequence[str]] = None,
+                      use_cache: bool = True) -> Optional[List[Dict[str, Any]]]:
     """
     Load ranking data from CSV file.
     Expects file to have columns: id, valence, ranking, text
+    `columns` projects each item onto a subset of those fields ('id' is always
+    kept); e.g. exports that never write text skip retaining the text column.
+    Parsed columns are cached by (path, size, mtime) unless use_cache is False;
+    text is never cached, it is read from the file through the text store's row index.
     """
+    if columns is None:
+        columns = RANKING_COLUMNS
+    columns = ('id',) + tuple(col for col in columns if col != 'id')
+
+    if 'text' in columns:
+        # Imported here: the text store builds on this module
+        from .text_store import load_text_store
+        store = load_text_store(file_path, use_cache=use_cache)
+        if store is None:
+            return None
+        with store:
+            return [{col: record[col] for col in columns} for record in store]
+
     try:
-        text_data = [] 
-        with open(file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            # Validate required columns exist
-            if not reader.fieldnames or not all(col in reader.fieldnames for col in REQUIRED_COLUMNS):
-                print(f"Error: CSV file missing required columns: {REQUIRED_COLUMNS}")
-                return None
-            
-            # Load data rows
-            for row in reader:
-                text_item = {
-                    'id': row['id'].strip(),
-                    'valence': row['valence'].strip(),
-                    'ranking': row['ranking'].strip(), 
-                    'text': row['text'].strip()
-                }
-                text_data.append(text_item)
-        
+        if use_cache:
+            parsed = get_dataset_cache().load_columns(Path(file_path), columns, _parse_ranking_columns)
+        else:
+            parsed = _parse_ranking_columns(Path(file_path), columns)
+        if parsed is None:
+            return None
+
+        # Fresh dicts per call - cached column lists are shared and never handed out
+        text_data = [dict(zip(columns, values)) for values in zip(*(parsed[col] for col in columns))]
+
         return text_data if text_data else None
-        
+
     except FileNotFoundError:
         print(f"Error: File not found: {file_path}")
         return None
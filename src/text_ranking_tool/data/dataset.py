@@ -0,0 +1,163 @@
+# src/text_ranking_tool/data/dataset.py
+"""
+Shared, immutable dataset built once per load
+Holds the row IDs, an ID -> row map and typed NumPy valence/ranking columns,
+so pivots, seeding and stats work on floats parsed once instead of
+re-converting strings, plus a valence-order rank index for median pivot
+selection over integers. Item mappings (with text) come from the underlying
+TextStore, or from plain item dicts when built from load_ranking_data output.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+from .text_store import TextStore, load_text_store
+
+
+def _numeric_column(values: Sequence) -> np.ndarray:
+    """float64 column, read-only; empty or unparsable values become NaN"""
+    try:
+        column = np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        column = np.empty(len(values), dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                column[i] = float(value)
+            except (TypeError, ValueError):
+                column[i] = np.nan
+    column.setflags(write=False)
+    return column
+
+
+class Dataset(Sequence):
+    """
+    One loaded dataset shared by the engine, algorithms, exporter and stats.
+    Iterating/indexing yields item mappings (id, valence, ranking, text) as the
+    raw strings from the file; `valence`/`ranking` are the typed columns.
+    """
+
+    __slots__ = ('ids', 'id_index', 'valence', 'ranking', '_items', '_lookup', '_valence_rank', '_valid_valences')
+
+    def __init__(self, items: Sequence[Mapping[str, Any]], ids: List[str],
+                 valence: Sequence, ranking: Sequence, lookup: Optional[Mapping] = None):
+        self._items = items
+        self.ids = ids
+        self.valence = _numeric_column(valence)
+        self.ranking = _numeric_column(ranking)
+        # Last duplicate wins, as with {item['id']: item} lookups
+        self.id_index: Dict[str, int] = {text_id: i for i, text_id in enumerate(ids)}
+        self._lookup = lookup
+        self._valence_rank: Optional[np.ndarray] = None
+        self._valid_valences = 0
+
+    @classmethod
+    def from_store(cls, store: TextStore) -> 'Dataset':
+        return cls(store, store.ids, store.valence, store.ranking, store.lookup)
+
+    @classmethod
+    def from_items(cls, items: Sequence[Mapping[str, Any]]) -> 'Dataset':
+        """Dataset over in-memory item dicts (e.g. load_ranking_data output)"""
+        items = list(items)
+        return cls(
+            items,
+            [item['id'] for item in items],
+            [item.get('valence', '') for item in items],
+            [item.get('ranking', '') for item in items]
+        )
+
+    @property
+    def lookup(self) -> Mapping[str, Mapping[str, Any]]:
+        """{text_id: item mapping}, built once"""
+        if self._lookup is None:
+            self._lookup = {item['id']: item for item in self._items}
+        return self._lookup
+
+    def positions(self, text_ids: Iterable[str]) -> np.ndarray:
+        """Row index of each ID, -1 for IDs not in the dataset"""
+        get = self.id_index.get
+        return np.fromiter((get(text_id, -1) for text_id in text_ids), dtype=np.intp)
+
+    def valences(self, text_ids: Iterable[str]) -> np.ndarray:
+        """Valence of each ID, NaN for unknown IDs or unparsable values"""
+        return self._take(self.valence, self.positions(text_ids))
+
+    def rankings(self, text_ids: Iterable[str]) -> np.ndarray:
+        """Original ranking of each ID, NaN for unknown IDs or unparsable values"""
+        return self._take(self.ranking, self.positions(text_ids))
+
+    @property
+    def valence_rank(self) -> np.ndarray:
+        """Position of each row in ascending valence order (stable; NaN valences rank last)"""
+        if self._valence_rank is None:
+            order = np.argsort(self.valence, kind='stable')
+            rank = np.empty(len(order), dtype=np.intp)
+            rank[order] = np.arange(len(order))
+            rank.setflags(write=False)
+            self._valence_rank = rank
+            self._valid_valences = int(np.count_nonzero(~np.isnan(self.valence)))
+        return self._valence_rank
+
+    def median_valence_id(self, text_ids: Sequence[str]) -> Optional[str]:
+        """
+        ID with the (lower) median valence among text_ids, selected over the
+        precomputed valence ranks in linear time. Unknown IDs and unparsable
+        valences are ignored; None if no ID has a valence.
+        """
+        rank = self.valence_rank
+        rows = self.positions(text_ids)
+        ranks = np.where(rows >= 0, rank[np.maximum(rows, 0)] if len(rank) else 0, len(rank))
+        candidates = np.flatnonzero(ranks < self._valid_valences)
+        if not len(candidates):
+            return None
+        kth = (len(candidates) - 1) // 2
+        chosen = np.argpartition(ranks[candidates], kth)[kth]
+        return text_ids[int(candidates[chosen])]
+
+    def ids_by_ranking(self) -> List[str]:
+        """IDs ordered by the original ranking column (stable; unparsable rankings last)"""
+        return [self.ids[i] for i in np.argsort(self.ranking, kind='stable')]
+
+    def text(self, text_id: str) -> str:
+        return self.lookup[text_id]['text']
+
+    @staticmethod
+    def _take(column: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        values = column[np.maximum(rows, 0)] if len(column) else np.full(len(rows), np.nan)
+        return np.where(rows >= 0, values, np.nan)
+
+    def close(self):
+        """Release the text store's mapped file, if any (reopened if text is read again)"""
+        close = getattr(self._items, 'close', None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+def as_dataset(data) -> Dataset:
+    """The Dataset itself, or one built from a TextStore or a list of item dicts"""
+    if isinstance(data, Dataset):
+        return data
+    if isinstance(data, TextStore):
+        return Dataset.from_store(data)
+    return Dataset.from_items(data)
+
+
+def load_dataset(file_path: str, ids: Optional[Iterable[str]] = None,
+                 use_cache: bool = True) -> Optional[Dataset]:
+    """Load a dataset CSV (text left on disk) as a Dataset; None if it cannot be loaded"""
+    store = load_text_store(file_path, ids=ids, use_cache=use_cache)
+    return Dataset.from_store(store) if store is not None else None
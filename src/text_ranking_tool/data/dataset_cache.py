@@ -0,0 +1,131 @@
+# src/text_ranking_tool/data/dataset_cache.py
+"""
+Parsed dataset cache keyed on (path, size, mtime)
+Each parsed column is pickled separately next to INTERNAL_DATA_DIR, so a
+projected load only reads the columns it needs; a bounded in-memory LRU of
+datasets sits in front of the disk for repeat loads within one process.
+Only index columns (id, valence, ranking, row offsets) are cached - text is
+always read from the CSV on demand.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from ..config.constants import INTERNAL_DATA_DIR, REQUIRED_COLUMNS
+
+# Bump whenever the parsed representation changes to invalidate old entries
+DATASET_CACHE_VERSION = 1
+
+CACHE_DIR_NAME = ".dataset_cache"
+
+Columns = Dict[str, List[str]]
+ColumnParser = Callable[[Path, Sequence[str]], Optional[Columns]]
+
+
+class DatasetCache:
+    """Disk-backed column cache for parsed dataset CSVs with an in-memory LRU"""
+
+    def __init__(self, cache_dir: Path, max_files: int = 256, memory_datasets: int = 8):
+        self.cache_dir = cache_dir
+        self.max_files = max_files
+        self.memory_datasets = memory_datasets
+        self._memory: "OrderedDict[str, Columns]" = OrderedDict()
+
+    def _digest(self, path: Path) -> Tuple[str, Path]:
+        """Key for the file's current state (changes whenever it is rewritten)"""
+        resolved = path.resolve()
+        stat = resolved.stat()
+        key = (DATASET_CACHE_VERSION, tuple(REQUIRED_COLUMNS), str(resolved), stat.st_size, stat.st_mtime_ns)
+        return hashlib.sha1(repr(key).encode('utf-8')).hexdigest(), resolved
+
+    def load_columns(self, path: Path, columns: Sequence[str], parse: ColumnParser) -> Optional[Columns]:
+        """
+        Return {column: values} for the requested columns. Columns missing from
+        memory and disk are parsed in one pass with parse(path, missing) and stored.
+        parse returns None for an invalid file, which is never cached.
+        """
+        digest, resolved = self._digest(path)
+        dataset = self._memory.get(digest)
+        if dataset is None:
+            dataset = {}
+        else:
+            self._memory.move_to_end(digest)
+
+        missing = [col for col in columns if col not in dataset]
+        still_missing = []
+        for col in missing:
+            values = self._read_column(digest, col)
+            if values is None:
+                still_missing.append(col)
+            else:
+                dataset[col] = values
+
+        if still_missing:
+            parsed = parse(resolved, still_missing)
+            if parsed is None:
+                return None
+            for col, values in parsed.items():
+                dataset[col] = values
+                self._write_column(digest, col, values)
+            self._evict()
+
+        self._remember(digest, dataset)
+        return {col: dataset[col] for col in columns}
+
+    def clear(self):
+        """Drop every cached dataset"""
+        self._memory.clear()
+        for entry_path in self.cache_dir.glob("*.pkl"):
+            entry_path.unlink(missing_ok=True)
+
+    def _remember(self, digest: str, dataset: Columns):
+        self._memory[digest] = dataset
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.memory_datasets:
+            self._memory.popitem(last=False)
+
+    def _column_path(self, digest: str, column: str) -> Path:
+        return self.cache_dir / f"{digest}_{column}.pkl"
+
+    def _read_column(self, digest: str, column: str) -> Optional[List[str]]:
+        entry_path = self._column_path(digest, column)
+        try:
+            with open(entry_path, 'rb') as f:
+                values = pickle.load(f)
+            os.utime(entry_path)  # mark as recently used
+            return values
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+            return None
+
+    def _write_column(self, digest: str, column: str, values: List[str]):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry_path = self._column_path(digest, column)
+            tmp_path = entry_path.with_suffix(".tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(values, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            print(f"Warning: Could not write dataset cache: {e}")
+
+    def _evict(self):
+        entries = list(self.cache_dir.glob("*.pkl"))
+        if len(entries) <= self.max_files:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime_ns)
+        for entry_path in entries[:len(entries) - self.max_files]:
+            entry_path.unlink(missing_ok=True)
+
+
+# Global instance
+_dataset_cache_instance: Optional[DatasetCache] = None
+
+def get_dataset_cache() -> DatasetCache:
+    """Get global dataset cache instance (stored beside INTERNAL_DATA_DIR)"""
+    global _dataset_cache_instance
+    if _dataset_cache_instance is None:
+        _dataset_cache_instance = DatasetCache(INTERNAL_DATA_DIR.parent / CACHE_DIR_NAME)
+    return _dataset_cache_instance
@@ -1,22 +1,206 @@
 # src/text_ranking_tool/data/initialization.py
 # type: ignore
+import hashlib
+import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from ..config.constants import (
-    EXTERNAL_DATA_DIR, 
-    INTERNAL_DATA_DIR,  
-    INTERNAL_EXPORT_DIR, 
+    EXTERNAL_DATA_DIR,
+    INTERNAL_DATA_DIR,
+    INTERNAL_EXPORT_DIR,
     INTERNAL_USERS_DIR
 )
 
-def initialize_data_directories():
-    """Create internal directories and mirror external data"""
-    
+# Source file state at the time of the last copy, kept beside the mirrored CSVs
+SYNC_MANIFEST_NAME = ".sync_manifest.json"
+SYNC_MANIFEST_VERSION = 1
+
+# Parallel copy threads for changed files (copies are I/O bound)
+MIRROR_WORKERS = 4
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+class MirrorReport(NamedTuple):
+    """What one incremental mirror pass did, by source file name"""
+    added: List[str]
+    updated: List[str]
+    unchanged: List[str]
+    failed: List[Tuple[str, str]]  # (file name, error)
+    removed: List[str]  # gone from the external directory since the last pass (mirror kept)
+    duplicates: List[Tuple[str, str]]  # (file name, file already mirrored to the same name) - not copied
+
+    @property
+    def copied(self) -> List[str]:
+        return self.added + self.updated
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.failed or self.removed or self.duplicates)
+
+    def summary(self) -> str:
+        """One-line count of what the pass did"""
+        text = f"{len(self.copied)} copied, {len(self.unchanged)} unchanged, {len(self.removed)} removed"
+        if self.failed:
+            text += f", {len(self.failed)} failed"
+        if self.duplicates:
+            text += f", {len(self.duplicates)} skipped (duplicate name)"
+        return text
+
+
+def _file_hash(path: Path) -> str:
+    """SHA-1 of the file contents"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_sync_manifest(manifest_path: Path) -> Dict[str, Dict]:
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == SYNC_MANIFEST_VERSION:
+            return data.get('files', {})
+    except (OSError, json.JSONDecodeError):
+        pass
+    return {}
+
+
+def _save_sync_manifest(manifest_path: Path, files: Dict[str, Dict]):
+    try:
+        tmp_path = manifest_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': SYNC_MANIFEST_VERSION, 'files': files}, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        print(f"Warning: Could not write sync manifest: {e}")
+
+
+def _copy_file(source: Path, destination: Path) -> Optional[str]:
+    """Copy with metadata via a temp file so readers never see a partial CSV; returns an error or None"""
+    tmp_path = destination.with_name(destination.name + ".part")
+    try:
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, destination)
+        return None
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        return str(e)
+
+
+def _is_csv(name: str) -> bool:
+    """CSV by extension in any case (DATA.CSV on a shared drive counts)"""
+    return Path(name).suffix.lower() == ".csv"
+
+
+def _mirror_name(name: str) -> str:
+    """Mirrored file name; the extension is normalised to .csv, which the app looks up by stem"""
+    return Path(name).stem + ".csv"
+
+
+def mirror_external_data(verify_hash: bool = False, max_workers: int = MIRROR_WORKERS) -> MirrorReport:
+    """
+    Incrementally mirror CSV files from EXTERNAL_DATA_DIR into INTERNAL_DATA_DIR.
+    A file is copied only if it is new, its size/mtime differ from the sync
+    manifest, or its mirror is missing. With verify_hash the decision uses the
+    content hash instead, so touched-but-identical files are not re-copied and
+    edits that keep size and mtime are still caught. Changed files are copied in
+    max_workers parallel threads (1 copies sequentially). Sources that have
+    disappeared are reported as removed; their mirrored copies are left in place.
+    Sources whose mirror names differ only in case (DATA.CSV, data.csv, data.Csv)
+    would race for one file: the first by name is mirrored, the rest are reported
+    as duplicates and skipped.
+    """
+    manifest_path = INTERNAL_DATA_DIR / SYNC_MANIFEST_NAME
+    previous = _load_sync_manifest(manifest_path)
+    current: Dict[str, Dict] = {}
+    added, updated, unchanged = [], [], []
+    duplicates: List[Tuple[str, str]] = []
+    claimed: Dict[str, str] = {}  # case-folded mirror name -> source mirrored to it
+    to_copy: List[Tuple[Path, Path]] = []
+
+    with os.scandir(EXTERNAL_DATA_DIR) as entries:
+        sources = sorted((entry for entry in entries if _is_csv(entry.name) and entry.is_file()),
+                         key=lambda entry: entry.name)
+
+    for entry in sources:
+        owner = claimed.setdefault(_mirror_name(entry.name).lower(), entry.name)
+        if owner != entry.name:
+            duplicates.append((entry.name, owner))
+            continue
+
+        stat = entry.stat()
+        state = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        known = previous.get(entry.name)
+        destination = INTERNAL_DATA_DIR / _mirror_name(entry.name)
+
+        same_metadata = known is not None and known.get('size') == state['size'] \
+            and known.get('mtime_ns') == state['mtime_ns']
+        if verify_hash:
+            state['sha1'] = _file_hash(Path(entry.path))
+            # Entries recorded without a hash fall back to the metadata comparison
+            in_sync = known.get('sha1') == state['sha1'] if known and known.get('sha1') else same_metadata
+        else:
+            in_sync = same_metadata
+            if same_metadata and known.get('sha1'):
+                state['sha1'] = known['sha1']
+
+        current[entry.name] = state
+        if in_sync and destination.exists():
+            unchanged.append(entry.name)
+            continue
+
+        (updated if known is not None and destination.exists() else added).append(entry.name)
+        to_copy.append((Path(entry.path), destination))
+
+    if max_workers > 1 and len(to_copy) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            errors = list(executor.map(lambda pair: _copy_file(*pair), to_copy))
+    else:
+        errors = [_copy_file(source, destination) for source, destination in to_copy]
+
+    failed = []
+    for (source, _), error in zip(to_copy, errors):
+        if error is not None:
+            failed.append((source.name, error))
+            # Forget the failed file so the next pass retries it
+            current.pop(source.name, None)
+    failed_names = {name for name, _ in failed}
+    added = [name for name in added if name not in failed_names]
+    updated = [name for name in updated if name not in failed_names]
+
+    source_names = {entry.name for entry in sources}
+    removed = sorted(name for name in previous if name not in source_names)
+
+    if current != previous:
+        _save_sync_manifest(manifest_path, current)
+
+    return MirrorReport(added, updated, unchanged, failed, removed, duplicates)
+
+
+def initialize_data_directories(verify_hash: bool = False, max_workers: int = MIRROR_WORKERS) -> MirrorReport:
+    """Create internal directories and incrementally mirror external data"""
+
     # Create internal directories
     INTERNAL_DATA_DIR.mkdir(parents=True, exist_ok=True)
     INTERNAL_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
     INTERNAL_USERS_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # Mirror CSV files from external to internal
+
+    # Mirror CSV files from external to internal (changed files only)
     if EXTERNAL_DATA_DIR.exists():
-        for csv_file in EXTERNAL_DATA_DIR.glob("*.csv"):
-            shutil.copy2(csv_file, INTERNAL_DATA_DIR / csv_file.name)
+        report = mirror_external_data(verify_hash=verify_hash, max_workers=max_workers)
+        for name, error in report.failed:
+            print(f"Warning: Could not mirror {name}: {error}")
+        for name, owner in report.duplicates:
+            print(f"Warning: Skipped {name}: same dataset name as {owner}")
+        # Quiet when nothing moved (main() re-runs this on every return to the start)
+        if report.copied or report.removed:
+            print(f"Data sync: {report.summary()}")
+        return report
+
+    return MirrorReport([], [], [], [], [], [])
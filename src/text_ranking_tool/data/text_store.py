@@ -0,0 +1,268 @@
+# src/text_ranking_tool/data/text_store.py
+"""
+Offset-indexed, lazily loaded dataset storage
+Only IDs, valence and ranking are held in memory; each row's text is read on
+demand from the memory-mapped CSV through a byte-offset index built in one
+pass and kept in the dataset cache, so huge corpora never load all text.
+"""
+
+import csv
+import io
+import mmap
+from array import array
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from ..config.constants import REQUIRED_COLUMNS
+from .csv_loader import RANKING_COLUMNS, short_row_message
+from .dataset_cache import get_dataset_cache
+
+# Pseudo-columns holding each row's [start, end) byte span in the CSV
+ROW_START_COLUMN = '@start'
+ROW_END_COLUMN = '@end'
+
+INDEX_COLUMNS = ('id', 'valence', 'ranking', ROW_START_COLUMN, ROW_END_COLUMN)
+
+
+def _index_rows(file_path: Path, columns: Iterable[str]) -> Optional[Dict[str, Any]]:
+    """
+    Parse the requested columns (stripped) plus row byte spans in one pass;
+    None if required columns are missing. Spans are array('q') of file offsets.
+    """
+    columns = list(columns)
+    with open(file_path, 'rb') as f:
+        position = 0
+
+        def lines() -> Iterator[str]:
+            # csv.reader pulls one line at a time, so position marks the end of the last row read
+            nonlocal position
+            for raw in f:
+                position += len(raw)
+                yield raw.decode('utf-8')
+
+        reader = csv.reader(lines())
+        header = next(reader, None)
+        if not header or not all(col in header for col in REQUIRED_COLUMNS):
+            print(f"Error: CSV file missing required columns: {REQUIRED_COLUMNS}")
+            return None
+
+        column_index = {name: i for i, name in enumerate(header)}
+        value_columns = [col for col in columns if col not in (ROW_START_COLUMN, ROW_END_COLUMN)]
+        missing = [col for col in value_columns if col not in column_index]
+        if missing:
+            raise KeyError(f"CSV file missing columns: {missing}")
+
+        parsed: Dict[str, Any] = {col: [] for col in value_columns}
+        starts, ends = array('q'), array('q')
+        appenders = [(column_index[col], parsed[col].append) for col in value_columns]
+        # The text column is read later from the row's byte span, so it must be present too
+        min_length = max(column_index[col] for col in REQUIRED_COLUMNS) + 1
+
+        start = position
+        for row in reader:
+            if row:  # blank lines are skipped, as in load_ranking_data
+                if len(row) < min_length:
+                    raise ValueError(short_row_message(file_path, reader.line_num, len(row), min_length))
+                for i, append in appenders:
+                    append(row[i].strip())
+                starts.append(start)
+                ends.append(position)
+            start = position
+
+    if ROW_START_COLUMN in columns:
+        parsed[ROW_START_COLUMN] = starts
+    if ROW_END_COLUMN in columns:
+        parsed[ROW_END_COLUMN] = ends
+    return parsed
+
+
+class _MappedCsv:
+    """Read-only memory map of a dataset CSV, opened on first text access"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._text_column: Optional[int] = None
+
+    def _open(self):
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f))
+        self._text_column = {name: i for i, name in enumerate(header)}['text']
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def text(self, start: int, end: int) -> str:
+        if self._map is None:
+            self._open()
+        raw = self._map[start:end].decode('utf-8')
+        row = next(csv.reader(io.StringIO(raw, newline='')))
+        return row[self._text_column].strip()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+
+class TextRecord(Mapping):
+    """One dataset row as a read-only mapping; 'text' is read from disk only when accessed"""
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store: 'TextStore', index: int):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> str:
+        if key == 'id':
+            return self._store.ids[self._index]
+        if key == 'valence':
+            return self._store.valence[self._index]
+        if key == 'ranking':
+            return self._store.ranking[self._index]
+        if key == 'text':
+            return self._store.text_at(self._index)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(RANKING_COLUMNS)
+
+    def __len__(self) -> int:
+        return len(RANKING_COLUMNS)
+
+    def __repr__(self) -> str:
+        return f"TextRecord(id={self['id']!r})"
+
+
+class TextLookup(Mapping):
+    """Read-only {text_id: TextRecord} view over a TextStore"""
+
+    def __init__(self, store: 'TextStore'):
+        self._store = store
+
+    def __getitem__(self, text_id: str) -> TextRecord:
+        return TextRecord(self._store, self._store.index_of(text_id))
+
+    def __contains__(self, text_id: object) -> bool:
+        return text_id in self._store.id_index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.id_index)
+
+    def __len__(self) -> int:
+        return len(self._store.id_index)
+
+
+class TextStore(Sequence):
+    """
+    Dataset rows in load order, usable wherever a list of item dicts is expected.
+    IDs, valence and ranking live in compact column lists; text is fetched per
+    row from the memory-mapped CSV. Stores share one map with their subsets.
+    """
+
+    def __init__(self, source: _MappedCsv, ids: List[str], valence: List[str],
+                 ranking: List[str], starts: array, ends: array):
+        self._source = source
+        self.ids = ids
+        self.valence = valence
+        self.ranking = ranking
+        self._starts = starts
+        self._ends = ends
+        self._id_index: Optional[Dict[str, int]] = None
+        self.lookup = TextLookup(self)
+
+    @property
+    def path(self) -> Path:
+        return self._source.path
+
+    @property
+    def id_index(self) -> Dict[str, int]:
+        """Row position of each ID (built on first use; the last duplicate wins, as with dict lookups)"""
+        if self._id_index is None:
+            self._id_index = {text_id: i for i, text_id in enumerate(self.ids)}
+        return self._id_index
+
+    def index_of(self, text_id: str) -> int:
+        return self.id_index[text_id]
+
+    def text_at(self, index: int) -> str:
+        return self._source.text(self._starts[index], self._ends[index])
+
+    def text(self, text_id: str) -> str:
+        return self.text_at(self.index_of(text_id))
+
+    def subset(self, text_ids: Iterable[str]) -> 'TextStore':
+        """Store restricted to the given IDs (in that order), sharing this store's mapped file"""
+        rows = [self.index_of(text_id) for text_id in text_ids]
+        return TextStore(
+            self._source,
+            [self.ids[i] for i in rows],
+            [self.valence[i] for i in rows],
+            [self.ranking[i] for i in rows],
+            array('q', (self._starts[i] for i in rows)),
+            array('q', (self._ends[i] for i in rows))
+        )
+
+    def close(self):
+        """Release the memory map (reopened automatically if text is read again)"""
+        self._source.close()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.ids)))]
+        if index < 0:
+            index += len(self.ids)
+        if not 0 <= index < len(self.ids):
+            raise IndexError("TextStore index out of range")
+        return TextRecord(self, index)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def as_text_lookup(text_data) -> Mapping:
+    """{text_id: item} for a TextStore or Dataset (no copy) or a list of item dicts"""
+    lookup = getattr(text_data, 'lookup', None)
+    if lookup is not None:
+        return lookup
+    return {item['id']: item for item in text_data}
+
+
+def load_text_store(file_path: str, ids: Optional[Iterable[str]] = None,
+                    use_cache: bool = True) -> Optional[TextStore]:
+    """
+    Open a dataset CSV as a TextStore, optionally restricted to `ids`.
+    The row index is cached by (path, size, mtime) unless use_cache is False.
+    Returns None if the file is missing, invalid or empty.
+    """
+    path = Path(file_path)
+    try:
+        if use_cache:
+            parsed = get_dataset_cache().load_columns(path, INDEX_COLUMNS, _index_rows)
+        else:
+            parsed = _index_rows(path, INDEX_COLUMNS)
+        if not parsed or not parsed['id']:
+            return None
+
+        store = TextStore(
+            _MappedCsv(path.resolve()),
+            parsed['id'], parsed['valence'], parsed['ranking'],
+            parsed[ROW_START_COLUMN], parsed[ROW_END_COLUMN]
+        )
+        return store.subset(ids) if ids is not None else store
+
+    except FileNotFoundError:
+        print(f"Error: File not found: {file_path}")
+        return None
+    except Exception as e:
+        print(f"Error loading CSV file: {e}")
+        return None
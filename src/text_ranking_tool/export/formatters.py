@@ -1,70 +1,71 @@
 #src\text_ranking_tool\export\formatters.py
 
 import csv
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Iterator, Tuple, Optional
-from ..config.constants import (EXTERNAL_EXPORT_DIR, INTERNAL_EXPORT_DIR, CONFIGURED_ALGORITHM, get_user_id)
+from typing import Callable, Dict, List, Any, Iterable, Iterator, Mapping, Tuple, Optional
+from ..config.constants import (EXTERNAL_EXPORT_DIR, INTERNAL_EXPORT_DIR, get_configured_algorithm, get_user_id)
 from ..ranking.session_manager import get_session_manager
 from ..data.file_scanner import scan_data_directory
-from ..data.csv_loader import load_ranking_data
+from ..data.csv_loader import iter_csv_columns
+from ..data.text_store import as_text_lookup, load_text_store
+from .manifest import get_export_manifest
+from .record_writers import export_path, open_record_writer
 
 class RankingExporter:
     """Handles exporting user ranking data in several formats - adapted for comparison engine sessions"""
     
     def __init__(self):
         self.session_manager = get_session_manager()
-        self.algorithm = CONFIGURED_ALGORITHM
         
         # Ensure export directories exist
         EXTERNAL_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
         INTERNAL_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def algorithm(self) -> str:
+        """Algorithm selected now (the admin switcher can change it at runtime)"""
+        return get_configured_algorithm()
+    
     def _get_timestamp(self) -> str:
         """Return the export timestamp string"""
         return datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    def _get_available_files_data(self) -> Dict[str, Optional[Dict[str, Any]]]:
-        """Get all available CSV files and their text data"""
+    def _iter_available_files_data(self) -> Iterator[Tuple[str, Optional[Mapping[str, Any]]]]:
+        """
+        Yield (file_stem, text lookup by ID) one dataset at a time; text is read only
+        if a record needs it. Each dataset's file is closed before the next one is
+        yielded, so open maps never pile up (and never lock files on Windows).
+        """
         available_files = scan_data_directory()
-        files_data = {}
         
         for file_info in available_files:
             file_stem = file_info["stem"]
             try:
-                # Load text data for this file
-                text_data = load_ranking_data(str(file_info["path"]))
-                if text_data:
-                    # Convert to lookup dict by ID
-                    files_data[file_stem] = {item['id']: item for item in text_data}
-                else:
-                    files_data[file_stem] = None
+                # Index this file (text stays on disk until a record asks for it)
+                text_store = load_text_store(str(file_info["path"]))
             except Exception:
-                files_data[file_stem] = None
-        
-        return files_data
+                text_store = None
+            if text_store is None:
+                yield file_stem, None
+                continue
+            with text_store:
+                yield file_stem, text_store.lookup
     
     def _get_user_ranking_from_session(self, username: str, file_stem: str) -> Optional[List[str]]:
         """Get user's final ranking from their internal export CSV"""
         try:
             user_id = get_user_id(username)
             
-            # Look for the most recent internal export CSV for this user/file
-            pattern = f"{user_id}_{file_stem}_{self.algorithm}_*.csv"
-            matching_files = list(INTERNAL_EXPORT_DIR.glob(pattern))
+            # Most recent internal export CSV for this user/file from the manifest
+            latest_file = get_export_manifest(INTERNAL_EXPORT_DIR).latest(user_id, file_stem, self.algorithm)
             
-            if not matching_files:
+            if not latest_file:
                 return None
             
-            # Get the most recent file (by filename which includes timestamp)
-            latest_file = max(matching_files, key=lambda f: f.name)
-            
-            # Read the CSV and extract the ranking order
-            ranking = []
-            with open(latest_file, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    ranking.append(row['id'])
+            # Read only the id column - row order is the ranking order
+            ranking = [text_id for text_id, in iter_csv_columns(latest_file, ('id',))]
             
             return ranking if ranking else None
             
@@ -73,13 +74,13 @@ class RankingExporter:
     
     def _yield_ranking_records(
         self, 
-        files_data: Dict[str, Optional[Dict[str, Any]]], 
+        files_data: Iterable[Tuple[str, Optional[Mapping[str, Any]]]], 
         usernames: List[str],
         with_text: bool = False
     ) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """Yield (file_stem, record_dict) for all file/user combinations with ranking data"""
         
-        for file_stem, text_data in files_data.items():
+        for file_stem, text_data in files_data:
             if not text_data:
                 continue
                 
@@ -120,6 +121,45 @@ class RankingExporter:
         except (IOError, OSError) as e:
             raise RuntimeError(f"Failed to write CSV file {path}: {e}")
     
+    def _stream_records(
+        self,
+        keyed_records: Iterable[Tuple[str, Dict[str, Any]]],
+        path_for_key: Callable[[str], Path],
+        fieldnames: List[str],
+        grouped: bool = False,
+        export_format: str = "csv"
+    ) -> Dict[str, Tuple[Path, int]]:
+        """
+        Stream (key, record) pairs into one output file per key, opening each writer
+        on its first record. With grouped=True keys arrive contiguously, so the previous
+        file is closed as soon as the key changes. path_for_key returns the CSV path;
+        its suffix follows export_format. Returns {key: (path, record count)}.
+        """
+        written: Dict[str, Tuple[Path, int]] = {}
+        writers: Dict[str, Any] = {}
+        current_key = None
+        path = None
+        
+        try:
+            with ExitStack() as stack:
+                for key, record in keyed_records:
+                    writer = writers.get(key)
+                    if writer is None:
+                        if grouped and current_key is not None:
+                            stack.close()
+                            writers.clear()
+                        path = export_path(path_for_key(key), export_format)
+                        writer = stack.enter_context(open_record_writer(path, fieldnames, export_format))
+                        writers[key] = writer
+                        written[key] = (path, 0)
+                        current_key = key
+                    writer.writerow(record)
+                    written[key] = (written[key][0], written[key][1] + 1)
+        except (IOError, OSError) as e:
+            raise RuntimeError(f"Failed to write {export_format} file {path}: {e}")
+        
+        return written
+    
     def export_per_user_internal(self, username: str, file_stem: str, final_ranking: List[str], text_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Export single user's ranking to internal directory (automatic after algorithm completion)"""
         timestamp = self._get_timestamp()
@@ -127,7 +167,7 @@ class RankingExporter:
         output_path = INTERNAL_EXPORT_DIR / f"{user_id}_{file_stem}_{self.algorithm}_{timestamp}.csv"
         
         # Create text lookup
-        text_lookup = {item['id']: item for item in text_data}
+        text_lookup = as_text_lookup(text_data)
         
         # Build records for this user's ranking
         records = []
@@ -149,6 +189,7 @@ class RankingExporter:
         # Write to internal directory
         fieldnames = ['user_name', 'file_name', 'algorithm', 'id', 'valence', 'ranking', 'new_ranking', 'text']
         self._write_records_to_csv(output_path, fieldnames, records)
+        get_export_manifest(INTERNAL_EXPORT_DIR).record_export(user_id, file_stem, self.algorithm, output_path, timestamp)
         
         return {
             'file': str(output_path),
@@ -156,80 +197,143 @@ class RankingExporter:
             'export_type': 'per_user_internal'
         }
     
-    def export_per_user_external(self, usernames: List[str]) -> Dict[str, Any]:
+    def export_per_user_external(self, usernames: List[str], export_format: str = "csv") -> Dict[str, Any]:
         """Export all rankings for each user into separate CSV files (external directory)"""
         timestamp = self._get_timestamp()
-        files_data = self._get_available_files_data()
         fieldnames = ['user_name', 'file_name', 'algorithm', 'id', 'valence', 'ranking', 'new_ranking', 'text']
-        created_files = []
-        total_records = 0
-        
-        # Group records by username
-        user_records_map: Dict[str, List[Dict[str, Any]]] = {username: [] for username in usernames}
-        for _, record in self._yield_ranking_records(files_data, usernames, with_text=True):
-            user_records_map[record['user_name']].append(record)
-        
-        # Write a file for each user
-        for username, user_records in user_records_map.items():
-            if user_records:
-                user_id = get_user_id(username)
-                output_path = EXTERNAL_EXPORT_DIR / f"{user_id}_data_{timestamp}.csv"
-                self._write_records_to_csv(output_path, fieldnames, user_records)
-                created_files.append(str(output_path))
-                total_records += len(user_records)
+        
+        # Stream records straight into one lazily opened file per user
+        records = self._yield_ranking_records(self._iter_available_files_data(), usernames, with_text=True)
+        written = self._stream_records(
+            ((record['user_name'], record) for _, record in records),
+            lambda username: EXTERNAL_EXPORT_DIR / f"{get_user_id(username)}_data_{timestamp}.csv",
+            fieldnames,
+            export_format=export_format
+        )
         
         return {
-            'files': created_files,
-            'total_records': total_records,
+            'files': [str(path) for path, _ in written.values()],
+            'total_records': sum(count for _, count in written.values()),
             'export_type': 'per_user_external'
         }
     
-    def export_per_file_external(self, usernames: List[str]) -> Dict[str, Any]:
+    def export_per_file_external(self, usernames: List[str], export_format: str = "csv") -> Dict[str, Any]:
         """Export rankings for each file (all users) as separate CSV files (external directory)"""
         timestamp = self._get_timestamp()
-        files_data = self._get_available_files_data()
         fieldnames = ['file_name', 'id', 'valence', 'ranking', 'new_ranking', 'algorithm', 'user_name', 'text']
-        created_files = []
-        total_records = 0
-        
-        # Group records by file
-        file_records_map: Dict[str, List[Dict[str, Any]]] = {}
-        for file_stem, record in self._yield_ranking_records(files_data, usernames, with_text=True):
-            file_records_map.setdefault(file_stem, []).append(record)
-        
-        # Write a file for each dataset
-        for file_stem, file_records in file_records_map.items():
-            if file_records:
-                output_path = EXTERNAL_EXPORT_DIR / f"{file_stem}_all_users_data_{timestamp}.csv"
-                self._write_records_to_csv(output_path, fieldnames, file_records)
-                created_files.append(str(output_path))
-                total_records += len(file_records)
+        
+        # Records arrive dataset by dataset, so only one output file is open at a time
+        records = self._yield_ranking_records(self._iter_available_files_data(), usernames, with_text=True)
+        written = self._stream_records(
+            records,
+            lambda file_stem: EXTERNAL_EXPORT_DIR / f"{file_stem}_all_users_data_{timestamp}.csv",
+            fieldnames,
+            grouped=True,
+            export_format=export_format
+        )
         
         return {
-            'files': created_files,
-            'total_records': total_records,
+            'files': [str(path) for path, _ in written.values()],
+            'total_records': sum(count for _, count in written.values()),
             'export_type': 'per_file_external'
         }
     
-    def export_overall_project_external(self, usernames: List[str]) -> Dict[str, Any]:
+    def export_overall_project_external(self, usernames: List[str], export_format: str = "csv") -> Dict[str, Any]:
         """Export all available rankings to a single CSV (external directory)"""
         timestamp = self._get_timestamp()
-        output_path = EXTERNAL_EXPORT_DIR / f"overall_project_data_{timestamp}.csv"
-        files_data = self._get_available_files_data()
-        
-        # Collect all records
-        records = [record for _, record in self._yield_ranking_records(files_data, usernames, with_text=False)]
+        output_path = export_path(EXTERNAL_EXPORT_DIR / f"overall_project_data_{timestamp}.csv", export_format)
         fieldnames = ['file_name', 'id', 'valence', 'ranking', 'new_ranking', 'algorithm', 'user_name']
         
-        if records:
-            self._write_records_to_csv(output_path, fieldnames, records)
+        # Stream every record into the single output file (created on the first record)
+        files_data = self._iter_available_files_data()
+        records = self._yield_ranking_records(files_data, usernames, with_text=False)
+        written = self._stream_records(
+            ((output_path.name, record) for _, record in records),
+            lambda _: output_path,
+            fieldnames,
+            export_format=export_format
+        )
         
         return {
             'files': [str(output_path)],
-            'total_records': len(records),
+            'total_records': sum(count for _, count in written.values()),
             'export_type': 'overall_project_external'
         }
 
+    def export_consensus_external(self, usernames: List[str], method: str = "borda",
+                                  export_format: str = "csv") -> Dict[str, Any]:
+        """Export one consensus ranking per dataset, aggregated across users, to a single file (external directory)"""
+        # Consensus (NumPy/SciPy) is imported here, not for the per-user exports after a session
+        from ..ranking.consensus import CONSENSUS_METHODS
+        if method not in CONSENSUS_METHODS:
+            raise ValueError(f"Unknown consensus method '{method}'. Available: {CONSENSUS_METHODS}")
+        
+        timestamp = self._get_timestamp()
+        output_path = export_path(EXTERNAL_EXPORT_DIR / f"consensus_{method}_{timestamp}.csv", export_format)
+        fieldnames = ['file_name', 'id', 'valence', 'ranking', 'consensus_ranking',
+                      'consensus_score', 'method', 'annotators', 'algorithm']
+        
+        files_data = self._iter_available_files_data()
+        records = self._yield_consensus_records(files_data, usernames, method)
+        written = self._stream_records(
+            ((output_path.name, record) for record in records),
+            lambda _: output_path,
+            fieldnames,
+            export_format=export_format
+        )
+        total_records = sum(count for _, count in written.values())
+        
+        return {
+            'files': [str(output_path)] if total_records else [],
+            'total_records': total_records,
+            'export_type': f'consensus_{method}_external'
+        }
+    
+    def _yield_consensus_records(
+        self,
+        files_data: Iterable[Tuple[str, Optional[Mapping[str, Any]]]],
+        usernames: List[str],
+        method: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield consensus ranking records for every dataset with at least one annotator"""
+        from ..ranking.consensus import borda_consensus, copeland_consensus, kemeny_consensus
+        for file_stem, text_data in files_data:
+            if not text_data:
+                continue
+            
+            if method == "copeland":
+                # Pool raw pairwise answers from every user's session
+                memories = [self.session_manager.load_session(username, file_stem)[0] for username in usernames]
+                memories = [memory for memory in memories if memory]
+                if not memories:
+                    continue
+                result = copeland_consensus(memories, items=list(text_data.keys()))
+            else:
+                rankings = {}
+                for username in usernames:
+                    user_ranking = self._get_user_ranking_from_session(username, file_stem)
+                    if user_ranking:
+                        rankings[username] = user_ranking
+                if not rankings:
+                    continue
+                result = borda_consensus(rankings) if method == "borda" else kemeny_consensus(rankings)
+            
+            for rank_position, text_id in enumerate(result.ranking, 1):
+                if text_id not in text_data:
+                    continue
+                text_info = text_data[text_id]
+                yield {
+                    'file_name': file_stem,
+                    'id': text_id,
+                    'valence': text_info.get('valence', ''),
+                    'ranking': text_info.get('ranking', ''),
+                    'consensus_ranking': rank_position,
+                    'consensus_score': round(result.scores[text_id], 6),
+                    'method': method,
+                    'annotators': result.n_annotators,
+                    'algorithm': self.algorithm
+                }
+
 # Global instance
 _ranking_exporter_instance: Optional[RankingExporter] = None
 
@@ -0,0 +1,175 @@
+#src\text_ranking_tool\export\manifest.py
+"""
+Export manifest index for INTERNAL_EXPORT_DIR
+Maps (user_id, dataset, algorithm) to its export history so lookups are
+dictionary reads instead of directory globs. The manifest is rewritten
+atomically on every internal export and rebuilt from one directory scan
+when missing. Files added or removed behind its back are found by comparing
+the directory listing with the file names the manifest has seen, so only
+those files are opened.
+"""
+
+import csv
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from ..config.constants import INTERNAL_EXPORT_DIR, get_user_id
+
+MANIFEST_NAME = "export_manifest.json"
+MANIFEST_VERSION = 2
+
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def _entry_sort_key(entry: Dict[str, str]):
+    """The single "latest" rule: export timestamp, then file name"""
+    return (entry['timestamp'], entry['file'])
+
+
+class ExportManifest:
+    """Index of internal export CSVs: exports[user_id][dataset][algorithm] -> history (oldest first)"""
+
+    def __init__(self, export_dir: Path):
+        self.export_dir = export_dir
+        self.path = export_dir / MANIFEST_NAME
+        self._exports: Dict[str, Dict[str, Dict[str, List[Dict[str, str]]]]] = {}
+        self._files: Set[str] = set()   # every CSV name seen, indexed or not
+        self._loaded_mtime_ns: Optional[int] = None
+
+    def record_export(self, user_id: str, dataset: str, algorithm: str, output_path: Path, timestamp: str):
+        """Add a freshly written export to the history and persist the manifest"""
+        # The file just written is the expected change, not a reason to re-scan
+        self._ensure_current(pending=output_path.name)
+        self._files.add(output_path.name)
+        history = self._exports.setdefault(user_id, {}).setdefault(dataset, {}).setdefault(algorithm, [])
+        history[:] = [entry for entry in history if entry['file'] != output_path.name]
+        history.append({'file': output_path.name, 'timestamp': timestamp})
+        history.sort(key=_entry_sort_key)
+        self._save()
+
+    def history(self, user_id: str, dataset: str, algorithm: Optional[str] = None) -> List[Path]:
+        """Export paths for user/dataset (one algorithm or all), oldest first"""
+        self._ensure_current()
+        by_algorithm = self._exports.get(user_id, {}).get(dataset, {})
+        if algorithm is not None:
+            entries = list(by_algorithm.get(algorithm, []))
+        else:
+            entries = [entry for history in by_algorithm.values() for entry in history]
+        entries.sort(key=_entry_sort_key)
+        return [self.export_dir / entry['file'] for entry in entries]
+
+    def latest(self, user_id: str, dataset: str, algorithm: Optional[str] = None) -> Optional[Path]:
+        """Most recent export for user/dataset (one algorithm or all), or None"""
+        for path in reversed(self.history(user_id, dataset, algorithm)):
+            if path.exists():
+                return path
+        return None
+
+    def rebuild(self):
+        """Re-index every export CSV in the directory (one scan, header row of each file)"""
+        self._exports = {}
+        self._files = set()
+        self._sync({csv_file.name for csv_file in self.export_dir.glob("*.csv")})
+        self._save()
+
+    def _index_file(self, csv_file: Path) -> Optional[Tuple[str, str, str, Dict[str, str]]]:
+        """(user_id, dataset, algorithm, history entry) from an export's first row, None if not an export"""
+        try:
+            with open(csv_file, 'r', encoding='utf-8') as f:
+                row = next(csv.DictReader(f), None)
+        except (OSError, UnicodeDecodeError, csv.Error):
+            return None
+        if not row or not all(row.get(column) for column in ('user_name', 'file_name', 'algorithm')):
+            return None
+
+        # Filenames end in the export timestamp; fall back to mtime for renamed files
+        timestamp = csv_file.stem[-len("YYYYmmdd_HHMMSS"):]
+        try:
+            datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+        except ValueError:
+            timestamp = datetime.fromtimestamp(csv_file.stat().st_mtime).strftime(TIMESTAMP_FORMAT)
+
+        return get_user_id(row['user_name']), row['file_name'], row['algorithm'], {'file': csv_file.name, 'timestamp': timestamp}
+
+    def _sync(self, names: Set[str]) -> bool:
+        """Index files added since the manifest was written, drop removed ones; True if anything changed"""
+        added = names - self._files
+        removed = self._files - names
+        for name in sorted(added):
+            indexed = self._index_file(self.export_dir / name)
+            if indexed is not None:
+                user_id, dataset, algorithm, entry = indexed
+                history = self._exports.setdefault(user_id, {}).setdefault(dataset, {}).setdefault(algorithm, [])
+                history.append(entry)
+                history.sort(key=_entry_sort_key)
+        if removed:
+            for by_dataset in self._exports.values():
+                for by_algorithm in by_dataset.values():
+                    for history in by_algorithm.values():
+                        history[:] = [entry for entry in history if entry['file'] not in removed]
+        self._files = names
+        return bool(added or removed)
+
+    def _ensure_current(self, pending: Optional[str] = None):
+        """
+        Reload if another process rewrote the manifest, rebuild if it is missing
+        or from another version, and pick up files added or removed since it was
+        written. `pending` is a file being recorded right now; it is not indexed.
+        """
+        try:
+            manifest_mtime = self.path.stat().st_mtime_ns
+            directory_mtime = self.export_dir.stat().st_mtime_ns
+        except OSError:
+            self.rebuild()
+            return
+
+        if manifest_mtime != self._loaded_mtime_ns:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self.rebuild()
+                return
+            if data.get('version') != MANIFEST_VERSION:
+                self.rebuild()
+                return
+            self._exports = data.get('exports', {})
+            self._files = set(data.get('files', []))
+            self._loaded_mtime_ns = manifest_mtime
+
+        # Adding or removing any file bumps the directory mtime past the manifest's;
+        # a listing (no file opens) tells which files those were
+        if directory_mtime > manifest_mtime:
+            names = {csv_file.name for csv_file in self.export_dir.glob("*.csv")}
+            if pending is not None:
+                names.discard(pending)
+                names |= self._files & {pending}
+            if self._sync(names) or pending is None:
+                self._save()
+
+    def _save(self):
+        """Atomically replace the manifest file"""
+        try:
+            self.export_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'exports': self._exports, 'files': sorted(self._files)}, f, indent=2)
+            os.replace(tmp_path, self.path)
+            # Stamp after the rename so the manifest is at least as new as the directory
+            os.utime(self.path)
+            self._loaded_mtime_ns = self.path.stat().st_mtime_ns
+        except OSError as e:
+            print(f"Warning: Could not write export manifest: {e}")
+
+
+# Global instances (one per export directory)
+_export_manifest_instances: Dict[Path, ExportManifest] = {}
+
+def get_export_manifest(export_dir: Optional[Path] = None) -> ExportManifest:
+    """Get the export manifest for a directory (INTERNAL_EXPORT_DIR by default)"""
+    export_dir = export_dir or INTERNAL_EXPORT_DIR
+    if export_dir not in _export_manifest_instances:
+        _export_manifest_instances[export_dir] = ExportManifest(export_dir)
+    return _export_manifest_instances[export_dir]
@@ -0,0 +1,163 @@
+#src\text_ranking_tool\export\record_writers.py
+"""
+Record writers for external exports - CSV, or columnar Parquet / Arrow IPC
+Columnar formats need the optional pyarrow dependency, imported only when a
+columnar writer is opened; CSV always works. Writers take one dict record at
+a time so exports stream with flat memory.
+"""
+
+import csv
+import importlib.util
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+EXPORT_FORMATS = ["csv", "parquet", "arrow"]
+
+FORMAT_SUFFIXES = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+
+# Records buffered per columnar batch (one Parquet row group / Arrow record batch)
+COLUMNAR_BATCH_ROWS = 65536
+
+_INTEGER_COLUMNS = {'ranking', 'new_ranking', 'consensus_ranking', 'annotators'}
+_FLOAT_COLUMNS = {'valence', 'consensus_score'}
+
+
+def columnar_available() -> bool:
+    """True when pyarrow is installed and Parquet/Arrow exports can be written (without importing it)"""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _to_int(value: Any) -> int:
+    """int from ints, integral floats and their string forms ('3', '3.0')"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        number = float(value)
+        if not number.is_integer():
+            raise ValueError(f"not an integer: {value!r}")
+        return int(number)
+
+
+def available_export_formats() -> List[str]:
+    """Export formats usable in this installation"""
+    return [fmt for fmt in EXPORT_FORMATS if fmt == "csv" or columnar_available()]
+
+
+def export_path(path: Path, export_format: str) -> Path:
+    """Swap the path's suffix for the export format's"""
+    return path.with_suffix(FORMAT_SUFFIXES[export_format])
+
+
+class CsvRecordWriter:
+    """Writes dict records to a CSV file"""
+
+    def __init__(self, path: Path, fieldnames: List[str]):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def writerow(self, record: Dict[str, Any]):
+        self._writer.writerow(record)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ColumnarRecordWriter:
+    """
+    Buffers dict records into column batches appended to a Parquet file
+    (dictionary-encoded, zstd-compressed) or an Arrow IPC file (zstd buffers).
+    Repeated strings like user_name/file_name/algorithm collapse to dictionary codes.
+    """
+
+    def __init__(self, path: Path, fieldnames: List[str], export_format: str):
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc  # noqa: F401
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet/Arrow export requires pyarrow (pip install pyarrow)")
+
+        self._pa = pa
+        self.path = path
+        self.fieldnames = fieldnames
+        self.schema = pa.schema([(name, self._column_type(pa, name)) for name in fieldnames])
+        self._columns: Dict[str, List[Any]] = {name: [] for name in fieldnames}
+        self._buffered = 0
+        self._unparsable = 0
+
+        if export_format == "parquet":
+            self._writer = pq.ParquetWriter(str(path), self.schema, compression='zstd', use_dictionary=True)
+        elif export_format == "arrow":
+            options = pa.ipc.IpcWriteOptions(compression='zstd')
+            self._sink = pa.OSFile(str(path), 'wb')
+            self._writer = pa.ipc.new_file(self._sink, self.schema, options=options)
+        else:
+            raise ValueError(f"Unknown columnar format '{export_format}'")
+        self.export_format = export_format
+
+    @staticmethod
+    def _column_type(pa, name: str):
+        if name in _INTEGER_COLUMNS:
+            return pa.int64()
+        if name in _FLOAT_COLUMNS:
+            return pa.float64()
+        return pa.string()
+
+    def _cell(self, name: str, value: Any) -> Optional[Any]:
+        """Coerce one value to its column type; empty and unparsable numbers become nulls"""
+        if value is None or value == '':
+            return None
+        try:
+            if name in _INTEGER_COLUMNS:
+                return _to_int(value)
+            if name in _FLOAT_COLUMNS:
+                return float(value)
+        except (TypeError, ValueError):
+            self._unparsable += 1
+            return None
+        return str(value)
+
+    def writerow(self, record: Dict[str, Any]):
+        for name in self.fieldnames:
+            self._columns[name].append(self._cell(name, record.get(name)))
+        self._buffered += 1
+        if self._buffered >= COLUMNAR_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if not self._buffered:
+            return
+        batch = self._pa.record_batch([self._columns[name] for name in self.fieldnames], schema=self.schema)
+        self._writer.write_batch(batch)
+        self._columns = {name: [] for name in self.fieldnames}
+        self._buffered = 0
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+        if self.export_format == "arrow":
+            self._sink.close()
+        if self._unparsable:
+            print(f"Warning: {self._unparsable} unparsable numeric value(s) written as nulls in {self.path.name}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_record_writer(path: Path, fieldnames: List[str], export_format: str = "csv"):
+    """Open a record writer for the format (a context manager with writerow/close)"""
+    if export_format == "csv":
+        return CsvRecordWriter(path, fieldnames)
+    if export_format in FORMAT_SUFFIXES:
+        return ColumnarRecordWriter(path, fieldnames, export_format)
+    raise ValueError(f"Unknown export format '{export_format}'. Available: {EXPORT_FORMATS}")
@@ -1,26 +1,30 @@
 # src/text_ranking_tool/ranking/comparison_engine.py
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 
 from .session_manager import get_session_manager
-from ..config.constants import CONFIGURED_ALGORITHM
+from ..config.constants import get_configured_algorithm
+from ..data.dataset import Dataset, as_dataset
 
 class ComparisonEngine:
     """Intelligent comparison engine with multi-user session management"""
     
     def __init__(self):
-        self.text_data: Dict[str, Dict[str, Any]] = {}
+        self.dataset: Optional[Dataset] = None
+        self.text_data: Mapping[str, Mapping[str, Any]] = {}
         self.current_user: Optional[str] = None
         self.current_file: Optional[str] = None
         self.comparison_memory: Dict[Tuple[str, str], bool] = {}
         self.comparison_order: List[Tuple[str, str]] = [] 
+        self._next_pair: Optional[Tuple[str, str]] = None
         self.session_manager = get_session_manager()
     
     def initialize_session(self, text_data: List[Dict[str, Any]], username: str, data_file_stem: str):
         """Initialize comparison engine for specific user and file"""
         
-        # Store text data for comparisons
-        self.text_data = {item['id']: item for item in text_data}
+        # Share the loaded dataset for comparisons (text is read on demand)
+        self.dataset = as_dataset(text_data)
+        self.text_data = self.dataset.lookup
         self.current_user = username
         self.current_file = data_file_stem
         
@@ -60,6 +64,9 @@ class ComparisonEngine:
             # New comparison needed - prepare data for algorithm-specific UI
             comparison_data = self._get_comparison_data(text_id_1, text_id_2)
             
+            # Render the announced next comparison in the background while this one is answered
+            self._prerender_next_comparison(comparison_data["comparison_number"] + 1)
+            
             # Delegate to algorithm-specific UI
             winner_id = self._get_user_comparison_choice(comparison_data)
             
@@ -79,6 +86,10 @@ class ComparisonEngine:
             
             return result
 
+    def prepare_comparison(self, text_id_1: str, text_id_2: str):
+        """Announce the comparison the algorithm will ask after the current one"""
+        self._next_pair = (text_id_1, text_id_2)
+
     def undo_last_comparison(self) -> bool:
         """Delete last comparison as if it never happened"""
         if not self.comparison_order:
@@ -141,20 +152,36 @@ class ComparisonEngine:
                 "ranking": text2_data.get('ranking', 0)
             },
             "comparison_number": len(self.comparison_memory) + 1,
-            "algorithm": CONFIGURED_ALGORITHM
+            "algorithm": get_configured_algorithm()
         }
     
+    def _prerender_next_comparison(self, comparison_number: int):
+        """Hand the announced next pair to the UI for background rendering (skipped if already answered)"""
+        next_pair, self._next_pair = self._next_pair, None
+        if next_pair is None:
+            return
+        text_id_1, text_id_2 = next_pair
+        if (text_id_1, text_id_2) in self.comparison_memory or (text_id_2, text_id_1) in self.comparison_memory:
+            return
+        
+        next_data = self._get_comparison_data(text_id_1, text_id_2)
+        next_data["comparison_number"] = comparison_number
+        
+        from ..ux.comparison_ui import prerender_comparison
+        prerender_comparison(next_data)
+    
     def _get_user_comparison_choice(self, comparison_data: Dict[str, Any]) -> str:
         """Delegate to algorithm-specific UI"""
         
         # Import here to avoid circular imports
-        if CONFIGURED_ALGORITHM == "tournament":
+        configured_algorithm = get_configured_algorithm()
+        if configured_algorithm == "tournament":
             from ..ux.comparison_ui import get_tournament_comparison_choice
             return get_tournament_comparison_choice(comparison_data)
-        elif CONFIGURED_ALGORITHM == "recursive_median":
+        elif configured_algorithm == "recursive_median":
             from ..ux.comparison_ui import get_recursive_median_comparison_choice
             return get_recursive_median_comparison_choice(comparison_data)
-        elif CONFIGURED_ALGORITHM == "transitive_quick":  # ← Add this
+        elif configured_algorithm == "transitive_quick":  # ← Add this
             from ..ux.comparison_ui import get_transitive_quick_comparison_choice
             return get_transitive_quick_comparison_choice(comparison_data)
         else:
@@ -0,0 +1,137 @@
+# src/text_ranking_tool/ranking/consensus.py
+"""
+Consensus ranking aggregation across annotators
+Borda over final rankings, Copeland over pooled pairwise session answers,
+and a Kemeny approximation via local search (local Kemenization)
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from ..stats.matrix_engine import build_rank_matrix
+
+CONSENSUS_METHODS = ["borda", "copeland", "kemeny"]
+
+
+class ConsensusResult(NamedTuple):
+    """Consensus ranking (most negative first) with per-item scores"""
+    ranking: List[str]
+    scores: Dict[str, float]
+    method: str
+    n_annotators: int
+
+
+def _order_by_score(items: List[str], scores: np.ndarray, tiebreak: Optional[np.ndarray] = None) -> List[str]:
+    """Sort items by descending score, then descending tiebreak, then input order"""
+    keys = [np.arange(len(items))]
+    if tiebreak is not None:
+        keys.append(-tiebreak)
+    keys.append(-scores)
+    return [items[i] for i in np.lexsort(keys)]
+
+
+def borda_consensus(rankings: Dict[str, List[str]]) -> ConsensusResult:
+    """
+    Borda count over final rankings. Each ranking awards an item the share of
+    that ranking's other items placed below it, so partial rankings weigh equally.
+    """
+    _, items, positions = build_rank_matrix(rankings)
+    present = ~np.isnan(positions)
+    lengths = present.sum(axis=1, keepdims=True)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        points = (lengths - positions) / np.maximum(lengths - 1, 1)
+    points = np.where(present, points, 0.0)
+    appearances = np.maximum(present.sum(axis=0), 1)
+    scores = points.sum(axis=0) / appearances
+
+    ranking = _order_by_score(items, scores)
+    return ConsensusResult(ranking, dict(zip(items, scores.tolist())), "borda", len(rankings))
+
+
+def copeland_consensus(comparison_memories: List[Dict[Tuple[str, str], bool]],
+                       items: Optional[List[str]] = None) -> ConsensusResult:
+    """
+    Copeland score from pooled pairwise answers: an item earns 1 for every
+    opponent a majority judged it more negative than, 0.5 for tied pairs.
+    Answers are joined on canonicalised pairs in one sparse pass.
+    """
+    item_index: Dict[str, int] = {item: i for i, item in enumerate(items or [])}
+    firsts: List[int] = []
+    seconds: List[int] = []
+    first_won: List[bool] = []
+
+    for memory in comparison_memories:
+        for (text_id_1, text_id_2), result in memory.items():
+            firsts.append(item_index.setdefault(text_id_1, len(item_index)))
+            seconds.append(item_index.setdefault(text_id_2, len(item_index)))
+            first_won.append(bool(result))
+
+    all_items = list(item_index.keys())
+    n_items = len(all_items)
+    scores = np.zeros(n_items)
+    margins = np.zeros(n_items)
+
+    if firsts:
+        a = np.asarray(firsts, dtype=np.int64)
+        b = np.asarray(seconds, dtype=np.int64)
+        a_won = np.asarray(first_won)
+        low = np.minimum(a, b)
+        high = np.maximum(a, b)
+        low_won = np.where(a == low, a_won, ~a_won)
+
+        pair_keys, inverse = np.unique(low * n_items + high, return_inverse=True)
+        votes = np.bincount(inverse, minlength=len(pair_keys))
+        low_votes = np.bincount(inverse, weights=low_won, minlength=len(pair_keys))
+        margin = 2 * low_votes - votes
+        pair_low = pair_keys // n_items
+        pair_high = pair_keys % n_items
+
+        low_points = (margin > 0) + 0.5 * (margin == 0)
+        scores += np.bincount(pair_low, weights=low_points, minlength=n_items)
+        scores += np.bincount(pair_high, weights=1.0 - low_points, minlength=n_items)
+        margins += np.bincount(pair_low, weights=margin, minlength=n_items)
+        margins -= np.bincount(pair_high, weights=margin, minlength=n_items)
+
+    ranking = _order_by_score(all_items, scores, tiebreak=margins)
+    return ConsensusResult(ranking, dict(zip(all_items, scores.tolist())), "copeland", len(comparison_memories))
+
+
+def kemeny_consensus(rankings: Dict[str, List[str]], initial: Optional[List[str]] = None,
+                     max_passes: Optional[int] = None) -> ConsensusResult:
+    """
+    Kemeny approximation: start from Borda (or `initial`) and apply odd-even
+    adjacent transpositions whenever a majority of rankings prefers the swap,
+    until the order is locally Kemeny-optimal. Each pass is one vectorised
+    comparison over all annotators.
+    """
+    _, items, positions = build_rank_matrix(rankings)
+    index = {item: i for i, item in enumerate(items)}
+    start = initial if initial is not None else borda_consensus(rankings).ranking
+    start_ids = [index[item] for item in start if item in index]
+    unplaced = sorted(set(range(len(items))) - set(start_ids))
+    order = np.array(start_ids + unplaced, dtype=np.int64)
+
+    if max_passes is None:
+        max_passes = len(order)
+
+    for _ in range(max_passes):
+        swapped = False
+        for parity in (0, 1):
+            left = order[parity:-1:2]
+            right = order[parity + 1::2]
+            # NaN comparisons are False, so annotators missing either item abstain
+            keep = (positions[:, left] < positions[:, right]).sum(axis=0)
+            swap = (positions[:, right] < positions[:, left]).sum(axis=0)
+            flip = swap > keep
+            if flip.any():
+                swapped = True
+                slots = np.arange(parity, len(order) - 1, 2)[flip]
+                order[slots], order[slots + 1] = order[slots + 1], order[slots].copy()
+        if not swapped:
+            break
+
+    ranking = [items[i] for i in order]
+    # Kemeny yields an order, not scores: report the normalised consensus position
+    span = max(len(ranking) - 1, 1)
+    scores = {item: (len(ranking) - 1 - position) / span for position, item in enumerate(ranking)}
+    return ConsensusResult(ranking, scores, "kemeny", len(rankings))
@@ -1,17 +1,22 @@
 # src/text_ranking_tool/ranking/session_manager.py
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from ..config.constants import INTERNAL_USERS_DIR, CONFIGURED_ALGORITHM, get_user_id
+from ..config.constants import INTERNAL_USERS_DIR, get_configured_algorithm, get_user_id
 from typing import Dict, Tuple, Optional, List, Any
 
+# Per-user index of session headers (progress, timestamp, algorithm), rewritten on each save
+PROGRESS_INDEX_NAME = ".progress_index.json"
+PROGRESS_INDEX_VERSION = 1
 
 class SessionManager:
     """Manages multi-user session persistence with comparison memory"""
     
     def __init__(self):
         self.users_dir = INTERNAL_USERS_DIR
+        self._index_cache: Dict[Path, Tuple[int, Dict[str, Dict[str, Any]]]] = {}
     
     def get_session_path(self, username: str, data_file_stem: str) -> Path:
         """Get session file path for user/file combination"""
@@ -48,13 +53,14 @@ class SessionManager:
             'timestamp': datetime.now().isoformat(),
             'username': username,
             'data_file': data_file_stem,
-            'algorithm': CONFIGURED_ALGORITHM,  # ✅ Added algorithm field
+            'algorithm': get_configured_algorithm(),  # ✅ Added algorithm field
             'comparisons_count': len(comparison_memory)
         }
         
         try:
             with open(session_file, 'w') as f:
                 json.dump(session_data, f, indent=2)
+            self._update_progress_index(session_file, self._session_header(session_file, session_data))
             return True
         except Exception as e:
             print(f"Error saving session: {e}")
@@ -103,6 +109,7 @@ class SessionManager:
         try:
             if session_path.exists():
                 session_path.unlink()
+                self._update_progress_index(session_path, None)
                 return True
             return False
         except Exception as e:
@@ -115,59 +122,144 @@ class SessionManager:
     
     def get_session_progress(self, username: str, data_file_stem: str) -> Dict[str, Any]:
         """Get session progress information for UI display"""
-        session_path = self.get_session_path(username, data_file_stem)
-        
-        if not session_path.exists():
+        header = self._get_session_header(self.get_session_path(username, data_file_stem))
+        return self._progress_from_header(header)
+    
+    def get_user_progress(self, username: str) -> Dict[str, Dict[str, Any]]:
+        """Progress for every session of a user, keyed by dataset stem (one index read)"""
+        return {session['stem']: self._progress_from_header(session) for session in self._iter_session_headers(username)}
+    
+    def list_user_sessions(self, username: str) -> List[Dict[str, Any]]:
+        """List all sessions for a user with progress info"""
+        sessions = []
+        for header in self._iter_session_headers(username):
+            sessions.append({
+                'filename': header['filename'],
+                'data_file': header['data_file'] or 'unknown',
+                'algorithm': header['algorithm'] or 'unknown',
+                'timestamp': header['timestamp'] or 'unknown',
+                'comparisons_made': header['comparisons_made']
+            })
+        return sessions
+    
+    # Progress index helpers
+    @staticmethod
+    def _progress_from_header(header: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if header is None:
             return {
                 "exists": False,
                 "comparisons_made": 0,
                 "last_updated": None
             }
+        return {
+            "exists": True,
+            "comparisons_made": header['comparisons_made'],
+            "last_updated": header['timestamp'],
+            "algorithm": header['algorithm'] or get_configured_algorithm()
+        }
+    
+    @staticmethod
+    def _session_header(session_path: Path, session_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Small summary of a session, stamped with the session file's size/mtime"""
+        stat = session_path.stat()
+        return {
+            'stem': session_path.stem,
+            'filename': session_path.name,
+            'data_file': session_data.get('data_file'),
+            'algorithm': session_data.get('algorithm'),
+            'timestamp': session_data.get('timestamp'),
+            'comparisons_made': session_data.get('comparisons_count', 0),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
+    
+    def _read_progress_index(self, user_dir: Path) -> Dict[str, Dict[str, Any]]:
+        """Headers by stem from the user's index (memoised until the index file changes)"""
+        index_path = user_dir / PROGRESS_INDEX_NAME
+        try:
+            mtime_ns = index_path.stat().st_mtime_ns
+        except OSError:
+            return {}
+        
+        cached = self._index_cache.get(index_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            sessions = data.get('sessions', {}) if data.get('version') == PROGRESS_INDEX_VERSION else {}
+        except (OSError, json.JSONDecodeError):
+            sessions = {}
         
+        self._index_cache[index_path] = (mtime_ns, sessions)
+        return sessions
+    
+    def _write_progress_index(self, user_dir: Path, sessions: Dict[str, Dict[str, Any]]):
+        """Atomically replace the user's progress index"""
+        index_path = user_dir / PROGRESS_INDEX_NAME
+        tmp_path = index_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': PROGRESS_INDEX_VERSION, 'sessions': sessions}, f, indent=2)
+            os.replace(tmp_path, index_path)
+            self._index_cache[index_path] = (index_path.stat().st_mtime_ns, sessions)
+        except OSError as e:
+            print(f"Warning: Could not write session progress index: {e}")
+    
+    def _update_progress_index(self, session_path: Path, header: Optional[Dict[str, Any]]):
+        """Set (or remove, when header is None) one session's entry in the index"""
+        sessions = dict(self._read_progress_index(session_path.parent))
+        if header is None:
+            if sessions.pop(session_path.stem, None) is None:
+                return
+        else:
+            sessions[session_path.stem] = header
+        self._write_progress_index(session_path.parent, sessions)
+    
+    def _get_session_header(self, session_path: Path, sessions: Optional[Dict[str, Dict[str, Any]]] = None,
+                            stat: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+        """
+        Header for one session file: from the index when its size/mtime still
+        match, otherwise parsed once from the session and written back.
+        """
+        try:
+            stat = stat or session_path.stat()
+        except OSError:
+            return None
+        
+        if sessions is None:
+            sessions = self._read_progress_index(session_path.parent)
+        header = sessions.get(session_path.stem)
+        if header and header.get('size') == stat.st_size and header.get('mtime_ns') == stat.st_mtime_ns:
+            return header
+        
+        # Index missing or stale (e.g. sessions written by an older version)
         try:
             with open(session_path, 'r', encoding='utf-8') as f:
                 session_data = json.load(f)
-            
-            return {
-                "exists": True,
-                "comparisons_made": session_data.get('comparisons_count', 0),  # ✅ Fixed field name
-                "last_updated": session_data.get('timestamp'),
-                "algorithm": session_data.get('algorithm', CONFIGURED_ALGORITHM)
-            }
-            
+            header = self._session_header(session_path, session_data)
         except Exception:
-            return {
-                "exists": False,
-                "comparisons_made": 0,
-                "last_updated": None
-            }
+            # Skip corrupted session files
+            return None
+        self._update_progress_index(session_path, header)
+        return header
     
-    def list_user_sessions(self, username: str) -> List[Dict[str, Any]]:
-        """List all sessions for a user with progress info"""
-        user_id = get_user_id(username)
-        user_dir = self.users_dir / user_id
-        
+    def _iter_session_headers(self, username: str):
+        """Headers of every session file in the user's directory"""
+        user_dir = self.users_dir / get_user_id(username)
         if not user_dir.exists():
-            return []
+            return
         
-        sessions = []
-        for session_file in user_dir.glob("*.json"):  # ✅ Updated glob pattern for new naming
-            try:
-                with open(session_file, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
-                
-                sessions.append({
-                    'filename': session_file.name,
-                    'data_file': session_data.get('data_file', 'unknown'),
-                    'algorithm': session_data.get('algorithm', 'unknown'),
-                    'timestamp': session_data.get('timestamp', 'unknown'),
-                    'comparisons_made': session_data.get('comparisons_count', 0)  # ✅ Fixed field name
-                })
-            except Exception:
-                # Skip corrupted session files
-                continue
-        
-        return sessions
+        sessions = self._read_progress_index(user_dir)
+        with os.scandir(user_dir) as entries:
+            session_entries = [entry for entry in entries
+                               if entry.name.endswith(".json") and entry.name != PROGRESS_INDEX_NAME]
+        for entry in session_entries:
+            header = self._get_session_header(Path(entry.path), sessions, entry.stat())
+            if header is not None:
+                yield header
+            sessions = self._read_progress_index(user_dir)
 
 # Global instance
 _session_manager_instance: Optional[SessionManager] = None
@@ -0,0 +1,113 @@
+# src/text_ranking_tool/stats/analysis_cache.py
+"""
+Persistent analysis result cache keyed by export file fingerprints
+Entries live as one pickle per key under INTERNAL_EXPORT_DIR and are evicted
+least-recently-used first; a small in-memory LRU sits in front of the disk
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+from ..config.constants import INTERNAL_EXPORT_DIR
+
+# Bump whenever a cached metric's definition changes to invalidate old entries
+METRICS_VERSION = 1
+
+CACHE_DIR_NAME = ".analysis_cache"
+
+_MISSING = object()
+
+Fingerprint = Tuple[str, int, int]
+
+
+def file_fingerprint(path: Path) -> Fingerprint:
+    """(resolved path, size, mtime_ns) - changes whenever the file is rewritten"""
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+class AnalysisCache:
+    """Disk-backed LRU cache for parsed rankings and computed metrics"""
+
+    def __init__(self, cache_dir: Path, max_entries: int = 512, memory_entries: int = 128):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+
+    def _digest(self, key: Tuple) -> str:
+        return hashlib.sha1(repr((METRICS_VERSION, key)).encode('utf-8')).hexdigest()
+
+    def _remember(self, digest: str, value: Any):
+        self._memory[digest] = value
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        """Return the cached value for key, or default"""
+        digest = self._digest(key)
+        if digest in self._memory:
+            self._memory.move_to_end(digest)
+            return self._memory[digest]
+
+        entry_path = self.cache_dir / f"{digest}.pkl"
+        try:
+            with open(entry_path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(entry_path)  # mark as recently used
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+            return default
+
+        self._remember(digest, value)
+        return value
+
+    def put(self, key: Tuple, value: Any):
+        """Store value under key, evicting least-recently-used entries on disk"""
+        digest = self._digest(key)
+        self._remember(digest, value)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{digest}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_dir / f"{digest}.pkl")
+            self._evict()
+        except OSError as e:
+            print(f"Warning: Could not write analysis cache: {e}")
+
+    def get_or_compute(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop every cached entry"""
+        self._memory.clear()
+        for entry_path in self.cache_dir.glob("*.pkl"):
+            entry_path.unlink(missing_ok=True)
+
+    def _evict(self):
+        entries = list(self.cache_dir.glob("*.pkl"))
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime_ns)
+        for entry_path in entries[:len(entries) - self.max_entries]:
+            entry_path.unlink(missing_ok=True)
+
+
+# Global instance
+_analysis_cache_instance: Optional[AnalysisCache] = None
+
+def get_analysis_cache() -> AnalysisCache:
+    """Get global analysis cache instance"""
+    global _analysis_cache_instance
+    if _analysis_cache_instance is None:
+        _analysis_cache_instance = AnalysisCache(INTERNAL_EXPORT_DIR / CACHE_DIR_NAME)
+    return _analysis_cache_instance
@@ -0,0 +1,251 @@
+# src/text_ranking_tool/stats/batch_report.py
+"""
+Non-interactive batch analysis across every available dataset
+Each dataset's unified dashboard (with bootstrap confidence intervals against
+the machine) is computed in a process pool and the rows are combined into one
+CSV/JSON report plus a per-dataset summary table
+
+Run with: python -m src.text_ranking_tool.stats.batch_report [--workers N]
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+import pandas as pd
+from rich.console import Console
+from rich.table import Table
+from .stats_for_ui import StatsForUI
+from ..config.constants import EXTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR, INTERNAL_EXPORT_DIR, USER_MAPPING
+
+ProgressCallback = Callable[[int, int], None]
+
+# Resamples for each participant's bootstrap confidence intervals (same as the dashboard)
+BOOTSTRAP_RESAMPLES = 1000
+
+# Dashboard column for each bootstrap metric; intervals add '<column> CI Lower/Upper'
+BOOTSTRAP_COLUMNS = {
+    'kendall_tau': 'Kendall τ',
+    'spearman_rho': 'Spearman ρ',
+    'overlap_at_10': 'Top 10 Overlap',
+    'overlap_at_20': 'Top 20 Overlap'
+}
+
+
+class BatchReport(NamedTuple):
+    """Combined dashboard rows, per-dataset summary and the files written"""
+    dashboard: pd.DataFrame
+    summary: pd.DataFrame
+    csv_path: Path
+    json_path: Path
+
+
+def _resolve_sources(dataset_stem: str) -> Dict[str, Path]:
+    """
+    Participant ranking files for one dataset. Resolved in the parent process only:
+    this may sync and save the shared export manifest, which workers must not race on.
+    """
+    return StatsForUI.resolve_participant_sources(
+        dataset_stem, INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR, USER_MAPPING)
+
+
+def _dataset_dashboard(dataset_stem: str, sources: Dict[str, Path],
+                       n_resamples: int = BOOTSTRAP_RESAMPLES) -> Tuple[str, List[Dict]]:
+    """Process pool entry point: unified dashboard rows (plus bootstrap CIs) from resolved sources"""
+    participants_data = StatsForUI.load_all_participants_data(
+        dataset_stem, INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR, USER_MAPPING, sources=sources)
+
+    if len(participants_data) < 2:
+        return dataset_stem, []
+
+    dashboard_df = StatsForUI.generate_unified_dashboard_data(participants_data, sources)
+    rows = dashboard_df.to_dict('records')
+    
+    if n_resamples > 0:
+        intervals = StatsForUI.generate_bootstrap_intervals(
+            participants_data, n_resamples=n_resamples, sources=sources)
+        for row in rows:
+            # The machine row (and participants with too few common items) stay blank
+            metrics = intervals.get(row['Participant'], {})
+            for metric, column in BOOTSTRAP_COLUMNS.items():
+                interval = metrics.get(metric)
+                row[f'{column} CI Lower'] = interval.lower if interval else np.nan
+                row[f'{column} CI Upper'] = interval.upper if interval else np.nan
+    
+    return dataset_stem, rows
+
+
+def _safe_dataset_dashboard(dataset_stem: str, n_resamples: int) -> Tuple[str, List[Dict]]:
+    """In-process counterpart of the pool's error handling: a failing dataset yields no rows"""
+    try:
+        return _dataset_dashboard(dataset_stem, _resolve_sources(dataset_stem), n_resamples)
+    except Exception as e:
+        print(f"Warning: Analysis failed for dataset {dataset_stem}: {e}")
+        return dataset_stem, []
+
+
+def iter_dataset_dashboards(datasets: List[str], max_workers: Optional[int] = None,
+                            progress_callback: Optional[ProgressCallback] = None,
+                            n_resamples: int = BOOTSTRAP_RESAMPLES):
+    """
+    Stream (dataset_stem, dashboard rows) as datasets complete (max_workers=1 stays
+    in-process). A dataset whose analysis fails is reported and yields no rows.
+    """
+    total = len(datasets)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers <= 1 or total < 2:
+        for done, dataset_stem in enumerate(datasets, 1):
+            result = _safe_dataset_dashboard(dataset_stem, n_resamples)
+            if progress_callback:
+                progress_callback(done, total)
+            yield result
+        return
+
+    # Sources are resolved here, one dataset after another; workers only read and compute
+    jobs = {}
+    done = 0
+    for dataset_stem in datasets:
+        try:
+            jobs[dataset_stem] = _resolve_sources(dataset_stem)
+        except Exception as e:
+            print(f"Warning: Analysis failed for dataset {dataset_stem}: {e}")
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+            yield dataset_stem, []
+    if not jobs:
+        return
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = {executor.submit(_dataset_dashboard, stem, sources, n_resamples): stem
+                   for stem, sources in jobs.items()}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Warning: Analysis failed for dataset {futures[future]}: {e}")
+                result = (futures[future], [])
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+            yield result
+
+
+def summarize_dashboards(dashboard: pd.DataFrame) -> pd.DataFrame:
+    """One row per dataset: human participants and their agreement with the machine"""
+    columns = ['Dataset', 'Participants', 'Mean Kendall τ', 'Min Kendall τ', 'Max Kendall τ',
+               'Mean Spearman ρ', 'Mean Top 10 Overlap', 'Mean Top 20 Overlap']
+    if dashboard.empty:
+        return pd.DataFrame(columns=columns)
+
+    humans = dashboard[dashboard['Participant'] != 'Machine']
+    rows = []
+    for dataset_stem, group in humans.groupby('Dataset', sort=True):
+        rows.append({
+            'Dataset': dataset_stem,
+            'Participants': len(group),
+            'Mean Kendall τ': group['Kendall τ'].mean(),
+            'Min Kendall τ': group['Kendall τ'].min(),
+            'Max Kendall τ': group['Kendall τ'].max(),
+            'Mean Spearman ρ': group['Spearman ρ'].mean(),
+            'Mean Top 10 Overlap': group['Top 10 Overlap'].mean(),
+            'Mean Top 20 Overlap': group['Top 20 Overlap'].mean()
+        })
+    return pd.DataFrame(rows, columns=columns)
+
+
+def run_batch_analysis(output_dir: Optional[Path] = None, max_workers: Optional[int] = None,
+                       datasets: Optional[List[str]] = None,
+                       progress_callback: Optional[ProgressCallback] = None,
+                       n_resamples: int = BOOTSTRAP_RESAMPLES) -> BatchReport:
+    """
+    Compute the unified dashboard for every dataset and write the combined report
+    (n_resamples=0 skips the bootstrap confidence intervals)
+    """
+    if datasets is None:
+        datasets = StatsForUI.get_available_datasets(INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR)
+    output_dir = output_dir or EXTERNAL_EXPORT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    rows = []
+    for dataset_stem, dataset_rows in iter_dataset_dashboards(datasets, max_workers, progress_callback, n_resamples):
+        rows.extend({'Dataset': dataset_stem, **row} for row in dataset_rows)
+
+    dashboard = pd.DataFrame(rows)
+    if not dashboard.empty:
+        dashboard = dashboard.sort_values(['Dataset'], kind='stable').reset_index(drop=True)
+    summary = summarize_dashboards(dashboard)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    csv_path = output_dir / f"batch_analysis_{timestamp}.csv"
+    json_path = output_dir / f"batch_analysis_{timestamp}.json"
+
+    dashboard.to_csv(csv_path, index=False, encoding='utf-8')
+    report = {
+        'generated': timestamp,
+        'datasets': datasets,
+        # NaN is not valid JSON - missing values become null
+        'summary': summary.replace({np.nan: None}).to_dict('records'),
+        'dashboard': dashboard.replace({np.nan: None}).to_dict('records')
+    }
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    return BatchReport(dashboard, summary, csv_path, json_path)
+
+
+def display_summary_table(console: Console, summary: pd.DataFrame):
+    """Print the per-dataset summary table"""
+    summary_table = Table(title="📊 Batch Analysis Summary (Humans vs Machine)",
+                          show_header=True, header_style="bold white")
+    summary_table.add_column("Dataset", style="bold cyan")
+    summary_table.add_column("Participants", justify="center")
+    summary_table.add_column("Mean τ", justify="center")
+    summary_table.add_column("Min τ", justify="center")
+    summary_table.add_column("Max τ", justify="center")
+    summary_table.add_column("Mean ρ", justify="center")
+    summary_table.add_column("Top-10", justify="center")
+    summary_table.add_column("Top-20", justify="center")
+
+    for row in summary.to_dict('records'):
+        summary_table.add_row(
+            str(row['Dataset']),
+            str(row['Participants']),
+            f"{row['Mean Kendall τ']:.3f}",
+            f"{row['Min Kendall τ']:.3f}",
+            f"{row['Max Kendall τ']:.3f}",
+            f"{row['Mean Spearman ρ']:.3f}",
+            f"{row['Mean Top 10 Overlap']:.0%}",
+            f"{row['Mean Top 20 Overlap']:.0%}"
+        )
+
+    console.print(summary_table)
+
+
+def main():
+    """Command-line entry point for the weekly batch report"""
+    parser = argparse.ArgumentParser(description="Unified dashboard for every dataset")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: all cores)")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Report directory (default: external exports)")
+    parser.add_argument("--resamples", type=int, default=BOOTSTRAP_RESAMPLES,
+                        help="Bootstrap resamples per participant (0 skips confidence intervals)")
+    args = parser.parse_args()
+
+    console = Console()
+    progress = lambda done, total: console.print(f"[dim]Analysed {done}/{total} datasets[/dim]")  # noqa: E731
+    report = run_batch_analysis(args.output_dir, args.workers, progress_callback=progress,
+                                n_resamples=args.resamples)
+
+    display_summary_table(console, report.summary)
+    console.print(f"[green]CSV report:[/green] {report.csv_path}")
+    console.print(f"[green]JSON report:[/green] {report.json_path}")
+
+
+if __name__ == "__main__":
+    main()
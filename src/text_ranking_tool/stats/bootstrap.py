@@ -0,0 +1,113 @@
+# src/text_ranking_tool/stats/bootstrap.py
+"""
+Batched bootstrap kernels for agreement metrics
+Items are resampled with replacement; every resample is evaluated as one row
+of a (resamples x items) array rather than in a Python loop
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from scipy.stats import rankdata
+
+# Rows of the pairwise sign matrix materialised at once by the Kendall kernel
+_KENDALL_BLOCK_ROWS = 256
+
+
+def resample_draws(n_items: int, n_resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """Item indices drawn with replacement, shape (n_resamples, n_items), sorted per row"""
+    return np.sort(rng.integers(0, n_items, size=(n_resamples, n_items)), axis=1)
+
+
+def draw_weights(draws: np.ndarray) -> np.ndarray:
+    """Multiplicity of each item in each resample, shape (n_resamples, n_items)"""
+    n_resamples, n_items = draws.shape
+    offsets = np.arange(n_resamples)[:, None] * n_items
+    counts = np.bincount((draws + offsets).ravel(), minlength=n_resamples * n_items)
+    return counts.reshape(n_resamples, n_items).astype(np.float32)
+
+
+def kendall_tau_batch(pos1: np.ndarray, pos2: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Kendall tau-b for every weighted resample.
+    Positions are tie-free, so the only ties come from repeated draws of the
+    same item, and tau-b reduces to sum_{i<j} w_i w_j s_ij / (n0 - sum C(w_i, 2)).
+    """
+    n_items = len(pos1)
+    x = pos1.astype(np.float32)
+    y = pos2.astype(np.float32)
+    numerator = np.zeros(weights.shape[0], dtype=np.float64)
+
+    for start in range(0, n_items, _KENDALL_BLOCK_ROWS):
+        stop = min(start + _KENDALL_BLOCK_ROWS, n_items)
+        signs = np.sign(x[start:stop, None] - x[None, :]) * np.sign(y[start:stop, None] - y[None, :])
+        numerator += np.einsum('rb,rb->r', weights[:, start:stop], weights @ signs.T, dtype=np.float64)
+
+    numerator /= 2  # every unordered pair was counted twice
+    totals = weights.sum(axis=1, dtype=np.float64)
+    n0 = totals * (totals - 1) / 2
+    tied = (weights.astype(np.float64) * (weights - 1) / 2).sum(axis=1)
+    return numerator / (n0 - tied)
+
+
+def spearman_rho_batch(pos1: np.ndarray, pos2: np.ndarray, draws: np.ndarray) -> np.ndarray:
+    """Spearman rho (average ranks for repeated draws) for every resample"""
+    ranks1 = rankdata(pos1[draws], axis=1)
+    ranks2 = rankdata(pos2[draws], axis=1)
+    ranks1 -= ranks1.mean(axis=1, keepdims=True)
+    ranks2 -= ranks2.mean(axis=1, keepdims=True)
+    numerator = np.einsum('ij,ij->i', ranks1, ranks2)
+    denominator = np.sqrt(np.einsum('ij,ij->i', ranks1, ranks1) * np.einsum('ij,ij->i', ranks2, ranks2))
+    return numerator / denominator
+
+
+def top_k_overlap_batch(pos1: np.ndarray, pos2: np.ndarray, draws: np.ndarray,
+                        ks: Sequence[int]) -> Dict[int, np.ndarray]:
+    """Top-k overlap of the re-ranked draws in every resample, for several k"""
+    # Stable argsort keeps repeated draws in the same relative order in both rankings
+    ranks1 = np.argsort(np.argsort(pos1[draws], axis=1, kind='stable'), axis=1) + 1
+    ranks2 = np.argsort(np.argsort(pos2[draws], axis=1, kind='stable'), axis=1) + 1
+    entry_depth = np.maximum(ranks1, ranks2)
+    return {k: (entry_depth <= k).sum(axis=1) / k for k in ks}
+
+
+def bootstrap_samples(pos1: np.ndarray, pos2: np.ndarray, n_resamples: int,
+                      ks: Sequence[int], seed: Optional[int]) -> Dict[str, np.ndarray]:
+    """Bootstrap distributions for Kendall, Spearman and top-k overlaps"""
+    rng = np.random.default_rng(seed)
+    draws = resample_draws(len(pos1), n_resamples, rng)
+    # Resamples that drew a single item repeatedly have undefined correlations (NaN)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        samples = {
+            'kendall_tau': kendall_tau_batch(pos1, pos2, draw_weights(draws)),
+            'spearman_rho': spearman_rho_batch(pos1, pos2, draws),
+        }
+    for k, values in top_k_overlap_batch(pos1, pos2, draws, ks).items():
+        samples[f'overlap_at_{k}'] = values
+    return samples
+
+
+def _bootstrap_worker(args) -> Dict[str, np.ndarray]:
+    """Process pool entry point: one independent slice of resamples"""
+    pos1, pos2, n_resamples, ks, seed = args
+    return bootstrap_samples(pos1, pos2, n_resamples, ks, seed)
+
+
+def parallel_bootstrap_samples(pos1: np.ndarray, pos2: np.ndarray, n_resamples: int,
+                               ks: Sequence[int], seed: Optional[int] = None,
+                               n_jobs: int = 1) -> Dict[str, np.ndarray]:
+    """Split resamples across a process pool (n_jobs=-1 uses every core)"""
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs <= 1:
+        return bootstrap_samples(pos1, pos2, n_resamples, ks, seed)
+
+    # Independent child streams keep results reproducible for a given seed
+    child_seeds = np.random.SeedSequence(seed).spawn(n_jobs)
+    sizes = [len(chunk) for chunk in np.array_split(np.arange(n_resamples), n_jobs) if len(chunk)]
+    tasks = [(pos1, pos2, size, list(ks), child) for size, child in zip(sizes, child_seeds)]
+
+    with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+        parts: List[Dict[str, np.ndarray]] = list(executor.map(_bootstrap_worker, tasks))
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
@@ -0,0 +1,102 @@
+# src/text_ranking_tool/stats/matrix_engine.py
+"""
+Vectorised correlation matrix engine for the admin analysis screens
+Builds one participant x item position matrix and computes every metric
+over the upper triangle only, mirroring results into symmetric matrices
+"""
+
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+from scipy.stats import kendalltau, spearmanr
+
+# Above this many items the sign-matrix Kendall kernel needs more memory
+# than it saves, so Kendall falls back to SciPy per upper-triangle pair
+SIGN_MATRIX_MAX_ITEMS = 400
+
+# Maximum number of float32 cells held per sign-matrix chunk
+_SIGN_CHUNK_CELLS = 4_000_000
+
+
+def build_rank_matrix(participants_data: Dict[str, List[str]]) -> Tuple[List[str], List[str], np.ndarray]:
+    """Build (participants, items, positions) with 1-based positions and NaN for unranked items"""
+    participants = list(participants_data.keys())
+    item_index: Dict[str, int] = {}
+    for ranking in participants_data.values():
+        for item in ranking:
+            if item not in item_index:
+                item_index[item] = len(item_index)
+
+    positions = np.full((len(participants), len(item_index)), np.nan)
+    for row, participant in enumerate(participants):
+        ranking = participants_data[participant]
+        columns = np.fromiter((item_index[item] for item in ranking), dtype=np.intp, count=len(ranking))
+        positions[row, columns] = np.arange(1, len(ranking) + 1)
+
+    return participants, list(item_index.keys()), positions
+
+
+def top_k_overlap_matrix(positions: np.ndarray, k: int) -> np.ndarray:
+    """Top-k overlap for all participant pairs as one indicator matrix product"""
+    in_top_k = (positions <= k).astype(np.float64)  # NaN compares False
+    return (in_top_k @ in_top_k.T) / k
+
+
+def _kendall_sign_matrix(ranks: np.ndarray) -> np.ndarray:
+    """Kendall tau for all rows of a complete rank matrix via pairwise sign products"""
+    n_rows, n_items = ranks.shape
+    left, right = np.triu_indices(n_items, k=1)
+    n_pairs = len(left)
+    chunk = max(1, _SIGN_CHUNK_CELLS // max(n_rows, 1))
+
+    concordance = np.zeros((n_rows, n_rows), dtype=np.float64)
+    for start in range(0, n_pairs, chunk):
+        stop = start + chunk
+        signs = np.sign(ranks[:, left[start:stop]] - ranks[:, right[start:stop]]).astype(np.float32)
+        concordance += signs @ signs.T
+    return concordance / n_pairs
+
+
+def _pairwise_matrix(positions: np.ndarray, present: np.ndarray, metric) -> np.ndarray:
+    """Evaluate a SciPy rank metric on common items over the upper triangle, mirrored"""
+    n_rows = positions.shape[0]
+    matrix = np.zeros((n_rows, n_rows))
+    for i in range(n_rows):
+        for j in range(i + 1, n_rows):
+            common = present[i] & present[j]
+            if common.sum() >= 2:
+                value, _ = metric(positions[i, common], positions[j, common])
+                matrix[i, j] = matrix[j, i] = float(value)
+    return matrix
+
+
+def compute_correlation_matrices(participants_data: Dict[str, List[str]],
+                                 top_k: Sequence[int] = (10, 20)) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """
+    Compute Kendall, Spearman and top-k overlap matrices for all participants.
+    Returns participants in row order and a dict of symmetric matrices keyed
+    'kendall', 'spearman' and 'overlap_<k>'.
+    """
+    participants, _, positions = build_rank_matrix(participants_data)
+    n_rows, n_items = positions.shape
+    present = ~np.isnan(positions)
+
+    if n_items >= 2 and present.all():
+        # Every participant ranked the same items: positions already are ranks
+        spearman = np.atleast_2d(np.corrcoef(positions))
+        if n_items <= SIGN_MATRIX_MAX_ITEMS:
+            kendall = _kendall_sign_matrix(positions)
+        else:
+            kendall = _pairwise_matrix(positions, present, kendalltau)
+    else:
+        kendall = _pairwise_matrix(positions, present, kendalltau)
+        spearman = _pairwise_matrix(positions, present, spearmanr)
+
+    matrices = {'kendall': kendall, 'spearman': spearman}
+    for k in top_k:
+        matrices[f'overlap_{k}'] = top_k_overlap_matrix(positions, k)
+
+    # Perfect self-correlation on the diagonal
+    for matrix in matrices.values():
+        np.fill_diagonal(matrix, 1.0)
+
+    return participants, matrices
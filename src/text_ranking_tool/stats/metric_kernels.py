@@ -0,0 +1,104 @@
+# src/text_ranking_tool/stats/metric_kernels.py
+"""
+NumPy metric kernels operating on aligned position arrays
+Shared by StatisticsCalculator and StatsForUI - assumes perfect data
+"""
+
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+
+# Pairwise comparisons materialised per block by kendall_distance
+_KENDALL_BLOCK_CELLS = 1 << 22
+
+
+def aligned_positions(ranking1: List[str], ranking2: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """1-based positions of the common items in both rankings, ordered as in ranking1"""
+    pos2_lookup = {text: i + 1 for i, text in enumerate(ranking2)}
+    pos1 = []
+    pos2 = []
+    for i, text in enumerate(ranking1):
+        position = pos2_lookup.get(text)
+        if position is not None:
+            pos1.append(i + 1)
+            pos2.append(position)
+    return np.asarray(pos1, dtype=np.int64), np.asarray(pos2, dtype=np.int64)
+
+
+def pearson(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation coefficient"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    dx = x - x.mean()
+    dy = y - y.mean()
+    return float(dx @ dy / np.sqrt((dx @ dx) * (dy @ dy)))
+
+
+def kendall_distance(pos1: np.ndarray, pos2: np.ndarray) -> int:
+    """
+    Number of pairs i < j where (pos1[i] < pos1[j]) != (pos2[i] < pos2[j]).
+    Exact count with the strict comparisons of the original pairwise loop (tied
+    values count as "not less"), vectorised over blocks of rows to bound memory.
+    """
+    pos1 = np.asarray(pos1)
+    pos2 = np.asarray(pos2)
+    n = len(pos1)
+    block = max(1, _KENDALL_BLOCK_CELLS // max(n, 1))
+    columns = np.arange(n)
+    disagreements = 0
+    for start in range(0, n, block):
+        rows = np.arange(start, min(start + block, n))
+        less1 = pos1[rows, None] < pos1[None, :]
+        less2 = pos2[rows, None] < pos2[None, :]
+        upper = columns[None, :] > rows[:, None]
+        disagreements += int(np.count_nonzero((less1 != less2) & upper))
+    return disagreements
+
+
+def footrule_distance(pos1: np.ndarray, pos2: np.ndarray) -> float:
+    """Normalised Spearman's footrule distance"""
+    n = len(pos1)
+    footrule_sum = int(np.abs(np.asarray(pos1) - np.asarray(pos2)).sum())
+    max_footrule = n * (n - 1) // 2 if n % 2 == 0 else n * n // 2
+    return footrule_sum / max_footrule
+
+
+def avg_rank_diff(pos1: np.ndarray, pos2: np.ndarray) -> float:
+    """Mean absolute position difference over common items"""
+    return float(np.abs(np.asarray(pos1) - np.asarray(pos2)).mean())
+
+
+def overlap_counts(pos1: np.ndarray, pos2: np.ndarray, depth: int) -> np.ndarray:
+    """
+    |top-d(ranking1) & top-d(ranking2)| for every depth d = 1..depth in one pass.
+    A common item is in both top-d sets once d reaches the larger of its positions.
+    """
+    entry_depth = np.maximum(pos1, pos2)
+    entry_depth = entry_depth[entry_depth <= depth]
+    return np.cumsum(np.bincount(entry_depth, minlength=depth + 1)[1:])
+
+
+def top_k_overlap_curve(pos1: np.ndarray, pos2: np.ndarray, ks: Sequence[int]) -> Dict[int, float]:
+    """Top-k overlap (divided by k) for many k values from one cumulative pass"""
+    if not ks:
+        return {}
+    counts = overlap_counts(pos1, pos2, max(ks))
+    return {k: float(counts[k - 1]) / k for k in ks}
+
+
+def rank_biased_overlap(pos1: np.ndarray, pos2: np.ndarray, depth: int, p: float = 0.9) -> float:
+    """Rank-Biased Overlap truncated at the given depth"""
+    if depth < 1:
+        return 0.0
+    counts = overlap_counts(pos1, pos2, depth)
+    depths = np.arange(1, depth + 1)
+    return float((1 - p) * np.sum(counts / depths * p ** (depths - 1)))
+
+
+def average_precision_at_k(ranking1: List[str], ranking2: List[str], k: int) -> float:
+    """Average precision of ranking2's top-k against ranking1's top-k as the relevant set"""
+    relevant = set(ranking1[:k])
+    hits = np.fromiter((text in relevant for text in ranking2[:k]), dtype=bool)
+    found = np.cumsum(hits)
+    ranks = np.arange(1, len(hits) + 1)
+    precision_sum = float(np.sum(found[hits] / ranks[hits]))
+    return precision_sum / min(k, len(relevant))
@@ -0,0 +1,144 @@
+# src/text_ranking_tool/stats/pairwise_agreement.py
+"""
+Pairwise-level inter-annotator agreement from session comparison memories
+Answers are sparse-joined across users on canonicalised (low, high) pairs,
+so cost grows with the number of answers rather than users x answers
+"""
+
+from typing import Dict, List, NamedTuple, Tuple
+import numpy as np
+from ..ranking.session_manager import get_session_manager
+
+ComparisonMemory = Dict[Tuple[str, str], bool]
+
+
+class PairwiseAgreementResult(NamedTuple):
+    """Agreement on raw pairwise answers for one dataset"""
+    users: List[str]
+    judgments: int                  # answers pooled from all sessions
+    shared_pairs: int               # pairs judged by at least two users
+    observed_agreement: float       # share of agreeing rater pairs on shared pairs
+    krippendorff_alpha: float       # nominal alpha over shared pairs
+    user_agreement: np.ndarray      # users x users agreement rate (NaN: nothing shared)
+    user_overlap: np.ndarray        # users x users count of pairs both judged
+    hotspots: List[Dict]            # items with the most contested pairs, worst first
+
+
+def load_comparison_memories(dataset_stem: str, usernames: List[str]) -> Dict[str, ComparisonMemory]:
+    """Load each user's comparison memory for a dataset (users without a session are skipped)"""
+    session_manager = get_session_manager()
+    memories = {}
+    for username in usernames:
+        if session_manager.has_session(username, dataset_stem):
+            memory, _ = session_manager.load_session(username, dataset_stem)
+            if memory:
+                memories[username] = memory
+    return memories
+
+
+def _canonical_answers(memories: Dict[str, ComparisonMemory]):
+    """Flatten memories into (user, low item, high item, low-is-more-negative) arrays"""
+    item_index: Dict[str, int] = {}
+    users, lows, highs, low_wins = [], [], [], []
+
+    for user_idx, memory in enumerate(memories.values()):
+        for (text_id_1, text_id_2), result in memory.items():
+            first = item_index.setdefault(text_id_1, len(item_index))
+            second = item_index.setdefault(text_id_2, len(item_index))
+            users.append(user_idx)
+            if first < second:
+                lows.append(first)
+                highs.append(second)
+                low_wins.append(bool(result))
+            else:
+                lows.append(second)
+                highs.append(first)
+                low_wins.append(not result)
+
+    return (list(item_index.keys()), np.asarray(users, dtype=np.int64), np.asarray(lows, dtype=np.int64),
+            np.asarray(highs, dtype=np.int64), np.asarray(low_wins, dtype=bool))
+
+
+def compute_pairwise_agreement(memories: Dict[str, ComparisonMemory], top_hotspots: int = 10) -> PairwiseAgreementResult:
+    """Observed agreement, Krippendorff's alpha, user x user agreement and disagreement hotspots"""
+    users = list(memories.keys())
+    n_users = len(users)
+    items, user_ids, lows, highs, low_wins = _canonical_answers(memories)
+    n_items = max(len(items), 1)
+
+    empty_matrix = np.full((n_users, n_users), np.nan)
+    if len(user_ids) == 0:
+        return PairwiseAgreementResult(users, 0, 0, float('nan'), float('nan'),
+                                       empty_matrix, np.zeros((n_users, n_users), dtype=int), [])
+
+    # Sparse join: one unit per canonical pair
+    pair_keys, unit = np.unique(lows * n_items + highs, return_inverse=True)
+    n_units = len(pair_keys)
+    raters = np.bincount(unit, minlength=n_units)
+    votes_low = np.bincount(unit, weights=low_wins, minlength=n_units)
+    votes_high = raters - votes_low
+
+    shared = raters >= 2
+    rater_pairs = raters * (raters - 1) / 2
+    agreeing_pairs = votes_low * (votes_low - 1) / 2 + votes_high * (votes_high - 1) / 2
+    total_rater_pairs = rater_pairs[shared].sum()
+    observed = float(agreeing_pairs[shared].sum() / total_rater_pairs) if total_rater_pairs else float('nan')
+
+    # Krippendorff's alpha (nominal, two values): 1 - (n - 1) * o_01 / (n_0 * n_1).
+    # Which item of a pair is "low" is arbitrary, so every unit is counted in both
+    # orientations: n_0 = n_1 = answers and o_01 doubles, keeping alpha orientation-free
+    n_values = 2 * raters[shared].sum()
+    o_01 = 2 * (votes_low[shared] * votes_high[shared] / (raters[shared] - 1)).sum()
+    alpha = float(1 - (n_values - 1) * o_01 / (n_values / 2) ** 2) if n_values else float('nan')
+
+    # User x user agreement on shared units via sign-matrix products
+    shared_units = np.flatnonzero(shared)
+    column = np.full(n_units, -1, dtype=np.int64)
+    column[shared_units] = np.arange(len(shared_units))
+    in_shared = column[unit] >= 0
+    said_low = np.zeros((n_users, len(shared_units)))
+    said_high = np.zeros((n_users, len(shared_units)))
+    said_low[user_ids[in_shared], column[unit[in_shared]]] = low_wins[in_shared]
+    said_high[user_ids[in_shared], column[unit[in_shared]]] = ~low_wins[in_shared]
+    judged = said_low + said_high
+    overlap = judged @ judged.T
+    agree = said_low @ said_low.T + said_high @ said_high.T
+    with np.errstate(invalid='ignore', divide='ignore'):
+        user_agreement = np.where(overlap > 0, agree / overlap, np.nan)
+
+    # Per-item hotspots: disagreeing rater pairs over all shared pairs involving the item
+    disagreeing = (rater_pairs - agreeing_pairs) * shared
+    contested = (np.minimum(votes_low, votes_high) > 0) & shared
+    unit_low = pair_keys // n_items
+    unit_high = pair_keys % n_items
+    item_disagreement = (np.bincount(unit_low, weights=disagreeing, minlength=n_items)
+                         + np.bincount(unit_high, weights=disagreeing, minlength=n_items))
+    item_rater_pairs = (np.bincount(unit_low, weights=rater_pairs * shared, minlength=n_items)
+                        + np.bincount(unit_high, weights=rater_pairs * shared, minlength=n_items))
+    item_contested = (np.bincount(unit_low, weights=contested, minlength=n_items)
+                      + np.bincount(unit_high, weights=contested, minlength=n_items))
+    item_shared = (np.bincount(unit_low, weights=shared, minlength=n_items)
+                   + np.bincount(unit_high, weights=shared, minlength=n_items))
+
+    hotspots = []
+    candidates = np.flatnonzero(item_contested > 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rates = item_disagreement / item_rater_pairs
+    for idx in candidates[np.lexsort((-item_contested[candidates], -rates[candidates]))][:top_hotspots]:
+        hotspots.append({
+            'id': items[idx],
+            'shared_pairs': int(item_shared[idx]),
+            'contested_pairs': int(item_contested[idx]),
+            'disagreement': float(rates[idx])
+        })
+
+    return PairwiseAgreementResult(
+        users=users,
+        judgments=len(user_ids),
+        shared_pairs=len(shared_units),
+        observed_agreement=observed,
+        krippendorff_alpha=alpha,
+        user_agreement=user_agreement,
+        user_overlap=overlap.astype(int),
+        hotspots=hotspots
+    )
@@ -2,12 +2,15 @@
 Statistical analysis functionality for text ranking tool
 Assumes perfect data - no validation, pure calculations
 """
-import csv
-import statistics
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, NamedTuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, NamedTuple
 from scipy.stats import kendalltau, spearmanr
 import numpy as np
+from . import metric_kernels
+from .bootstrap import parallel_bootstrap_samples
+from ..data.csv_loader import iter_csv_columns
 
 class RankingComparisonResult(NamedTuple):
     """Results from comparing two rankings"""
@@ -19,6 +22,18 @@ class RankingComparisonResult(NamedTuple):
     overlap_at_10: float
     overlap_at_20: float
 
+class BootstrapInterval(NamedTuple):
+    """Point estimate with a percentile bootstrap confidence interval"""
+    estimate: float
+    lower: float
+    upper: float
+
+# progress_callback(completed_pairs, total_pairs)
+ProgressCallback = Callable[[int, int], None]
+
+# Below this many pairs, process start-up costs more than the comparisons
+_MIN_PAIRS_FOR_POOL = 64
+
 class StatisticsCalculator:
     """Pure statistical calculations for text rankings - assumes perfect data"""
 
@@ -37,17 +52,7 @@ class StatisticsCalculator:
     @staticmethod
     def calculate_kendall_distance(list1: List[int], list2: List[int]) -> int:
         """Calculate Kendall tau distance (number of pairwise disagreements)"""
-        n = len(list1)
-        arr1 = np.array(list1)
-        arr2 = np.array(list2)
-        
-        disagreements = 0
-        for i in range(n):
-            for j in range(i + 1, n):
-                if (arr1[i] < arr1[j]) != (arr2[i] < arr2[j]):
-                    disagreements += 1
-        
-        return disagreements
+        return metric_kernels.kendall_distance(np.asarray(list1), np.asarray(list2))
 
     @staticmethod
     def calculate_normalized_kendall_distance(list1: List[int], list2: List[int]) -> float:
@@ -60,20 +65,45 @@ class StatisticsCalculator:
     @staticmethod
     def calculate_top_k_overlap(ranking1: List[str], ranking2: List[str], k: int) -> float:
         """Calculate overlap between top-k items in two rankings"""
-        top_k_1 = set(ranking1[:k])
-        top_k_2 = set(ranking2[:k])
-        overlap = len(top_k_1 & top_k_2)
-        return overlap / k
+        return StatisticsCalculator.calculate_top_k_overlap_curve(ranking1, ranking2, [k])[k]
+
+    @staticmethod
+    def calculate_top_k_overlap_curve(ranking1: List[str], ranking2: List[str], ks: List[int]) -> Dict[int, float]:
+        """Calculate top-k overlap for several k values in one cumulative pass"""
+        pos1, pos2 = metric_kernels.aligned_positions(ranking1, ranking2)
+        return metric_kernels.top_k_overlap_curve(pos1, pos2, ks)
+
+    @staticmethod
+    def bootstrap_confidence_intervals(ranking1: List[str], ranking2: List[str], n_resamples: int = 1000,
+                                       confidence: float = 0.95, top_k: Tuple[int, ...] = (10, 20),
+                                       seed: Optional[int] = None, n_jobs: int = 1
+                                       ) -> Dict[str, BootstrapInterval]:
+        """
+        Percentile bootstrap CIs (resampling common items) for Kendall tau,
+        Spearman rho and top-k overlaps. All resamples are evaluated as batched
+        array operations; n_jobs > 1 (or -1 for all cores) splits them across processes.
+        """
+        positions1, positions2 = metric_kernels.aligned_positions(ranking1, ranking2)
+        estimates = {
+            'kendall_tau': StatisticsCalculator.calculate_kendall_tau(positions1, positions2),
+            'spearman_rho': StatisticsCalculator.calculate_spearman_correlation(positions1, positions2),
+        }
+        for k, overlap in metric_kernels.top_k_overlap_curve(positions1, positions2, top_k).items():
+            estimates[f'overlap_at_{k}'] = overlap
+        
+        samples = parallel_bootstrap_samples(positions1, positions2, n_resamples, top_k, seed, n_jobs)
+        tail = (1 - confidence) / 2 * 100
+        intervals = {}
+        for metric, estimate in estimates.items():
+            lower, upper = np.nanpercentile(samples[metric], [tail, 100 - tail])
+            intervals[metric] = BootstrapInterval(estimate, float(lower), float(upper))
+        return intervals
 
     @staticmethod
     def load_ranking_from_export_csv(csv_file_path: Path) -> List[str]:
         """Load ranking from exported CSV file"""
-        ranking = []
-        with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = sorted(reader, key=lambda x: int(x['new_ranking']))
-            ranking = [row['id'] for row in rows]
-        return ranking
+        rows = sorted(iter_csv_columns(csv_file_path, ('id', 'new_ranking')), key=lambda x: int(x[1]))
+        return [text_id for text_id, _ in rows]
 
     @staticmethod
     def compare_two_csv_files(csv_file1: Path, csv_file2: Path) -> RankingComparisonResult:
@@ -87,96 +117,91 @@ class StatisticsCalculator:
     def compare_rankings_from_lists(ranking1: List[str], ranking2: List[str]) -> RankingComparisonResult:
         """Compare two ranking lists directly"""
         
-        # Find common texts
-        common_texts = list(set(ranking1) & set(ranking2))
-        
-        # Create position mappings (1-based ranking)
-        pos1 = {text: i + 1 for i, text in enumerate(ranking1)}
-        pos2 = {text: i + 1 for i, text in enumerate(ranking2)}
-        
-        # Extract positions for common texts
-        positions1 = [pos1[text] for text in common_texts]
-        positions2 = [pos2[text] for text in common_texts]
+        # 1-based positions of the common texts in both rankings
+        positions1, positions2 = metric_kernels.aligned_positions(ranking1, ranking2)
         
         # Calculate all metrics
         tau = StatisticsCalculator.calculate_kendall_tau(positions1, positions2)
         spearman = StatisticsCalculator.calculate_spearman_correlation(positions1, positions2)
-        kendall_dist = StatisticsCalculator.calculate_kendall_distance(positions1, positions2)
-        
-        # Average rank difference
-        rank_diffs = [abs(p1 - p2) for p1, p2 in zip(positions1, positions2)]
-        avg_rank_diff = statistics.mean(rank_diffs)
+        kendall_dist = metric_kernels.kendall_distance(positions1, positions2)
+        avg_rank_diff = metric_kernels.avg_rank_diff(positions1, positions2)
         
-        # Top-k overlaps
-        overlap_10 = StatisticsCalculator.calculate_top_k_overlap(ranking1, ranking2, 10)
-        overlap_20 = StatisticsCalculator.calculate_top_k_overlap(ranking1, ranking2, 20)
+        # Top-k overlaps from one cumulative pass
+        overlaps = metric_kernels.top_k_overlap_curve(positions1, positions2, [10, 20])
         
         return RankingComparisonResult(
             kendall_tau=tau,
             spearman_rho=spearman,
             kendall_distance=kendall_dist,
             avg_rank_diff=avg_rank_diff,
-            common_items=len(common_texts),
-            overlap_at_10=overlap_10,
-            overlap_at_20=overlap_20
+            common_items=len(positions1),
+            overlap_at_10=overlaps[10],
+            overlap_at_20=overlaps[20]
         )
 
     @staticmethod
-    def batch_compare_csv_files(csv_files: List[Path]) -> Dict[Tuple[str, str], RankingComparisonResult]:
-        """Compare all pairs of CSV files in a batch"""
-        results = {}
-        
-        for i in range(len(csv_files)):
-            for j in range(i + 1, len(csv_files)):
-                file1, file2 = csv_files[i], csv_files[j]
-                key = (file1.name, file2.name)
-                comparison = StatisticsCalculator.compare_two_csv_files(file1, file2)
-                results[key] = comparison
-        
-        return results
+    def batch_compare_csv_files(csv_files: List[Path], max_workers: Optional[int] = None,
+                                progress_callback: Optional[ProgressCallback] = None
+                                ) -> Dict[Tuple[str, str], RankingComparisonResult]:
+        """Compare all pairs of CSV files in a batch (each file parsed exactly once)"""
+        return dict(StatisticsCalculator.iter_batch_comparisons(csv_files, max_workers, progress_callback))
+
+    @staticmethod
+    def iter_batch_comparisons(csv_files: List[Path], max_workers: Optional[int] = None,
+                               progress_callback: Optional[ProgressCallback] = None
+                               ) -> Iterator[Tuple[Tuple[str, str], RankingComparisonResult]]:
+        """
+        Stream ((name1, name2), result) for all file pairs as they complete.
+        Every file is parsed once into a ranking cache; pairs are then evaluated
+        in a process pool (max_workers=1 keeps everything in-process).
+        progress_callback(done, total) is called after each completed pair.
+        """
+        rankings = [StatisticsCalculator.load_ranking_from_export_csv(path) for path in csv_files]
+        names = [path.name for path in csv_files]
+        pairs = [(i, j) for i in range(len(csv_files)) for j in range(i + 1, len(csv_files))]
+        total = len(pairs)
+        done = 0
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        if max_workers <= 1 or total < _MIN_PAIRS_FOR_POOL:
+            for i, j in pairs:
+                done += 1
+                result = StatisticsCalculator.compare_rankings_from_lists(rankings[i], rankings[j])
+                if progress_callback:
+                    progress_callback(done, total)
+                yield (names[i], names[j]), result
+            return
+
+        # Rankings are shipped to each worker once; tasks only carry index chunks
+        chunk_size = max(1, total // (max_workers * 4))
+        chunks = [pairs[start:start + chunk_size] for start in range(0, total, chunk_size)]
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_pair_worker,
+                                 initargs=(rankings,)) as executor:
+            futures = [executor.submit(_compare_pair_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for (i, j), result in future.result():
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total)
+                    yield (names[i], names[j]), result
 
     @staticmethod
     def calculate_pearson_correlation(list1: List[float], list2: List[float]) -> float:
         """Calculate Pearson correlation coefficient"""
-        n = len(list1)
-        mean_x = sum(list1) / n
-        mean_y = sum(list2) / n
-        
-        numerator = sum((list1[i] - mean_x) * (list2[i] - mean_y) for i in range(n))
-        sum_sq_x = sum((list1[i] - mean_x) ** 2 for i in range(n))
-        sum_sq_y = sum((list2[i] - mean_y) ** 2 for i in range(n))
-        
-        denominator = (sum_sq_x * sum_sq_y) ** 0.5
-        return numerator / denominator
+        return metric_kernels.pearson(np.asarray(list1), np.asarray(list2))
 
     @staticmethod
     def calculate_rank_biased_overlap(ranking1: List[str], ranking2: List[str], p: float = 0.9) -> float:
         """Calculate Rank-Biased Overlap (RBO) between two rankings"""
-        max_len = min(len(ranking1), len(ranking2))
-        rbo_sum = 0.0
-        
-        for d in range(1, max_len + 1):
-            set1 = set(ranking1[:d])
-            set2 = set(ranking2[:d])
-            overlap_size = len(set1 & set2)
-            rbo_sum += overlap_size / d * (p ** (d - 1))
-        
-        return (1 - p) * rbo_sum
+        pos1, pos2 = metric_kernels.aligned_positions(ranking1, ranking2)
+        return metric_kernels.rank_biased_overlap(pos1, pos2, min(len(ranking1), len(ranking2)), p)
 
     @staticmethod
     def calculate_average_precision_at_k(ranking1: List[str], ranking2: List[str], k: int) -> float:
         """Calculate Average Precision at K (how many of top-k from ranking1 appear in top-k of ranking2)"""
-        top_k_1 = set(ranking1[:k])
-        
-        precision_sum = 0.0
-        relevant_found = 0
-        
-        for i in range(min(k, len(ranking2))):
-            if ranking2[i] in top_k_1:
-                relevant_found += 1
-                precision_sum += relevant_found / (i + 1)
-        
-        return precision_sum / min(k, len(top_k_1))
+        return metric_kernels.average_precision_at_k(ranking1, ranking2, k)
 
     @staticmethod
     def calculate_weighted_tau(list1: List[int], list2: List[int], weights: List[float]) -> float:
@@ -200,13 +225,21 @@ class StatisticsCalculator:
     @staticmethod
     def calculate_footrule_distance(ranking1: List[str], ranking2: List[str]) -> float:
         """Calculate Spearman's footrule distance (normalized)"""
-        common_texts = list(set(ranking1) & set(ranking2))
-        
-        pos1 = {text: i + 1 for i, text in enumerate(ranking1)}
-        pos2 = {text: i + 1 for i, text in enumerate(ranking2)}
-        
-        footrule_sum = sum(abs(pos1[text] - pos2[text]) for text in common_texts)
-        n = len(common_texts)
-        max_footrule = n * (n - 1) // 2 if n % 2 == 0 else n * n // 2
-        
-        return footrule_sum / max_footrule
+        pos1, pos2 = metric_kernels.aligned_positions(ranking1, ranking2)
+        return metric_kernels.footrule_distance(pos1, pos2)
+
+
+# Process pool workers for batch comparisons (module level so they pickle)
+_worker_rankings: List[List[str]] = []
+
+def _init_pair_worker(rankings: List[List[str]]):
+    """Receive the parsed ranking cache once per worker process"""
+    global _worker_rankings
+    _worker_rankings = rankings
+
+def _compare_pair_chunk(pairs: List[Tuple[int, int]]) -> List[Tuple[Tuple[int, int], RankingComparisonResult]]:
+    """Compare a chunk of (i, j) index pairs against the worker's ranking cache"""
+    return [
+        ((i, j), StatisticsCalculator.compare_rankings_from_lists(_worker_rankings[i], _worker_rankings[j]))
+        for i, j in pairs
+    ]
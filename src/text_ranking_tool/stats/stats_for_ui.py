@@ -4,12 +4,19 @@ Handles data loading, aggregation, and formatting for analysis displays
 Simple error handling - any error bubbles up to UX
 """
 
-import csv
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List
-import statistics
-from .statistics_calculator import StatisticsCalculator
+from typing import Dict, List, Optional
+from .statistics_calculator import StatisticsCalculator, BootstrapInterval
+from . import metric_kernels
+from .matrix_engine import compute_correlation_matrices
+from .analysis_cache import get_analysis_cache, file_fingerprint
+from .pairwise_agreement import PairwiseAgreementResult, compute_pairwise_agreement, load_comparison_memories
+from ..ranking.session_manager import get_session_manager
+from ..export.manifest import get_export_manifest
+from ..data.csv_loader import iter_csv_columns
+from ..data.dataset import load_dataset
 
 class StatsForUI:
     """UI-focused statistics functions with simple error handling"""
@@ -17,22 +24,24 @@ class StatsForUI:
     @staticmethod
     def load_ranking_from_export_csv(csv_file_path: Path) -> List[str]:
         """Load human ranking from exported CSV file (new_ranking column)"""
-        ranking = []
-        with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = sorted(reader, key=lambda x: int(x['new_ranking']))
-            ranking = [row['id'] for row in rows]
-        return ranking
+        rows = sorted(iter_csv_columns(csv_file_path, ('id', 'new_ranking')), key=lambda x: int(x[1]))
+        return [text_id for text_id, _ in rows]
 
     @staticmethod
     def load_machine_ranking_from_csv(csv_file_path: Path) -> List[str]:
-        """Load machine ranking from internal data CSV file (ranking column)"""
-        ranking = []
-        with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            rows = sorted(reader, key=lambda x: int(x['ranking']))
-            ranking = [row['id'] for row in rows]
-        return ranking
+        """Load machine ranking from internal data CSV file (ranking column); raises on unparsable rankings"""
+        # Served from the parsed dataset cache shared with the app and the exporter
+        dataset = load_dataset(str(csv_file_path))
+        if not dataset:
+            return []
+        
+        # A missing rank would silently shift the machine baseline of every correlation
+        unparsable = [dataset.ids[i] for i in np.flatnonzero(np.isnan(dataset.ranking))]
+        if unparsable:
+            shown = ', '.join(unparsable[:5]) + (', ...' if len(unparsable) > 5 else '')
+            raise ValueError(f"Invalid machine ranking for {len(unparsable)} text(s) in "
+                             f"{Path(csv_file_path).name}: {shown}")
+        return dataset.ids_by_ranking()
 
     @staticmethod
     def get_available_datasets(internal_exports_dir: Path, internal_data_dir: Path) -> List[str]:
@@ -47,91 +56,90 @@ class StatsForUI:
 
 
     @staticmethod
-    def load_all_participants_data(dataset_stem: str, internal_exports_dir: Path, 
-                                 internal_data_dir: Path, user_mapping: Dict[str, str]) -> Dict[str, List[str]]:
-        """Load rankings for all participants including machine for a specific dataset"""
-        participants_data = {}
+    def resolve_participant_sources(dataset_stem: str, internal_exports_dir: Path,
+                                    internal_data_dir: Path, user_mapping: Dict[str, str]) -> Dict[str, Path]:
+        """Map each participant (including Machine) to the CSV its ranking is read from"""
+        sources = {}
         
-        # Load machine ranking
+        # Machine ranking comes from the dataset itself
         machine_file = internal_data_dir / f"{dataset_stem}.csv"
         if machine_file.exists():
-            participants_data['Machine'] = StatsForUI.load_machine_ranking_from_csv(machine_file)
+            sources['Machine'] = machine_file
         
-        # LOAD human rankings
+        manifest = get_export_manifest(internal_exports_dir)
         for display_name, user_id in user_mapping.items():
-            # FIND export file for this user and dataset inside INTERNAL_EXPORTS_DIR
-            pattern = f"{user_id}_{dataset_stem}_*.csv"
-            matching_files = list(internal_exports_dir.glob(pattern))
+            # Export history for this user and dataset (any algorithm) from the manifest
+            exports = [path for path in manifest.history(user_id, dataset_stem) if path.exists()]
             
-            if matching_files:
-                # USE most recent file if multiple exist
-                latest_file = max(matching_files, key=lambda f: f.stat().st_mtime)
-                participants_data[display_name] = StatsForUI.load_ranking_from_export_csv(latest_file)
-                # PRINT warning
-                print(f"\033[1;38;5;208m⚠ {display_name}\033[0m has multiple exports for dataset " 
-                      f"\033[1;38;5;208m{dataset_stem}\033[0m. Using latest: {latest_file.name}\n")
-                
+            if exports:
+                # USE most recent file if multiple exist (same rule as the exporter)
+                latest_file = exports[-1]
+                sources[display_name] = latest_file
+                if len(exports) > 1:
+                    print(f"\033[1;38;5;208m⚠ {display_name}\033[0m has multiple exports for dataset " 
+                          f"\033[1;38;5;208m{dataset_stem}\033[0m. Using latest: {latest_file.name}\n")
+        
+        return sources
+
+    @staticmethod
+    def load_all_participants_data(dataset_stem: str, internal_exports_dir: Path, 
+                                 internal_data_dir: Path, user_mapping: Dict[str, str],
+                                 sources: Optional[Dict[str, Path]] = None) -> Dict[str, List[str]]:
+        """Load rankings for all participants including machine for a specific dataset"""
+        if sources is None:
+            sources = StatsForUI.resolve_participant_sources(
+                dataset_stem, internal_exports_dir, internal_data_dir, user_mapping)
+        
+        cache = get_analysis_cache()
+        participants_data = {}
+        
+        # Parsed rankings are reused until the source file changes
+        for participant, source in sources.items():
+            if participant == 'Machine':
+                loader = StatsForUI.load_machine_ranking_from_csv
+            else:
+                loader = StatsForUI.load_ranking_from_export_csv
+            key = ('ranking', participant == 'Machine', file_fingerprint(source))
+            participants_data[participant] = cache.get_or_compute(key, lambda: loader(source))
+        
         return participants_data
 
     @staticmethod
-    def generate_correlation_matrices(participants_data: Dict[str, List[str]]) -> Dict[str, pd.DataFrame]:
-        """Generate correlation matrices for all metrics"""
-        participants = list(participants_data.keys())
-        n = len(participants)
-        
-        # Initialize matrices
-        matrices = {
-            'kendall': pd.DataFrame(index=participants, columns=participants, dtype=float),
-            'spearman': pd.DataFrame(index=participants, columns=participants, dtype=float),
-            'overlap_10': pd.DataFrame(index=participants, columns=participants, dtype=float),
-            'overlap_20': pd.DataFrame(index=participants, columns=participants, dtype=float)
-        }
+    def _source_fingerprints(sources: Optional[Dict[str, Path]]) -> Dict[str, tuple]:
+        """Fingerprint each participant's source file (empty when sources are unknown)"""
+        if not sources:
+            return {}
+        return {participant: file_fingerprint(path) for participant, path in sources.items()}
+
+    @staticmethod
+    def generate_correlation_matrices(participants_data: Dict[str, List[str]],
+                                      sources: Optional[Dict[str, Path]] = None) -> Dict[str, pd.DataFrame]:
+        """Generate correlation matrices for all metrics (upper triangle computed once, mirrored)"""
+        fingerprints = StatsForUI._source_fingerprints(sources)
+        compute = lambda: compute_correlation_matrices(participants_data, top_k=(10, 20))  # noqa: E731
+        
+        if fingerprints and set(fingerprints) == set(participants_data):
+            key = ('correlation_matrices', tuple((p, fingerprints[p]) for p in participants_data))
+            participants, matrices = get_analysis_cache().get_or_compute(key, compute)
+        else:
+            participants, matrices = compute()
         
-        # Calculate all pairwise comparisons
-        for i, participant1 in enumerate(participants):
-            for j, participant2 in enumerate(participants):
-                if i == j:
-                    # Perfect self-correlation
-                    matrices['kendall'].iloc[i, j] = 1.0
-                    matrices['spearman'].iloc[i, j] = 1.0
-                    matrices['overlap_10'].iloc[i, j] = 1.0
-                    matrices['overlap_20'].iloc[i, j] = 1.0
-                else:
-                    # Calculate metrics between participants
-                    ranking1 = participants_data[participant1]
-                    ranking2 = participants_data[participant2]
-                    
-                    # Find common items
-                    common_items = list(set(ranking1) & set(ranking2))
-                    
-                    if len(common_items) >= 2:
-                        pos1 = [ranking1.index(item) + 1 for item in common_items]
-                        pos2 = [ranking2.index(item) + 1 for item in common_items]
-                        
-                        matrices['kendall'].iloc[i, j] = StatisticsCalculator.calculate_kendall_tau(pos1, pos2)
-                        matrices['spearman'].iloc[i, j] = StatisticsCalculator.calculate_spearman_correlation(pos1, pos2)
-                        matrices['overlap_10'].iloc[i, j] = StatisticsCalculator.calculate_top_k_overlap(ranking1, ranking2, 10)
-                        matrices['overlap_20'].iloc[i, j] = StatisticsCalculator.calculate_top_k_overlap(ranking1, ranking2, 20)
-                    else:
-                        # Not enough common items
-                        matrices['kendall'].iloc[i, j] = 0.0
-                        matrices['spearman'].iloc[i, j] = 0.0
-                        matrices['overlap_10'].iloc[i, j] = 0.0
-                        matrices['overlap_20'].iloc[i, j] = 0.0
-        
-        return matrices
+        return {
+            name: pd.DataFrame(matrix, index=participants, columns=participants, dtype=float)
+            for name, matrix in matrices.items()
+        }
 
     @staticmethod
-    def generate_unified_dashboard_data(participants_data: Dict[str, List[str]]) -> pd.DataFrame:
+    def generate_unified_dashboard_data(participants_data: Dict[str, List[str]],
+                                        sources: Optional[Dict[str, Path]] = None) -> pd.DataFrame:
         """Generate unified dashboard DataFrame with all metrics as columns"""
-        participants = list(participants_data.keys())
         machine_ranking = participants_data.get('Machine', [])
+        fingerprints = StatsForUI._source_fingerprints(sources)
+        cache = get_analysis_cache()
         
         dashboard_data = []
         
-        for participant in participants:
-            participant_ranking = participants_data[participant]
-            
+        for participant, participant_ranking in participants_data.items():
             if participant == 'Machine':
                 # Perfect baseline for machine
                 row_data = {
@@ -144,60 +152,110 @@ class StatsForUI:
                     'Top 20 Overlap': 1.0,
                     'Correlation Strength': 'Perfect'
                 }
+            elif 'Machine' in fingerprints and participant in fingerprints:
+                # Only participants whose export (or the dataset) changed are recomputed
+                key = ('dashboard_row', participant, fingerprints['Machine'], fingerprints[participant])
+                row_data = cache.get_or_compute(
+                    key, lambda: StatsForUI._dashboard_row(participant, participant_ranking, machine_ranking))
             else:
-                # Compare against machine baseline
-                common_items = list(set(machine_ranking) & set(participant_ranking))
-                
-                if len(common_items) >= 2:
-                    # Create position mappings
-                    machine_positions = [machine_ranking.index(item) + 1 for item in common_items]
-                    participant_positions = [participant_ranking.index(item) + 1 for item in common_items]
-                    
-                    # Calculate all metrics
-                    kendall_tau = StatisticsCalculator.calculate_kendall_tau(machine_positions, participant_positions)
-                    spearman_rho = StatisticsCalculator.calculate_spearman_correlation(machine_positions, participant_positions)
-                    kendall_distance = StatisticsCalculator.calculate_kendall_distance(machine_positions, participant_positions)
-                    avg_rank_diff = statistics.mean([abs(m - p) for m, p in zip(machine_positions, participant_positions)])
-                    top_10_overlap = StatisticsCalculator.calculate_top_k_overlap(machine_ranking, participant_ranking, 10)
-                    top_20_overlap = StatisticsCalculator.calculate_top_k_overlap(machine_ranking, participant_ranking, 20)
-                    
-                    # Determine correlation strength
-                    if kendall_tau >= 0.8:
-                        strength = 'Strong'
-                    elif kendall_tau >= 0.6:
-                        strength = 'Moderate' 
-                    elif kendall_tau >= 0.4:
-                        strength = 'Weak'
-                    else:
-                        strength = 'Very Weak'
-                    
-                    row_data = {
-                        'Participant': participant,
-                        'Kendall τ': kendall_tau,
-                        'Spearman ρ': spearman_rho,
-                        'Kendall Distance': kendall_distance,
-                        'Avg Rank Diff': avg_rank_diff,
-                        'Top 10 Overlap': top_10_overlap,
-                        'Top 20 Overlap': top_20_overlap,
-                        'Correlation Strength': strength
-                    }
-                else:
-                    # Not enough common items - all zeros
-                    row_data = {
-                        'Participant': participant,
-                        'Kendall τ': 0.0,
-                        'Spearman ρ': 0.0,
-                        'Kendall Distance': 0,
-                        'Avg Rank Diff': 0.0,
-                        'Top 10 Overlap': 0.0,
-                        'Top 20 Overlap': 0.0,
-                        'Correlation Strength': 'No Data'
-                    }
+                row_data = StatsForUI._dashboard_row(participant, participant_ranking, machine_ranking)
             
             dashboard_data.append(row_data)
         
         return pd.DataFrame(dashboard_data)
 
+    @staticmethod
+    def _dashboard_row(participant: str, participant_ranking: List[str], machine_ranking: List[str]) -> Dict:
+        """Compute one participant's dashboard row against the machine baseline"""
+        machine_positions, participant_positions = metric_kernels.aligned_positions(
+            machine_ranking, participant_ranking)
+        
+        if len(machine_positions) < 2:
+            # Not enough common items - all zeros
+            return {
+                'Participant': participant,
+                'Kendall τ': 0.0,
+                'Spearman ρ': 0.0,
+                'Kendall Distance': 0,
+                'Avg Rank Diff': 0.0,
+                'Top 10 Overlap': 0.0,
+                'Top 20 Overlap': 0.0,
+                'Correlation Strength': 'No Data'
+            }
+        
+        # Calculate all metrics on the aligned position arrays
+        kendall_tau = StatisticsCalculator.calculate_kendall_tau(machine_positions, participant_positions)
+        spearman_rho = StatisticsCalculator.calculate_spearman_correlation(machine_positions, participant_positions)
+        kendall_distance = metric_kernels.kendall_distance(machine_positions, participant_positions)
+        avg_rank_diff = metric_kernels.avg_rank_diff(machine_positions, participant_positions)
+        overlaps = metric_kernels.top_k_overlap_curve(machine_positions, participant_positions, [10, 20])
+        
+        # Determine correlation strength
+        if kendall_tau >= 0.8:
+            strength = 'Strong'
+        elif kendall_tau >= 0.6:
+            strength = 'Moderate' 
+        elif kendall_tau >= 0.4:
+            strength = 'Weak'
+        else:
+            strength = 'Very Weak'
+        
+        return {
+            'Participant': participant,
+            'Kendall τ': kendall_tau,
+            'Spearman ρ': spearman_rho,
+            'Kendall Distance': kendall_distance,
+            'Avg Rank Diff': avg_rank_diff,
+            'Top 10 Overlap': overlaps[10],
+            'Top 20 Overlap': overlaps[20],
+            'Correlation Strength': strength
+        }
+
+    @staticmethod
+    def generate_bootstrap_intervals(participants_data: Dict[str, List[str]], n_resamples: int = 1000,
+                                     confidence: float = 0.95, sources: Optional[Dict[str, Path]] = None
+                                     ) -> Dict[str, Dict[str, BootstrapInterval]]:
+        """Bootstrap CIs of every human participant's agreement with the machine baseline"""
+        machine_ranking = participants_data.get('Machine', [])
+        fingerprints = StatsForUI._source_fingerprints(sources)
+        cache = get_analysis_cache()
+        intervals = {}
+        
+        for participant, participant_ranking in participants_data.items():
+            if participant == 'Machine':
+                continue
+            common_count = len(set(machine_ranking) & set(participant_ranking))
+            if common_count < 2:
+                continue
+            compute = lambda: StatisticsCalculator.bootstrap_confidence_intervals(  # noqa: E731
+                machine_ranking, participant_ranking, n_resamples=n_resamples,
+                confidence=confidence, top_k=(10, 20)
+            )
+            if 'Machine' in fingerprints and participant in fingerprints:
+                key = ('bootstrap', n_resamples, confidence, fingerprints['Machine'], fingerprints[participant])
+                intervals[participant] = cache.get_or_compute(key, compute)
+            else:
+                intervals[participant] = compute()
+        
+        return intervals
+
+    @staticmethod
+    def generate_pairwise_agreement(dataset_stem: str, usernames: List[str],
+                                    top_hotspots: int = 10) -> PairwiseAgreementResult:
+        """Agreement on the raw pairwise answers stored in every user's session file"""
+        session_manager = get_session_manager()
+        fingerprints = tuple(
+            (username, file_fingerprint(session_manager.get_session_path(username, dataset_stem)))
+            for username in usernames if session_manager.has_session(username, dataset_stem)
+        )
+        compute = lambda: compute_pairwise_agreement(  # noqa: E731
+            load_comparison_memories(dataset_stem, usernames), top_hotspots=top_hotspots)
+        
+        if fingerprints:
+            key = ('pairwise_agreement', top_hotspots, fingerprints)
+            return get_analysis_cache().get_or_compute(key, compute)
+        return compute()
+
     @staticmethod
     def compare_two_participants_detailed(participant1: str, participant2: str, 
                                         participants_data: Dict[str, List[str]]) -> Dict:
@@ -205,29 +263,11 @@ class StatsForUI:
         ranking1 = participants_data[participant1]
         ranking2 = participants_data[participant2]
         
-        # Find common items
-        common_items = list(set(ranking1) & set(ranking2))
-        
-        # Create position mappings
-        positions1 = [ranking1.index(item) + 1 for item in common_items]
-        positions2 = [ranking2.index(item) + 1 for item in common_items]
-        
-        # Calculate all metrics
-        kendall_tau = StatisticsCalculator.calculate_kendall_tau(positions1, positions2)
-        spearman_rho = StatisticsCalculator.calculate_spearman_correlation(positions1, positions2)
-        kendall_distance = StatisticsCalculator.calculate_kendall_distance(positions1, positions2)
-        avg_rank_diff = statistics.mean([abs(p1 - p2) for p1, p2 in zip(positions1, positions2)])
-        overlap_10 = StatisticsCalculator.calculate_top_k_overlap(ranking1, ranking2, 10)
-        overlap_20 = StatisticsCalculator.calculate_top_k_overlap(ranking1, ranking2, 20)
+        # Calculate all metrics on aligned position arrays
+        result = StatisticsCalculator.compare_rankings_from_lists(ranking1, ranking2)
         
         return {
             'participant1': participant1,
             'participant2': participant2,
-            'kendall_tau': kendall_tau,
-            'spearman_rho': spearman_rho,
-            'kendall_distance': kendall_distance,
-            'avg_rank_diff': avg_rank_diff,
-            'common_items': len(common_items),
-            'overlap_at_10': overlap_10,
-            'overlap_at_20': overlap_20
+            **result._asdict()
         }
@@ -0,0 +1,137 @@
+# src/text_ranking_tool/utils/aho_corasick.py
+"""
+Aho–Corasick multi-pattern matcher for text formatting dictionaries
+Same pattern language as text_formatters._stylize_matches - exact phrases
+(word boundaries on both ends), trailing '*' wildcards and multi-word
+phrases with the wildcard on the last word - in one pass over the text,
+independent of how many patterns are loaded.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Match-end rules per pattern
+EXACT = 0      # literal phrase, word boundary after
+WILDCARD = 1   # literal prefix, then any word characters
+PHRASE = 2     # literal head, whitespace, last-word prefix, then any word characters
+
+
+def _is_word(ch: str) -> bool:
+    """Same character class as the re module's Unicode \\w"""
+    return ch.isalnum() or ch == '_'
+
+
+def _word_at(text: str, i: int) -> bool:
+    return 0 <= i < len(text) and _is_word(text[i])
+
+
+class AhoCorasickMatcher:
+    """
+    Automaton over the literal part of every pattern. Scanning reports each
+    literal hit once; boundary and wildcard rules are checked at the hit, so
+    the cost is linear in the text length plus the number of hits.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        # Trie as parallel arrays: goto transitions, failure links, and the
+        # nearest node (self or via failure links) that ends a pattern
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._rules: List[List[Tuple[int, int, str]]] = [[]]   # (literal length, rule, last-word prefix)
+        self._output: List[int] = [-1]
+
+        for stem in patterns:
+            literal, rule, tail = self._parse(stem)
+            if not literal:
+                continue
+            node = 0
+            for ch in literal:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._rules.append([])
+                    self._output.append(-1)
+                node = nxt
+            rule_entry = (len(literal), rule, tail)
+            if rule_entry not in self._rules[node]:
+                self._rules[node].append(rule_entry)
+
+        self._build_links()
+
+    @staticmethod
+    def _parse(stem: str) -> Tuple[str, int, str]:
+        """(literal to index, match-end rule, last-word prefix for phrase wildcards)"""
+        if not stem.endswith('*'):
+            return stem, EXACT, ''
+        prefix = stem[:-1]
+        if ' ' not in prefix:
+            return prefix, WILDCARD, ''
+        fixed_prefix, last_word_prefix = prefix.rsplit(' ', 1)
+        return fixed_prefix, PHRASE, last_word_prefix
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            self._output[node] = node if self._rules[node] else self._output[self._fail[node]]
+            for ch, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target
+                queue.append(child)
+
+    @staticmethod
+    def _match_end(text: str, start: int, end: int, rule: int, tail: str) -> Optional[int]:
+        """End of the full match for a literal hit at [start, end), or None if the rule fails"""
+        if rule == EXACT:
+            return end if _word_at(text, end - 1) != _word_at(text, end) else None
+        if rule == PHRASE:
+            # \s+ then the last word's literal prefix
+            pos = end
+            while pos < len(text) and text[pos].isspace():
+                pos += 1
+            if pos == end or not text.startswith(tail, pos):
+                return None
+            end = pos + len(tail)
+        while end < len(text) and _is_word(text[end]):
+            end += 1
+        return end
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int]]:
+        """Yield (start, end) of every pattern match, in order of literal end position"""
+        goto, fail, rules, output = self._goto, self._fail, self._rules, self._output
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            hit = output[node]
+            while hit != -1:
+                for length, rule, tail in rules[hit]:
+                    start = i + 1 - length
+                    # Every pattern starts at a word boundary
+                    if _word_at(text, start - 1) == _word_at(text, start):
+                        continue
+                    end = self._match_end(text, start, i + 1, rule, tail)
+                    if end is not None:
+                        yield start, end
+                hit = output[fail[hit]]
+
+    def spans(self, text: str) -> List[Tuple[int, int]]:
+        """Matched character ranges, overlapping matches merged, in text order"""
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(self.iter_matches(text)):
+            if end <= start:
+                continue
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
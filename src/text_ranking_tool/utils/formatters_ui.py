@@ -28,6 +28,13 @@ def format_integer(value: int) -> str:
         return "N/A"
     return str(int(value))
 
+def format_interval(interval, value_formatter) -> str:
+    """Format a (estimate, lower, upper) interval as 'estimate [lower, upper]'"""
+    if interval is None:
+        return "N/A"
+    estimate, lower, upper = interval
+    return f"{value_formatter(estimate)} [dim][{value_formatter(lower)}, {value_formatter(upper)}][/dim]"
+
 def interpret_correlation_strength(correlation: float) -> str:
     """Return correlation strength label without markup"""
     if correlation is None:
@@ -1,25 +1,49 @@
 # src/text_ranking_tool/utils/text_formatters.py
 
 import re
-from typing import Optional, List
+from functools import lru_cache
+from typing import Dict, Optional, List, Sequence, Tuple
 from rich.text import Text
 
 from ..config.constants import TEXT_FORMATTING_RULE, resolve_path
+from .aho_corasick import AhoCorasickMatcher
 
-def _load_patterns_file(path_str: str) -> Optional[List[str]]:
-    """Load raw patterns from .txt — one per line, optional trailing *."""
+# Loaded patterns per resolved file, kept until the file's size or mtime changes
+_patterns_cache: Dict[str, Tuple[Tuple[int, int], Optional[Tuple[str, ...]]]] = {}
+
+# Trie atoms that are not a single literal character / match-end rules
+_WHITESPACE = r'\s+'
+_WORD_TAIL = r'\w*'
+_WORD_END = r'\b'
+
+# Matching engines selectable with text_formatting.matcher in config.json.
+# "auto" keeps the compiled regex (fastest scans) until the pattern list is so
+# large that compiling it dominates; Aho–Corasick builds ~3x faster there.
+MATCHERS = ("auto", "regex", "aho_corasick")
+AHO_CORASICK_MIN_PATTERNS = 100_000
+
+
+def _load_patterns_file(path_str: str) -> Optional[Tuple[str, ...]]:
+    """Load raw patterns from .txt — one per line, optional trailing *.
+    Cached per file; re-read only when its size or mtime changes."""
     try:
         file_path = resolve_path(path_str)
+        stat = file_path.stat()
+        state = (stat.st_size, stat.st_mtime_ns)
+        cached = _patterns_cache.get(str(file_path))
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
         with open(file_path, 'r', encoding='utf-8-sig') as f:
-            patterns = [
+            patterns = tuple(
                 line.strip()
                 for line in f
                 if line.strip() and not line.startswith("#")
-            ]
+            )
         if not patterns:
             print(f"Warning: Patterns file is empty: {file_path}")
-            return None
-        return patterns
+        _patterns_cache[str(file_path)] = (state, patterns or None)
+        return patterns or None
     except FileNotFoundError:
         print(f"Error: Patterns file not found: {path_str}")
         return None
@@ -28,34 +52,127 @@ def _load_patterns_file(path_str: str) -> Optional[List[str]]:
         return None
 
 
-def _stylize_matches(text_obj: Text, patterns: Optional[List[str]], style: str) -> Text:
+def _pattern_atoms(stem: str) -> Tuple[List[str], str]:
+    """Split one pattern into regex atoms and its match-end rule:
+    exact phrase -> literal chars + \\b; 'word*' -> chars + \\w*;
+    'multi word*' -> chars, \\s+ before the last word, chars + \\w*."""
+    if not stem.endswith('*'):
+        return [re.escape(ch) for ch in stem], _WORD_END
+
+    prefix = stem[:-1]
+    if ' ' not in prefix:
+        return [re.escape(ch) for ch in prefix], _WORD_TAIL
+
+    fixed_prefix, last_word_prefix = prefix.rsplit(' ', 1)  # Split on last space
+    atoms = [re.escape(ch) for ch in fixed_prefix] + [_WHITESPACE] + [re.escape(ch) for ch in last_word_prefix]
+    return atoms, _WORD_TAIL
+
+
+def _trie_regex(node: Dict) -> str:
+    """Regex for a trie node. Longer continuations are tried before the node's own
+    match-end rules (\\w* before \\b), so each start position takes its longest match."""
+    branches = [atom + _trie_regex(child) for atom, child in node.items() if atom != '']
+    branches += [end for end in (_WORD_TAIL, _WORD_END) if end in node.get('', ())]
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+
+def _is_space_atom(atom: str) -> bool:
+    """Literal whitespace character atom (re.escape'd), not the \\s+ atom"""
+    return atom != _WHITESPACE and atom[-1:].isspace()
+
+
+def _insert_pattern(trie: Dict, atoms: List[str], end: str) -> bool:
+    """Add a pattern to the trie unless it would put \\s+ and literal whitespace
+    under the same node. Regex alternation takes the first branch that matches,
+    not the longest, and only those two atoms can both match at one position."""
+    node = trie
+    for atom in atoms:
+        if atom not in node:
+            if atom == _WHITESPACE and any(_is_space_atom(other) for other in node if other):
+                return False
+            if _is_space_atom(atom) and _WHITESPACE in node:
+                return False
+        node = node.get(atom, {})
+        if not node:
+            break
+    node = trie
+    for atom in atoms:
+        node = node.setdefault(atom, {})
+    node.setdefault('', set()).add(end)
+    return True
+
+
+@lru_cache(maxsize=8)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[re.Pattern, ...]:
+    """Compile all patterns into trie-shaped regexes scanned once per text.
+    Group 1 is captured in a lookahead, so matches starting inside another match
+    are still found (every pattern match is styled, as with per-pattern scans;
+    unlike them, a phrase overlapping its own previous match - 'a a' in 'a a a' -
+    is styled too). Patterns whose branches would compete (see _insert_pattern) go into another
+    trie; usually there is only one."""
+    tries: List[Dict] = []
+    for stem in patterns:
+        atoms, end = _pattern_atoms(stem)
+        for trie in tries:
+            if _insert_pattern(trie, atoms, end):
+                break
+        else:
+            tries.append({})
+            _insert_pattern(tries[-1], atoms, end)
+    return tuple(re.compile(r'\b(?=(' + _trie_regex(trie) + '))') for trie in tries)
+
+
+@lru_cache(maxsize=8)
+def _build_aho_corasick(patterns: Tuple[str, ...]) -> AhoCorasickMatcher:
+    return AhoCorasickMatcher(patterns)
+
+
+def _use_aho_corasick(pattern_count: int) -> bool:
+    """Engine for a pattern list of this size, per the configured matcher"""
+    matcher = (TEXT_FORMATTING_RULE or {}).get("matcher", "auto")
+    if matcher not in MATCHERS:
+        print(f"Warning: Unknown text matcher '{matcher}' — using auto.")
+        matcher = "auto"
+    if matcher == "auto":
+        return pattern_count >= AHO_CORASICK_MIN_PATTERNS
+    return matcher == "aho_corasick"
+
+
+def _regex_spans(matchers: Sequence[re.Pattern], raw: str) -> List[Tuple[int, int]]:
+    """Matched ranges from the combined regexes, overlapping matches merged"""
+    matches = sorted((match.start(), match.end(1)) for matcher in matchers for match in matcher.finditer(raw))
+    spans: List[Tuple[int, int]] = []
+    span_start, span_end = -1, -1
+    for start, end in matches:
+        if start > span_end:
+            if span_end > span_start:
+                spans.append((span_start, span_end))
+            span_start = start
+        span_end = max(span_end, end)
+    if span_end > span_start:
+        spans.append((span_start, span_end))
+    return spans
+
+
+def _stylize_matches(text_obj: Text, patterns: Optional[Sequence[str]], style: str) -> Text:
     """Core engine: compile wildcard patterns, apply Rich style to all matches.
     Case-sensitive, handles multi-word phrases correctly."""
     if not patterns:
         return text_obj
-    
+
+    patterns = tuple(patterns)
     raw = text_obj.plain
-    for stem in patterns:
-        if stem.endswith('*'):
-            prefix = stem[:-1]
-            if ' ' in prefix:
-                # Multi-word phrase with wildcard on last word only
-                words = prefix.rsplit(' ', 1)  # Split on last space
-                fixed_prefix = words[0]
-                last_word_prefix = words[1]
-                # Match: \b fixed_prefix last_word_prefix\w*
-                pat_str = rf'\b{re.escape(fixed_prefix)}\s+{re.escape(last_word_prefix)}\w*'
-            else:
-                # Single word wildcard
-                pat_str = rf'\b{re.escape(prefix)}\w*'
-        else:
-            # Exact phrase match
-            pat_str = rf'\b{re.escape(stem)}\b'
-        
-        pat = re.compile(pat_str)
-        for match in pat.finditer(raw):
-            text_obj.stylize(style, match.start(), match.end())
-    
+    if _use_aho_corasick(len(patterns)):
+        spans = _build_aho_corasick(patterns).spans(raw)
+    else:
+        spans = _regex_spans(_compile_patterns(patterns), raw)
+
+    # Overlapping matches are merged, so each styled run is a single span
+    for start, end in spans:
+        text_obj.stylize(style, start, end)
+
     return text_obj
 
 
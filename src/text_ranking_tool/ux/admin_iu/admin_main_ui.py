@@ -11,7 +11,7 @@ from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.text import Text
 from rich.align import Align
-import os
+from ..screen import clear_terminal
 
 def show_admin_menu():
     """
@@ -147,7 +147,7 @@ def _show_module_error(mode_name: str, filename: str):
 
 def _clear_screen():
     """Clear screen helper"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_terminal()
 
 # Integration functions for main.py
 def show_admin_menu_from_startup():
@@ -6,7 +6,7 @@ Algorithm Configuration - Runtime algorithm selection
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
-import os
+from ..screen import clear_terminal
 import json
 from .admin_main_ui import get_admin_choice_with_navigation, handle_navigation_action
 from ...config.constants import (get_available_algorithms, 
@@ -14,6 +14,7 @@ from ...config.constants import (get_available_algorithms,
                                  set_algorithm, 
                                  CONFIG_FILE,
                                  _config)
+from ...algorithms.registry import algorithm_registry
 
 def algorithm_config_mode():
     """Algorithm configuration with dynamic navigation"""
@@ -26,11 +27,15 @@ def algorithm_config_mode():
         console.print(f"Current: [green]{current_algo}[/green]")
         console.print()
         
-        # List algorithms
+        # List algorithms (metadata from the registry; nothing is imported)
         algorithms = get_available_algorithms()
+        details = algorithm_registry.list_algorithms()
         for i, algo in enumerate(algorithms, 1):
             status = " ✅" if algo == current_algo else ""
-            console.print(f"[{i}] {algo}{status}")
+            info = details[algo]
+            source = "" if info["source"] == "manifest" else f" [dim]({info['source']})[/dim]"
+            console.print(f"[{i}] {algo} - {info['name']}{source}{status}")
+            console.print(f"    [dim]{info['description']}[/dim]")
         
         choices = [str(i) for i in range(1, len(algorithms) + 1)]
         choice, nav_action = get_admin_choice_with_navigation(
@@ -93,4 +98,4 @@ def _switch_algorithm(console, algorithm_id):
 
 def _clear_screen():
     """Clear screen helper"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_terminal()
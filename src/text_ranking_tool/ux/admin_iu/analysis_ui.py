@@ -10,14 +10,21 @@ from rich.table import Table
 from rich.prompt import Prompt
 from rich.text import Text
 from rich.align import Align
-import os
+from ..screen import clear_terminal
 from typing import Dict, List, Optional, Tuple
-from ...stats.stats_for_ui import StatsForUI
 from .admin_main_ui import (get_admin_choice_with_navigation,handle_navigation_action)
 from ...config.constants import INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR, USER_MAPPING, get_user_color
 from ...utils.formatters_ui import (format_correlation, format_percentage, format_rank_diff, format_integer,
                          format_participant_name, format_strength_display, 
-                         get_strength_color,interpret_correlation_strength)
+                         get_strength_color,interpret_correlation_strength, format_interval)
+
+# Resamples for the dashboard's bootstrap confidence intervals
+BOOTSTRAP_RESAMPLES = 1000
+
+def _stats():
+    """StatsForUI, imported at first use so pandas and SciPy load only when an analysis runs"""
+    from ...stats.stats_for_ui import StatsForUI
+    return StatsForUI
 
 def statistical_analysis_mode():
     """Main statistical analysis UX with dynamic navigation"""
@@ -29,7 +36,7 @@ def statistical_analysis_mode():
         _show_analysis_options(console)
         
         choice, nav_action = get_admin_choice_with_navigation(
-            "Select analysis", ["1", "2", "3"], console)
+            "Select analysis", ["1", "2", "3", "4"], console)
 
         if handle_navigation_action(nav_action):
             break
@@ -41,6 +48,8 @@ def statistical_analysis_mode():
             show_unified_metrics_dashboard(console)
         elif choice == "3":
             show_direct_comparison(console)
+        elif choice == "4":
+            show_pairwise_agreement(console)
 
 def _show_statistical_analysis_header(console: Console):
     """Display statistical analysis mode header"""
@@ -68,7 +77,10 @@ def _show_analysis_options(console: Console):
         "[dim]   ALL metrics in columns - the beautiful unified view[/dim]\n\n"
         
         "[bold white]3.[/bold white] [blue]Direct Ranking Comparison[/blue]\n"
-        "[dim]   Head-to-head analysis between any 2 participants[/dim]",
+        "[dim]   Head-to-head analysis between any 2 participants[/dim]\n\n"
+        
+        "[bold white]4.[/bold white] [magenta]Pairwise Answer Agreement[/magenta]\n"
+        "[dim]   Krippendorff's α and disagreement hotspots from session answers[/dim]",
         title="[bold green]📊 Statistical Analysis Options[/bold green]",
         border_style="green",
         padding=(1, 2)
@@ -92,15 +104,13 @@ def show_correlation_matrices(console: Console):
         if not dataset_stem:
             return
         
-        participants_data = StatsForUI.load_all_participants_data(
-            dataset_stem, INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR, USER_MAPPING
-        )
+        participants_data, sources = _load_participants(dataset_stem)
         
         if len(participants_data) < 2:
             _show_insufficient_data_message(console, dataset_stem)
             return
         
-        matrices = StatsForUI.generate_correlation_matrices(participants_data)
+        matrices = _stats().generate_correlation_matrices(participants_data, sources)
         
         _display_correlation_matrix(console, matrices['kendall'], "Kendall's τ", "green")
         console.print()
@@ -134,17 +144,20 @@ def show_unified_metrics_dashboard(console: Console):
         if not dataset_stem:
             return
         
-        participants_data = StatsForUI.load_all_participants_data(
-            dataset_stem, INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR, USER_MAPPING
-        )
+        participants_data, sources = _load_participants(dataset_stem)
         
         if len(participants_data) < 2:
             _show_insufficient_data_message(console, dataset_stem)
             return
         
-        dashboard_df = StatsForUI.generate_unified_dashboard_data(participants_data)
+        dashboard_df = _stats().generate_unified_dashboard_data(participants_data, sources)
         _display_unified_dashboard_table(console, dashboard_df, dataset_stem)
         
+        console.print()
+        intervals = _stats().generate_bootstrap_intervals(
+            participants_data, n_resamples=BOOTSTRAP_RESAMPLES, sources=sources)
+        _display_bootstrap_intervals(console, intervals)
+        
         console.print()
         _display_inter_user_comparisons(console, participants_data)
         
@@ -172,9 +185,7 @@ def show_direct_comparison(console: Console):
         if not dataset_stem:
             return
         
-        participants_data = StatsForUI.load_all_participants_data(
-            dataset_stem, INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR, USER_MAPPING
-        )
+        participants_data, sources = _load_participants(dataset_stem)
         
         if len(participants_data) < 2:
             _show_insufficient_data_message(console, dataset_stem)
@@ -184,7 +195,7 @@ def show_direct_comparison(console: Console):
         if not participant1 or not participant2:
             return
         
-        comparison_data = StatsForUI.compare_two_participants_detailed(
+        comparison_data = _stats().compare_two_participants_detailed(
             participant1, participant2, participants_data
         )
         
@@ -196,6 +207,43 @@ def show_direct_comparison(console: Console):
     console.print()
     Prompt.ask("Press Enter to continue", default="")
 
+# ===============================
+# OPTION 4: PAIRWISE AGREEMENT
+# ===============================
+
+def show_pairwise_agreement(console: Console):
+    """Option 4: Inter-annotator agreement on the individual pairwise answers"""
+    _clear_screen()
+    console.print(Panel(
+        "[bold magenta]🤝 Pairwise Answer Agreement[/bold magenta]\n"
+        "[dim]Agreement on the same pairs across users' session answers[/dim]",
+        border_style="magenta"
+    ))
+    
+    try:
+        dataset_stem = _select_dataset(console)
+        if not dataset_stem:
+            return
+        
+        agreement = _stats().generate_pairwise_agreement(dataset_stem, list(USER_MAPPING.keys()))
+        
+        if len(agreement.users) < 2 or agreement.shared_pairs == 0:
+            console.print(Panel(
+                f"[yellow]No shared pairwise answers[/yellow]\n\n"
+                f"Dataset: [cyan]{dataset_stem}[/cyan]\n"
+                f"Need at least 2 users' sessions that judged the same pairs.",
+                title="[yellow]Not Enough Data[/yellow]",
+                border_style="yellow"
+            ))
+        else:
+            _display_pairwise_agreement(console, agreement, dataset_stem)
+        
+    except Exception as e:
+        _show_error_message(console, "Pairwise Agreement", str(e))
+    
+    console.print()
+    Prompt.ask("Press Enter to continue", default="")
+
 # ===============================
 # DISPLAY FUNCTIONS
 # ===============================
@@ -241,9 +289,36 @@ def _display_unified_dashboard_table(console: Console, dashboard_df, dataset_ste
     
     console.print(dashboard_table)
 
+def _display_bootstrap_intervals(console: Console, intervals: Dict[str, Dict]):
+    """Display 95% bootstrap confidence intervals of agreement with the machine"""
+    
+    if not intervals:
+        return
+    
+    ci_table = Table(
+        title=f"📏 95% Bootstrap Confidence Intervals vs Machine ({BOOTSTRAP_RESAMPLES} resamples)",
+        show_header=True,
+        header_style="bold white"
+    )
+    ci_table.add_column("Participant", style="bold", width=12)
+    ci_table.add_column("Kendall τ", justify="center", width=20)
+    ci_table.add_column("Spearman ρ", justify="center", width=20)
+    ci_table.add_column("Top-10", justify="center", width=16)
+    ci_table.add_column("Top-20", justify="center", width=16)
+    
+    for participant, metrics in intervals.items():
+        ci_table.add_row(
+            format_participant_name(participant, get_user_color),
+            format_interval(metrics['kendall_tau'], format_correlation),
+            format_interval(metrics['spearman_rho'], format_correlation),
+            format_interval(metrics['overlap_at_10'], format_percentage),
+            format_interval(metrics['overlap_at_20'], format_percentage)
+        )
+    
+    console.print(ci_table)
+
 def _display_inter_user_comparisons(console: Console, participants_data: Dict[str, List[str]]):
     """Display inter-user comparison matrix (human participants only)"""
-    
     human_participants = [p for p in participants_data.keys() if p != 'Machine']
     
     if len(human_participants) < 2:
@@ -263,7 +338,7 @@ def _display_inter_user_comparisons(console: Console, participants_data: Dict[st
     for i, user1 in enumerate(human_participants):
         for j, user2 in enumerate(human_participants):
             if i < j:
-                comparison = StatsForUI.compare_two_participants_detailed(user1, user2, participants_data)
+                comparison = _stats().compare_two_participants_detailed(user1, user2, participants_data)
                 
                 user1_display = format_participant_name(user1, get_user_color)
                 user2_display = format_participant_name(user2, get_user_color)
@@ -284,6 +359,59 @@ def _display_inter_user_comparisons(console: Console, participants_data: Dict[st
     
     console.print(inter_table)
 
+def _display_pairwise_agreement(console: Console, agreement, dataset_stem: str):
+    """Display summary, user x user agreement and the most contested items"""
+    
+    console.print(Panel(
+        f"Answers pooled: [bold]{format_integer(agreement.judgments)}[/bold]   "
+        f"Shared pairs: [bold]{format_integer(agreement.shared_pairs)}[/bold]\n"
+        f"Observed agreement: [bold]{format_percentage(agreement.observed_agreement)}[/bold]   "
+        f"Krippendorff's α: [bold]{format_correlation(agreement.krippendorff_alpha)}[/bold]",
+        title=f"[bold magenta]🤝 Pairwise Agreement - Dataset: {dataset_stem}[/bold magenta]",
+        border_style="magenta"
+    ))
+    
+    users = agreement.users
+    user_table = Table(title="👥 User x User Agreement (shared pairs)", show_header=True, header_style="bold white")
+    user_table.add_column("User", style="bold", width=12)
+    for user in users:
+        user_table.add_column(user, justify="center", width=14)
+    
+    for i, user in enumerate(users):
+        cells = []
+        for j in range(len(users)):
+            if i == j:
+                cells.append("[dim]-[/dim]")
+            elif agreement.user_overlap[i, j] == 0:
+                cells.append("[dim]n/a[/dim]")
+            else:
+                cells.append(f"{format_percentage(agreement.user_agreement[i, j])} "
+                             f"[dim]({agreement.user_overlap[i, j]})[/dim]")
+        user_table.add_row(format_participant_name(user, get_user_color), *cells)
+    
+    console.print()
+    console.print(user_table)
+    
+    if not agreement.hotspots:
+        return
+    
+    hotspot_table = Table(title="🔥 Disagreement Hotspots", show_header=True, header_style="bold white")
+    hotspot_table.add_column("Item ID", style="bold", width=14)
+    hotspot_table.add_column("Shared Pairs", justify="center", width=13)
+    hotspot_table.add_column("Contested", justify="center", width=11)
+    hotspot_table.add_column("Disagreement", justify="center", width=13)
+    
+    for hotspot in agreement.hotspots:
+        hotspot_table.add_row(
+            str(hotspot['id']),
+            format_integer(hotspot['shared_pairs']),
+            format_integer(hotspot['contested_pairs']),
+            format_percentage(hotspot['disagreement'])
+        )
+    
+    console.print()
+    console.print(hotspot_table)
+
 def _display_correlation_matrix(console: Console, matrix_df, metric_name: str, color: str):
     """Display correlation matrix with clean formatting"""
     
@@ -346,9 +474,19 @@ def _display_detailed_comparison(console: Console, comparison_data: Dict, datase
 # HELPER FUNCTIONS
 # ===============================
 
+def _load_participants(dataset_stem: str) -> Tuple[Dict[str, List[str]], Dict]:
+    """Resolve each participant's source file once, then load (cached) rankings"""
+    sources = _stats().resolve_participant_sources(
+        dataset_stem, INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR, USER_MAPPING
+    )
+    participants_data = _stats().load_all_participants_data(
+        dataset_stem, INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR, USER_MAPPING, sources=sources
+    )
+    return participants_data, sources
+
 def _select_dataset(console: Console) -> Optional[str]:
     """Dataset selection interface"""
-    available_datasets = StatsForUI.get_available_datasets(INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR)
+    available_datasets = _stats().get_available_datasets(INTERNAL_EXPORT_DIR, INTERNAL_DATA_DIR)
     
     if not available_datasets:
         console.print(Panel(
@@ -439,4 +577,4 @@ def _show_error_message(console: Console, operation: str, error: str):
 
 def _clear_screen():
     """Clear screen helper"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_terminal()
@@ -6,7 +6,7 @@ Data Admin - Minimal data management with enhanced safety
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
-import os
+from ..screen import clear_terminal
 import shutil
 from .admin_main_ui import (get_admin_choice_with_navigation,handle_navigation_action)
 from ...config.constants import INTERNAL_DATA_DIR, INTERNAL_EXPORT_DIR, INTERNAL_USERS_DIR
@@ -101,4 +101,4 @@ def _execute_reset(console):
 
 def _clear_screen():
     """Clear screen helper"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_terminal()
@@ -1,15 +1,17 @@
 #src/text_ranking_tool/ux/admin_iu/export_ui.py
 """
 Minimal Export UI - Just copy files and show results
+Parquet/Arrow and the latest-rankings export are written from the ranking record stream.
 """
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
-import os
+from ..screen import clear_terminal
 import shutil
 from .admin_main_ui import (get_admin_choice_with_navigation,handle_navigation_action)
-from ...config.constants import INTERNAL_EXPORT_DIR, EXTERNAL_EXPORT_DIR
+from ...config.constants import INTERNAL_EXPORT_DIR, EXTERNAL_EXPORT_DIR, USER_MAPPING
+from ...export.record_writers import available_export_formats, columnar_available
 
 def export_mode():
     """Export mode with dynamic navigation"""
@@ -21,22 +23,53 @@ def export_mode():
         console.print("[1] Per User Export")
         console.print("[2] Per Dataset Export") 
         console.print("[3] Overall Export")
+        console.print("[4] Consensus Ranking Export")
+        console.print("[5] Latest Rankings Export (configured algorithm only)")
         choice, nav_action = get_admin_choice_with_navigation(
             "Select export type", 
-            ["1", "2", "3"],
+            ["1", "2", "3", "4", "5"],
             console
         )
         
         if handle_navigation_action(nav_action):
             break
             
-        if choice == "1":
+        export_format = _select_export_format(console)
+        
+        if choice == "4":
+            _consensus_export(console, export_format)
+        elif choice == "5":
+            _ranking_export(console, _select_export_scope(console), export_format)
+        elif export_format != "csv":
+            _ranking_export(console, choice, export_format)
+        elif choice == "1":
             _per_user_export(console)
         elif choice == "2":
             _per_dataset_export(console)
         elif choice == "3":
             _overall_export(console)
 
+def _select_export_format(console) -> str:
+    """Ask for the output format; CSV only when pyarrow is not installed"""
+    if not columnar_available():
+        console.print("[dim]Parquet/Arrow export unavailable (pip install pyarrow) - using CSV[/dim]")
+        return "csv"
+    
+    formats = available_export_formats()
+    console.print("Output format:")
+    for i, export_format in enumerate(formats, 1):
+        console.print(f"[{i}] {export_format}")
+    choice = Prompt.ask("Select format", choices=[str(i) for i in range(1, len(formats) + 1)], default="1")
+    return formats[int(choice) - 1]
+
+def _select_export_scope(console) -> str:
+    """Per user / per dataset / overall, as numbered in the export menu"""
+    console.print("Export scope:")
+    console.print("[1] Per User")
+    console.print("[2] Per Dataset")
+    console.print("[3] Overall")
+    return Prompt.ask("Select scope", choices=["1", "2", "3"], default="1")
+
 def _per_user_export(console):
     files = list(INTERNAL_EXPORT_DIR.glob("*.csv"))
     if not files:
@@ -96,6 +129,53 @@ def _overall_export(console):
     console.print(f"[green]✓ Copied {copied_count} files to overall folder[/green]")  # Added checkmark
     Prompt.ask("Press Enter")
 
+def _ranking_export(console, choice: str, export_format: str):
+    """Per user / per dataset / overall export of each user's latest ranking for the configured algorithm"""
+    try:
+        from ...export.formatters import get_ranking_exporter
+        exporter = get_ranking_exporter()
+        console.print(f"[dim]Writing the latest {exporter.algorithm} ranking per user and dataset "
+                      f"(other algorithms and earlier exports are not included)[/dim]")
+        usernames = list(USER_MAPPING.keys())
+        if choice == "1":
+            result = exporter.export_per_user_external(usernames, export_format)
+        elif choice == "2":
+            result = exporter.export_per_file_external(usernames, export_format)
+        else:
+            result = exporter.export_overall_project_external(usernames, export_format)
+    except Exception as e:
+        console.print(f"[red]{export_format} export failed: {e}[/red]")
+        Prompt.ask("Press Enter")
+        return
+    
+    if result['total_records']:
+        console.print(f"[green]✓ Wrote {result['total_records']} rows to {len(result['files'])} {export_format} file(s)[/green]")
+    else:
+        console.print("[yellow]No completed rankings to export[/yellow]")
+    Prompt.ask("Press Enter")
+
+def _consensus_export(console, export_format: str = "csv"):
+    from ...ranking.consensus import CONSENSUS_METHODS
+    console.print("Aggregation method:")
+    for i, method in enumerate(CONSENSUS_METHODS, 1):
+        console.print(f"[{i}] {method}")
+    choice = Prompt.ask("Select method", choices=[str(i) for i in range(1, len(CONSENSUS_METHODS) + 1)])
+    method = CONSENSUS_METHODS[int(choice) - 1]
+    
+    try:
+        from ...export.formatters import get_ranking_exporter
+        result = get_ranking_exporter().export_consensus_external(list(USER_MAPPING.keys()), method, export_format)
+    except Exception as e:
+        console.print(f"[red]Consensus export failed: {e}[/red]")
+        Prompt.ask("Press Enter")
+        return
+    
+    if result['total_records']:
+        console.print(f"[green]✓ Wrote {result['total_records']} consensus rows to {result['files'][0]}[/green]")
+    else:
+        console.print("[yellow]No completed rankings to aggregate[/yellow]")
+    Prompt.ask("Press Enter")
+
 def _clear_screen():
     """Clear screen helper"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_terminal()
@@ -8,9 +8,10 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from ..config.constants import get_user_color
+from ..data.text_store import as_text_lookup
 
-def show_completion_results(username: str, file_stem: str, algorithm, final_ranking: list, text_data: list):
-    """Ultra-clean completion flow - simple ranking workflow continuation"""
+def show_completion_results(username: str, file_stem: str, algorithm, final_ranking: list, text_data: list) -> bool:
+    """Ultra-clean completion flow - True when the user wants to rank another dataset"""
     
     console = Console()
     user_color = get_user_color(username)
@@ -39,7 +40,7 @@ def show_completion_results(username: str, file_stem: str, algorithm, final_rank
     results_table.add_column("ID", width=10)
     results_table.add_column("Text Preview", width=50)
     
-    text_lookup = {item['id']: item for item in text_data}
+    text_lookup = as_text_lookup(text_data)
     
     for i, text_id in enumerate(final_ranking[:10], 1):
         text_info = text_lookup.get(text_id, {})
@@ -63,10 +64,9 @@ def show_completion_results(username: str, file_stem: str, algorithm, final_rank
         choice = input("\nChoose (1-2): ").strip()
         
         if choice == "1":
-            from ..main import main
-            return main()  # New ranking session
+            return True  # New ranking session, started by main() once this one is closed
         elif choice == "2":
             console.print("[yellow]Thank you for using the Text Ranking Tool![/yellow]")
-            return
+            return False
         else:
             console.print("[red]Invalid choice. Please enter 1 or 2.[/red]")
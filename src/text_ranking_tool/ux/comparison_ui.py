@@ -1,13 +1,22 @@
 # src/text_ranking_tool/ux/comparison_ui.py
-import os
-from typing import Dict, Any
+import io
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.align import Align
-from rich.prompt import Prompt
 from ..config.constants import DEBUG
 from ..utils.text_formatters import format_text
+from .key_input import ask_choice
+from .screen import clear_terminal, get_console, redraw, supports_redraw
+
+# Pre-rendered screens for announced next comparisons, keyed by _screen_key
+PRERENDER_SLOTS = 2
+_prerender_executor: Optional[ThreadPoolExecutor] = None
+_prerendered: Dict[Tuple, Future] = {}
+
+ScreenRenderer = Callable[[Console, Dict[str, Any]], None]
 
 def get_user_comparison_choice(comparison_data: Dict[str, Any]) -> str:
     """Dispatch to algorithm-specific comparison UI"""
@@ -24,7 +33,33 @@ def get_user_comparison_choice(comparison_data: Dict[str, Any]) -> str:
 def get_tournament_comparison_choice(comparison_data: Dict[str, Any]) -> str:
     """Tournament-specific UI: Competitor vs Competitor bracket advancement"""
     
-    console = Console()
+    console = get_console()
+    text1 = comparison_data["text1"]
+    text2 = comparison_data["text2"] 
+    
+    _show_screen(console, _render_tournament_screen, comparison_data)
+    
+    while True:
+        choice = ask_choice(console, "Your choice")
+        
+        if choice in ["a", "competitor a"]:
+            console.print("[green]✓ COMPETITOR A advances (more negative)[/green]\n")
+            return text1["id"]
+        elif choice in ["b", "competitor b"]:
+            console.print("[red]✓ COMPETITOR B advances (more negative)[/red]\n")
+            return text2["id"]
+        elif choice == "u":
+            console.print("[yellow]⟲ Undoing last comparison...[/yellow]")
+            return "UNDO"
+        elif choice == "q":
+            console.print("[yellow]Exiting tournament bracket...[/yellow]")
+            raise KeyboardInterrupt("User requested quit")
+        else:
+            console.print("[red]Invalid choice. Try: A, B, u, or q[/red]")
+
+
+def _render_tournament_screen(console: Console, comparison_data: Dict[str, Any]):
+    """Tournament bracket header, competitor panels and key help"""
     text1 = comparison_data["text1"]
     text2 = comparison_data["text2"] 
     comparison_num = comparison_data["comparison_number"]
@@ -32,8 +67,6 @@ def get_tournament_comparison_choice(comparison_data: Dict[str, Any]) -> str:
     context = comparison_data.get("bracket_info", {})
     current_round = context.get("current_round", 1)
     
-    _clear_screen()
-    
     console.rule("[dim dark_sea_green]Tournament Bracket[/dim dark_sea_green]", style="dim dark_sea_green")
     console.print(f"[dim dark_sea_green]Round {current_round} - Match #{comparison_num}[/dim dark_sea_green]", justify="center")
     console.rule(style="dim dark_sea_green")
@@ -79,46 +112,50 @@ def get_tournament_comparison_choice(comparison_data: Dict[str, Any]) -> str:
     extra_options.append("[q] quit", style="dim red")
     console.print(extra_options)
     console.print()
+
+
+def get_recursive_median_comparison_choice(comparison_data: Dict[str, Any]) -> str:
+    """Recursive median UI: Standardized A vs B direct selection."""
+    
+    console = get_console()
+    
+    text_a_data = comparison_data["text1"]
+    text_b_data = comparison_data["text2"]
+    
+    _show_screen(console, _render_recursive_median_screen, comparison_data)
     
     while True:
-        choice = Prompt.ask("Your choice").lower().strip()
-        
-        if choice in ["a", "competitor a"]:
-            console.print("[green]✓ COMPETITOR A advances (more negative)[/green]\n")
-            return text1["id"]
-        elif choice in ["b", "competitor b"]:
-            console.print("[red]✓ COMPETITOR B advances (more negative)[/red]\n")
-            return text2["id"]
+        choice = ask_choice(console, "Your choice")
+        if choice in ["a"]:
+            console.print("[red]✓ Text A selected (more negative)[/red]\n")
+            return text_a_data["id"]
+        elif choice in ["b"]:
+            console.print("[green]✓ Text B selected (more negative)[/green]\n")
+            return text_b_data["id"]
         elif choice == "u":
             console.print("[yellow]⟲ Undoing last comparison...[/yellow]")
             return "UNDO"
         elif choice == "q":
-            console.print("[yellow]Exiting tournament bracket...[/yellow]")
+            console.print("[yellow]Exiting recursive median sort...[/yellow]")
             raise KeyboardInterrupt("User requested quit")
         else:
-            console.print("[red]Invalid choice. Try: A, B, u, or q[/red]")
+            console.print("[red]Invalid choice. Try: a, b, u, or q[/red]")
 
 
-def get_recursive_median_comparison_choice(comparison_data: Dict[str, Any]) -> str:
-    """Recursive median UI: Standardized A vs B direct selection."""
-    
-    console = Console()
-    
+def _render_recursive_median_screen(console: Console, comparison_data: Dict[str, Any]):
+    """Recursive median header, text panels and key help"""
     text_a_data = comparison_data["text1"]
     text_b_data = comparison_data["text2"]
     comparison_num = comparison_data["comparison_number"]
-    
-    _clear_screen()
         
     if DEBUG:
-        from rich.console import Console as _C
         formatted_a = format_text(text_a_data["text"])
-        _C().print(f"[dim]FORMATTER DEBUG — plain: {repr(formatted_a.plain[:60])}[/dim]")
-        _C().print(f"[dim]FORMATTER DEBUG — spans: {formatted_a._spans[:5]}[/dim]")
-        print(f"DEBUG UI: Received text1 (COMPARISON) = {text_a_data['id']}")
-        print(f"DEBUG UI: Received text2 (PIVOT) = {text_b_data['id']}")
-        print(f"DEBUG UI: PIVOT text preview: {text_b_data['text'][:50]}...")
-        print(f"DEBUG UI: COMPARISON text preview: {text_a_data['text'][:50]}...")
+        console.print(f"[dim]FORMATTER DEBUG — plain: {repr(formatted_a.plain[:60])}[/dim]")
+        console.print(f"[dim]FORMATTER DEBUG — spans: {formatted_a._spans[:5]}[/dim]")
+        console.out(f"DEBUG UI: Received text1 (COMPARISON) = {text_a_data['id']}")
+        console.out(f"DEBUG UI: Received text2 (PIVOT) = {text_b_data['id']}")
+        console.out(f"DEBUG UI: PIVOT text preview: {text_b_data['text'][:50]}...")
+        console.out(f"DEBUG UI: COMPARISON text preview: {text_a_data['text'][:50]}...")
     
     console.rule("[dim violet]Recursive Median Sort[/dim violet]", style="violet")
     console.print(f"[dim violet]Comparison #{comparison_num}[/dim violet]", justify="center")
@@ -171,35 +208,37 @@ def get_recursive_median_comparison_choice(comparison_data: Dict[str, Any]) -> s
     extra_options.append("[q] quit", style="dim blue")
     console.print(extra_options)
     console.print()
+
+
+def get_generic_comparison_choice(comparison_data: Dict[str, Any]) -> str:
+    """Fallback generic comparison for unknown algorithms"""
+    
+    console = get_console()
+    text1 = comparison_data["text1"]
+    text2 = comparison_data["text2"]
+    
+    _show_screen(console, _render_generic_screen, comparison_data)
     
     while True:
-        choice = Prompt.ask("Your choice").lower().strip()
-        if choice in ["a"]:
-            console.print("[red]✓ Text A selected (more negative)[/red]\n")
-            return text_a_data["id"]
-        elif choice in ["b"]:
-            console.print("[green]✓ Text B selected (more negative)[/green]\n")
-            return text_b_data["id"]
-        elif choice == "u":
-            console.print("[yellow]⟲ Undoing last comparison...[/yellow]")
-            return "UNDO"
+        choice = ask_choice(console, "Enter your choice", choices=["A", "B", "a", "b", "q"])
+        
+        if choice == "a":
+            console.print(f"[green]✓ You chose Text A ({text1['id']})[/green]\n")
+            return text1["id"]
+        elif choice == "b":
+            console.print(f"[red]✓ You chose Text B ({text2['id']})[/red]\n")
+            return text2["id"]
         elif choice == "q":
-            console.print("[yellow]Exiting recursive median sort...[/yellow]")
+            console.print("[yellow]Exiting comparison...[/yellow]")
             raise KeyboardInterrupt("User requested quit")
-        else:
-            console.print("[red]Invalid choice. Try: a, b, u, or q[/red]")
 
 
-def get_generic_comparison_choice(comparison_data: Dict[str, Any]) -> str:
-    """Fallback generic comparison for unknown algorithms"""
-    
-    console = Console()
+def _render_generic_screen(console: Console, comparison_data: Dict[str, Any]):
+    """Generic header and text panels"""
     text1 = comparison_data["text1"]
     text2 = comparison_data["text2"]
     comparison_num = comparison_data["comparison_number"]
     
-    _clear_screen()
-    
     console.print("\n" + "="*80)
     console.print(f"[bold cyan]Text Comparison #{comparison_num}[/bold cyan]")
     console.print("="*80 + "\n")
@@ -224,30 +263,40 @@ def get_generic_comparison_choice(comparison_data: Dict[str, Any]) -> str:
     console.print()
     
     console.print("[bold yellow]Which text is MORE NEGATIVE?[/bold yellow]")
-    
-    while True:
-        choice = Prompt.ask("Enter your choice", choices=["A", "B", "a", "b", "q"]).lower()
-        
-        if choice == "a":
-            console.print(f"[green]✓ You chose Text A ({text1['id']})[/green]\n")
-            return text1["id"]
-        elif choice == "b":
-            console.print(f"[red]✓ You chose Text B ({text2['id']})[/red]\n")
-            return text2["id"]
-        elif choice == "q":
-            console.print("[yellow]Exiting comparison...[/yellow]")
-            raise KeyboardInterrupt("User requested quit")
 
 def get_transitive_quick_comparison_choice(comparison_data: Dict[str, Any]) -> str:
     """Transitive Quick UI: Simple A vs B direct selection."""
     
-    console = Console()
+    console = get_console()
     
     text_a_data = comparison_data["text1"]
     text_b_data = comparison_data["text2"]
-    comparison_num = comparison_data["comparison_number"]
     
-    _clear_screen()
+    _show_screen(console, _render_transitive_quick_screen, comparison_data)
+    
+    while True:
+        choice = ask_choice(console, "Your choice")
+        if choice in ["a"]:
+            console.print("[red]✓ Text A selected (more negative)[/red]\n")
+            return text_a_data["id"]
+        elif choice in ["b"]:
+            console.print("[green]✓ Text B selected (more negative)[/green]\n")
+            return text_b_data["id"]
+        elif choice == "u":
+            console.print("[yellow]⟲ Undoing last comparison...[/yellow]")
+            return "UNDO"
+        elif choice == "q":
+            console.print("[yellow]Exiting transitive ranking...[/yellow]")
+            raise KeyboardInterrupt("User requested quit")
+        else:
+            console.print("[red]Invalid choice. Try: a, b, u, or q[/red]")
+
+
+def _render_transitive_quick_screen(console: Console, comparison_data: Dict[str, Any]):
+    """Transitive quick header, text panels and key help"""
+    text_a_data = comparison_data["text1"]
+    text_b_data = comparison_data["text2"]
+    comparison_num = comparison_data["comparison_number"]
     
     dim_magenta = "dim magenta"
     console.rule("[dim magenta]Transitive Quick Rank[/]", style=dim_magenta)
@@ -301,24 +350,78 @@ def get_transitive_quick_comparison_choice(comparison_data: Dict[str, Any]) -> s
     extra_options.append("[q] quit", style="dim blue")
     console.print(extra_options)
     console.print()
+
+
+# Screen renderer per configured algorithm (anything else uses the generic screen)
+_SCREEN_RENDERERS: Dict[str, ScreenRenderer] = {
+    "tournament": _render_tournament_screen,
+    "recursive_median": _render_recursive_median_screen,
+    "transitive_quick": _render_transitive_quick_screen,
+}
+
+
+def _screen_key(comparison_data: Dict[str, Any], width: int) -> Tuple:
+    return (
+        comparison_data.get("algorithm", ""),
+        comparison_data["text1"]["id"],
+        comparison_data["text2"]["id"],
+        comparison_data["comparison_number"],
+        width
+    )
+
+
+def _render_to_string(renderer: ScreenRenderer, comparison_data: Dict[str, Any],
+                      width: int, color_system: Optional[str]) -> str:
+    """Render a screen into a string with the live console's width and colours"""
+    buffer = io.StringIO()
+    buffer_console = Console(file=buffer, force_terminal=True, color_system=color_system, width=width)
+    renderer(buffer_console, comparison_data)
+    return buffer.getvalue()
+
+
+def prerender_comparison(comparison_data: Dict[str, Any]):
+    """
+    Render the screen for an upcoming comparison in a background thread, so
+    _show_screen can swap it in as soon as the current answer is entered.
+    """
+    global _prerender_executor
+    console = get_console()
+    if not supports_redraw(console):
+        return  # buffered ANSI frames are only replayed on real (non-legacy) terminals
     
-    while True:
-        choice = Prompt.ask("Your choice").lower().strip()
-        if choice in ["a"]:
-            console.print("[red]✓ Text A selected (more negative)[/red]\n")
-            return text_a_data["id"]
-        elif choice in ["b"]:
-            console.print("[green]✓ Text B selected (more negative)[/green]\n")
-            return text_b_data["id"]
-        elif choice == "u":
-            console.print("[yellow]⟲ Undoing last comparison...[/yellow]")
-            return "UNDO"
-        elif choice == "q":
-            console.print("[yellow]Exiting transitive ranking...[/yellow]")
-            raise KeyboardInterrupt("User requested quit")
-        else:
-            console.print("[red]Invalid choice. Try: a, b, u, or q[/red]")
+    key = _screen_key(comparison_data, console.width)
+    if key in _prerendered:
+        return
+    if _prerender_executor is None:
+        _prerender_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prerender")
+    
+    renderer = _SCREEN_RENDERERS.get(comparison_data.get("algorithm", ""), _render_generic_screen)
+    _prerendered[key] = _prerender_executor.submit(
+        _render_to_string, renderer, comparison_data, console.width, console.color_system
+    )
+    # Keep only the most recent screens - older announcements were never asked
+    while len(_prerendered) > PRERENDER_SLOTS:
+        _prerendered.pop(next(iter(_prerendered))).cancel()
+
 
-def _clear_screen():
-    """Clear screen helper"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+def _show_screen(console: Console, renderer: ScreenRenderer, comparison_data: Dict[str, Any]):
+    """
+    Replace the screen with a comparison frame in a single terminal write,
+    using the pre-rendered frame when one exists
+    """
+    if not supports_redraw(console):
+        clear_terminal(console)
+        renderer(console, comparison_data)
+        return
+    
+    frame = None
+    future = _prerendered.pop(_screen_key(comparison_data, console.width), None)
+    if future is not None and not future.cancelled():
+        try:
+            frame = future.result()
+        except Exception:
+            frame = None  # render it now instead
+    if frame is None:
+        frame = _render_to_string(renderer, comparison_data, console.width, console.color_system)
+    
+    redraw(console, frame)
@@ -7,15 +7,15 @@ from rich.prompt import Prompt
 from rich.align import Align
 from rich.panel import Panel
 from rich import box
+from .screen import clear_terminal
 
-import os
 from ..config.constants import get_user_color
 from ..ranking.session_manager import get_session_manager
 from ..data.file_scanner import scan_data_directory
 
 def clear_screen():
     """Clear screen for clean display"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_terminal()
 
 def show_file_selection(username: str) -> Optional[str]:
     """
@@ -113,11 +113,14 @@ def display_file_selection_table(available_files, session_manager, username, con
     file_table.add_column("Your Progress", style="bright_white", width=17)  # Changed from white to bright_white
     file_table.add_column("Status", style="bright_white", width=18)  # Changed from white to bright_white
 
+    # One progress index read for all datasets instead of parsing every session file
+    user_progress = session_manager.get_user_progress(username)
+
     for i, file_info in enumerate(available_files, 1):
         filename = file_info["filename"]
         file_stem = file_info["stem"]
 
-        progress = session_manager.get_session_progress(username, file_stem)
+        progress = user_progress.get(file_stem, {"exists": False, "comparisons_made": 0})
         
         # Determine comparisons count
         comparisons = progress.get("comparisons_made", 0) if progress["exists"] else 0
@@ -0,0 +1,77 @@
+# src/text_ranking_tool/ux/key_input.py
+"""
+Single-keystroke answers for the comparison prompts
+With "input_mode": "keystroke" in config.json, answers are taken the moment a
+key is pressed (no Enter, no line editing) on POSIX terminals via termios.
+Everywhere else - the default "line" mode, Windows, piped stdin - prompts
+keep using Rich's Prompt.ask.
+"""
+
+import os
+import sys
+from typing import List, Optional, Sequence
+from rich.console import Console
+from rich.prompt import Prompt
+from ..config.constants import INPUT_MODE
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+    tty = None
+
+# Keys a comparison prompt answers to when it lists no explicit choices
+COMPARISON_KEYS = ("a", "b", "u", "q")
+
+
+def keystroke_input_enabled() -> bool:
+    """True when keystroke mode is configured and stdin is a POSIX terminal"""
+    if INPUT_MODE != "keystroke" or termios is None:
+        return False
+    try:
+        return sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def read_key() -> str:
+    """
+    One keypress from stdin, read in cbreak mode so Ctrl-C still interrupts.
+    Enter, arrow/function keys and pasted text come back as '' so a stray
+    escape sequence can never be taken as an answer.
+    """
+    fd = sys.stdin.fileno()
+    previous = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        data = os.read(fd, 32)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, previous)
+
+    if not data:
+        raise EOFError("stdin closed")
+    if len(data) != 1 or data in (b'\r', b'\n'):
+        return ''
+    return data.decode('ascii', errors='ignore')
+
+
+def ask_choice(console: Console, prompt: str, choices: Optional[List[str]] = None,
+               keys: Sequence[str] = COMPARISON_KEYS) -> str:
+    """
+    Lower-cased answer: a single keystroke when enabled, otherwise a line via Prompt.ask.
+    In keystroke mode only `choices` (or `keys` when no choices are given) are
+    accepted; any other key, Enter and escape sequences included, is ignored.
+    """
+    if not keystroke_input_enabled():
+        if choices:
+            return Prompt.ask(prompt, choices=choices).lower()
+        return Prompt.ask(prompt).lower().strip()
+
+    valid = {key.lower() for key in (choices or keys)}
+    console.print(f"{prompt}: ", end="")
+    while True:
+        key = read_key().lower()
+        if key in valid:
+            console.print(key)
+            return key
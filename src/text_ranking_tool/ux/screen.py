@@ -0,0 +1,48 @@
+# src/text_ranking_tool/ux/screen.py
+"""
+Persistent terminal console and in-place screen redraws
+Screens are cleared with ANSI home/erase sequences written through one shared
+Rich console instead of spawning a `clear`/`cls` shell for every screen.
+"""
+
+import os
+from typing import Optional
+from rich.console import Console
+
+# Cursor home, erase screen, erase scrollback (what `clear` does)
+CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
+# Global instance
+_console_instance: Optional[Console] = None
+
+def get_console() -> Console:
+    """Get the shared console used by the comparison screens"""
+    global _console_instance
+    if _console_instance is None:
+        _console_instance = Console()
+    return _console_instance
+
+
+def supports_redraw(console: Console) -> bool:
+    """True when the console understands ANSI clear/redraw sequences"""
+    return console.is_terminal and not console.legacy_windows
+
+
+def clear_terminal(console: Optional[Console] = None):
+    """Clear the screen in place (legacy Windows consoles still use `cls`)"""
+    console = console or get_console()
+    if supports_redraw(console):
+        console.file.write(CLEAR_SEQUENCE)
+        console.file.flush()
+    elif console.is_terminal:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+
+def redraw(console: Console, frame: str):
+    """Replace the screen with an already rendered frame in a single terminal write"""
+    if supports_redraw(console):
+        frame = CLEAR_SEQUENCE + frame
+    elif console.is_terminal:
+        clear_terminal(console)
+    console.file.write(frame)
+    console.file.flush()
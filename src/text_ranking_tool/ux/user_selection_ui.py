@@ -1,6 +1,5 @@
 # src/text_ranking_tool/ux/user_selection_ui.py
 
-import os
 import time
 from typing import Optional
 from rich.console import Console
@@ -9,11 +8,12 @@ from rich.prompt import Prompt
 from rich.text import Text
 from rich.table import Table
 from rich.align import Align
+from .screen import clear_terminal
 from ..config.constants import USER_MAPPING, get_user_color
 
 def clear_screen():
     """Clear screen for clean display"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_terminal()
 
 def show_user_selection() -> Optional[str]:
     """
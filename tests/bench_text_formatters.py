@@ -0,0 +1,99 @@
+# tests/bench_text_formatters.py
+import sys
+import os
+import random
+import re
+import string
+import time
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.text_ranking_tool.utils.text_formatters import _compile_patterns, _regex_spans  # noqa: E402
+from src.text_ranking_tool.utils.aho_corasick import AhoCorasickMatcher                 # noqa: E402
+
+# Per-pattern scanning (the original implementation) is only timed for small lists
+LEGACY_MAX_PATTERNS = 5000
+
+
+def make_dictionary(n_patterns: int, vocab: list) -> list:
+    """Mix of exact words, wildcard stems, exact phrases and phrases with a wildcard last word"""
+    patterns = []
+    for word in random.sample(vocab, n_patterns):
+        kind = random.random()
+        if kind < 0.4:
+            patterns.append(word)
+        elif kind < 0.7:
+            patterns.append(word[:max(3, len(word) - 2)] + '*')
+        elif kind < 0.85:
+            patterns.append(f"{word} {random.choice(vocab)}")
+        else:
+            patterns.append(f"{word} {random.choice(vocab)[:3]}*")
+    return patterns
+
+
+def legacy_spans(patterns: list, raw: str) -> set:
+    """Characters styled by compiling and scanning one regex per pattern"""
+    styled = set()
+    for stem in patterns:
+        if stem.endswith('*'):
+            prefix = stem[:-1]
+            if ' ' in prefix:
+                fixed_prefix, last_word_prefix = prefix.rsplit(' ', 1)
+                pat_str = rf'\b{re.escape(fixed_prefix)}\s+{re.escape(last_word_prefix)}\w*'
+            else:
+                pat_str = rf'\b{re.escape(prefix)}\w*'
+        else:
+            pat_str = rf'\b{re.escape(stem)}\b'
+        for match in re.finditer(pat_str, raw):
+            styled.update(range(match.start(), match.end()))
+    return styled
+
+
+def covered(spans: list) -> set:
+    return {i for start, end in spans for i in range(start, end)}
+
+
+def run_benchmark(sizes: list, n_texts: int = 50, words_per_text: int = 150):
+    """Times building and scanning for each dictionary size and checks all engines agree"""
+    random.seed(0)
+    vocab = list({''.join(random.choices(string.ascii_lowercase, k=random.randint(3, 9)))
+                  for _ in range(max(sizes) * 2)})
+    texts = [' '.join(random.choices(vocab, k=words_per_text)) for _ in range(n_texts)]
+
+    print(f"{'patterns':>9} | {'regex build':>11} {'regex/text':>10} | {'AC build':>9} {'AC/text':>9} | {'legacy/text':>11} | agree")
+    print("-" * 82)
+    for size in sizes:
+        patterns = tuple(make_dictionary(size, vocab))
+        _compile_patterns.cache_clear()
+
+        start = time.perf_counter()
+        regex = _compile_patterns(patterns)
+        regex_build = time.perf_counter() - start
+        start = time.perf_counter()
+        regex_results = [_regex_spans(regex, text) for text in texts]
+        regex_scan = (time.perf_counter() - start) / n_texts
+
+        start = time.perf_counter()
+        automaton = AhoCorasickMatcher(patterns)
+        ac_build = time.perf_counter() - start
+        start = time.perf_counter()
+        ac_results = [automaton.spans(text) for text in texts]
+        ac_scan = (time.perf_counter() - start) / n_texts
+
+        agree = regex_results == ac_results
+        legacy = "-"
+        if size <= LEGACY_MAX_PATTERNS:
+            start = time.perf_counter()
+            legacy_results = [legacy_spans(list(patterns), text) for text in texts[:5]]
+            legacy = f"{1000 * (time.perf_counter() - start) / 5:9.2f}ms"
+            agree = agree and all(covered(spans) == styled for spans, styled in zip(ac_results, legacy_results))
+
+        print(f"{size:>9} | {regex_build:>10.2f}s {1000 * regex_scan:>8.2f}ms | {ac_build:>8.2f}s {1000 * ac_scan:>7.2f}ms | {legacy:>11} | {'✅' if agree else '❌'}")
+
+
+# Usage: python tests/bench_text_formatters.py [dictionary sizes...]
+if __name__ == "__main__":
+    print("🚀 Text formatting matcher benchmark")
+    print("=" * 82)
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 5000, 20000, 100000]
+    run_benchmark(sizes)
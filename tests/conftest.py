@@ -0,0 +1,20 @@
+# tests/conftest.py
+import sys
+import os
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.data.dataset_cache as dataset_cache       # noqa: E402
+import src.text_ranking_tool.stats.analysis_cache as analysis_cache    # noqa: E402
+
+
+@pytest.fixture(scope='session', autouse=True)
+def isolated_caches(tmp_path_factory):
+    """Keep the dataset and analysis caches out of the working tree during tests"""
+    cache_root = tmp_path_factory.mktemp('caches')
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(dataset_cache, "_dataset_cache_instance", dataset_cache.DatasetCache(cache_root / 'dataset'))
+        patch.setattr(analysis_cache, "_analysis_cache_instance",
+                      analysis_cache.AnalysisCache(cache_root / 'analysis'))
+        yield
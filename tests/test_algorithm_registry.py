@@ -0,0 +1,81 @@
+# tests/test_algorithm_registry.py
+import sys
+import os
+import json
+import importlib
+import subprocess
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.text_ranking_tool.algorithms.registry import AlgorithmRegistry, algorithm_registry  # noqa: E402
+from src.text_ranking_tool.config import constants                                         # noqa: E402
+
+_LIST_PROBE = """
+import json, sys
+from src.text_ranking_tool.algorithms import algorithm_registry
+listed = algorithm_registry.list_algorithms()
+print(json.dumps({'ids': sorted(listed), 'imported': sorted(m for m in sys.modules if m.endswith('_core'))}))
+"""
+
+
+def test_listing_does_not_import_algorithms():
+    """Metadata comes from the declarations; no algorithm module is imported to list them"""
+    output = subprocess.run([sys.executable, "-c", _LIST_PROBE], cwd=project_root,
+                            capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    assert {"recursive_median", "tournament", "transitive_quick"} <= set(result['ids'])
+    assert result['imported'] == []
+
+
+def test_manifest_matches_algorithm_classes():
+    """Every declared algorithm loads on creation and its class agrees with the manifest"""
+    registry = AlgorithmRegistry()
+    for algo_id, info in registry.list_algorithms().items():
+        algorithm = registry.create_algorithm(algo_id)
+        print(f"{algo_id:18s} -> {type(algorithm).__name__} ({info['source']})")
+        assert type(algorithm).ALGORITHM_ID == algo_id
+        assert type(algorithm).NAME == info['name']
+        assert type(algorithm).DESCRIPTION == info['description']
+
+
+def install_demo_plugin(site_dir):
+    """A fake installed distribution declaring one valid and one malformed algorithm entry point"""
+    dist_info = site_dir / "demo_algo-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: demo-algo\nVersion: 1.0\n"
+                                        "Summary: Demo third-party ranking algorithm\n")
+    (dist_info / "entry_points.txt").write_text("[text_ranking_tool.algorithms]\n"
+                                                "demo = demo_algo:DemoSort\n"
+                                                "broken = demo_algo\n")
+    (site_dir / "demo_algo.py").write_text(
+        "from src.text_ranking_tool.algorithms.recursive_median.recursive_median_core import RecursiveMedianSort\n"
+        "class DemoSort(RecursiveMedianSort):\n"
+        "    ALGORITHM_ID = 'demo'\n")
+
+
+def test_plugin_algorithm_can_be_listed_and_selected(tmp_path, monkeypatch):
+    """An entry point plugin shows up in the admin algorithm list and can be selected and created"""
+    install_demo_plugin(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    monkeypatch.setattr(algorithm_registry, "_specs", None)
+    monkeypatch.setattr(constants, "CONFIGURED_ALGORITHM", constants.CONFIGURED_ALGORITHM)
+
+    available = constants.get_available_algorithms()
+    assert "demo" in available and "broken" not in available
+    assert available[:len(constants.AVAILABLE_ALGORITHMS)] == constants.AVAILABLE_ALGORITHMS
+    assert algorithm_registry.list_algorithms()["demo"]["description"] == "Demo third-party ranking algorithm"
+
+    assert constants.set_algorithm("demo")
+    assert constants.get_configured_algorithm() == "demo"
+    assert type(algorithm_registry.create_algorithm("demo")).__name__ == "DemoSort"
+    assert not constants.set_algorithm("broken")
+
+
+# Usage
+if __name__ == "__main__":
+    print("🚀 Algorithm registry discovery")
+    print("=" * 50)
+    test_listing_does_not_import_algorithms()
+    test_manifest_matches_algorithm_classes()
+    print("✅ Declared metadata matches every algorithm")
@@ -0,0 +1,101 @@
+# tests/test_analysis_cache.py
+import sys
+import os
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.stats.analysis_cache as analysis_cache    # noqa: E402
+from src.text_ranking_tool.stats.analysis_cache import AnalysisCache, file_fingerprint  # noqa: E402
+
+
+class Counter:
+    """compute() stand-in that records how often it ran"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {'value': self.calls}
+
+
+def set_mtime(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def export_file(tmp_path):
+    path = tmp_path / 'export.csv'
+    path.write_text('id,new_ranking\nT1,1\n', encoding='utf-8')
+    set_mtime(path, 1_700_000_000_000_000_000)
+    return path
+
+
+def test_hit_until_size_or_mtime_changes(tmp_path, export_file):
+    cache = AnalysisCache(tmp_path / 'cache')
+    compute = Counter()
+    lookup = lambda: cache.get_or_compute(('ranking', file_fingerprint(export_file)), compute)  # noqa: E731
+
+    assert lookup() == {'value': 1}
+    assert lookup() == {'value': 1}
+    assert compute.calls == 1
+
+    # Rewritten with the same size and mtime: the fingerprint cannot tell, still a hit
+    export_file.write_text('id,new_ranking\nT2,1\n', encoding='utf-8')
+    set_mtime(export_file, 1_700_000_000_000_000_000)
+    assert lookup() == {'value': 1}
+
+    # Same size, new mtime
+    set_mtime(export_file, 1_800_000_000_000_000_000)
+    assert lookup() == {'value': 2}
+
+    # New size, same mtime
+    export_file.write_text('id,new_ranking\nT2,1\nT3,2\n', encoding='utf-8')
+    set_mtime(export_file, 1_800_000_000_000_000_000)
+    assert lookup() == {'value': 3}
+    assert compute.calls == 3
+
+
+def test_entries_persist_across_instances(tmp_path):
+    AnalysisCache(tmp_path / 'cache').put(('key',), [1, 2, 3])
+    assert AnalysisCache(tmp_path / 'cache').get(('key',)) == [1, 2, 3]
+
+
+def test_metrics_version_bump_invalidates(tmp_path, monkeypatch):
+    AnalysisCache(tmp_path / 'cache').put(('key',), 'old')
+    monkeypatch.setattr(analysis_cache, "METRICS_VERSION", analysis_cache.METRICS_VERSION + 1)
+    assert AnalysisCache(tmp_path / 'cache').get(('key',), 'missing') == 'missing'
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = AnalysisCache(tmp_path / 'cache')
+    cache.put(('key',), 'value')
+    for entry in (tmp_path / 'cache').glob('*.pkl'):
+        entry.write_bytes(b'not a pickle')
+    assert AnalysisCache(tmp_path / 'cache').get(('key',), 'missing') == 'missing'
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = AnalysisCache(tmp_path / 'cache', max_entries=2, memory_entries=1)
+    cache.put(('a',), 1)
+    cache.put(('b',), 2)
+    # Touch 'a' on disk so 'b' is the oldest entry
+    entry_a = tmp_path / 'cache' / f"{cache._digest(('a',))}.pkl"
+    entry_b = tmp_path / 'cache' / f"{cache._digest(('b',))}.pkl"
+    set_mtime(entry_b, 1_600_000_000_000_000_000)
+    set_mtime(entry_a, 1_700_000_000_000_000_000)
+    cache.put(('c',), 3)
+
+    fresh = AnalysisCache(tmp_path / 'cache')
+    assert fresh.get(('a',)) == 1
+    assert fresh.get(('b',)) is None
+    assert fresh.get(('c',)) == 3
+
+
+def test_clear_drops_memory_and_disk(tmp_path):
+    cache = AnalysisCache(tmp_path / 'cache')
+    cache.put(('key',), 'value')
+    cache.clear()
+    assert cache.get(('key',)) is None
+    assert not list((tmp_path / 'cache').glob('*.pkl'))
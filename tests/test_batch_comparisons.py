@@ -0,0 +1,55 @@
+# tests/test_batch_comparisons.py
+import sys
+import os
+import csv
+import random
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.text_ranking_tool.stats.statistics_calculator import StatisticsCalculator  # noqa: E402
+from src.text_ranking_tool.data.csv_loader import load_ranking_data                 # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+
+
+@pytest.fixture(scope='module')
+def export_files(tmp_path_factory):
+    """12 exports (66 pairs, enough for the process pool) of shuffled mock rankings"""
+    export_dir = tmp_path_factory.mktemp('exports')
+    ids = [item['id'] for item in load_ranking_data(data_path)]
+    rng = random.Random(3)
+    paths = []
+    for n in range(12):
+        path = export_dir / f'export_{n:02d}.csv'
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'new_ranking'])
+            ranking = rng.sample(ids, len(ids) - n)  # later exports miss a few texts
+            rows = [(text_id, rank) for rank, text_id in enumerate(ranking, 1)]
+            rng.shuffle(rows)  # new_ranking, not row order, defines the ranking
+            writer.writerows(rows)
+        paths.append(path)
+    return paths
+
+
+def baseline_results(paths):
+    """Pair-by-pair comparison re-reading both files every time"""
+    return {
+        (paths[i].name, paths[j].name): StatisticsCalculator.compare_two_csv_files(paths[i], paths[j])
+        for i in range(len(paths)) for j in range(i + 1, len(paths))
+    }
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_batch_comparisons_match_pairwise_baseline(export_files, max_workers):
+    progress = []
+    results = StatisticsCalculator.batch_compare_csv_files(
+        export_files, max_workers=max_workers, progress_callback=lambda done, total: progress.append((done, total)))
+
+    assert results == baseline_results(export_files)
+    assert progress == [(done, 66) for done in range(1, 67)]
+
+
+def test_batch_comparison_of_one_file_is_empty(export_files):
+    assert StatisticsCalculator.batch_compare_csv_files(export_files[:1]) == {}
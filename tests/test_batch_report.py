@@ -0,0 +1,104 @@
+# tests/test_batch_report.py
+import sys
+import os
+import json
+import shutil
+import numpy as np
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.stats.batch_report as batch_report        # noqa: E402
+import src.text_ranking_tool.stats.analysis_cache as analysis_cache    # noqa: E402
+from tests.test_record_writers import make_exporter, USERS            # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+_dataset_dashboard = batch_report._dataset_dashboard
+
+
+def failing_dashboard(dataset_stem, sources, n_resamples=batch_report.BOOTSTRAP_RESAMPLES):
+    """_dataset_dashboard failing for 'broken' (module level so the process pool can pickle it)"""
+    if dataset_stem == 'broken':
+        raise ValueError("corrupt dataset")
+    return _dataset_dashboard(dataset_stem, sources, n_resamples)
+
+
+@pytest.fixture
+def report_dirs(tmp_path, monkeypatch):
+    """Two mock datasets ranked by both users, plus a third dataset whose analysis fails"""
+    make_exporter(tmp_path, monkeypatch)
+    shutil.copy(data_path, tmp_path / 'data' / 'broken.csv')
+
+    monkeypatch.setattr(analysis_cache, "_analysis_cache_instance",
+                        analysis_cache.AnalysisCache(tmp_path / 'analysis_cache'))
+    monkeypatch.setattr(batch_report, "INTERNAL_DATA_DIR", tmp_path / 'data')
+    monkeypatch.setattr(batch_report, "INTERNAL_EXPORT_DIR", tmp_path / 'internal')
+    monkeypatch.setattr(batch_report, "USER_MAPPING", {user: user.replace(" ", "") for user in USERS})
+
+    monkeypatch.setattr(batch_report, "_dataset_dashboard", failing_dashboard)
+    return tmp_path
+
+
+def test_serial_batch_analysis_skips_failing_dataset(report_dirs, capsys):
+    """max_workers=1 reports a failing dataset and still writes every other dataset's rows"""
+    progress = []
+    report = batch_report.run_batch_analysis(
+        report_dirs / 'reports', max_workers=1, n_resamples=200,
+        progress_callback=lambda done, total: progress.append((done, total)))
+
+    assert "Analysis failed for dataset broken" in capsys.readouterr().out
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    assert sorted(report.dashboard['Dataset'].unique()) == ['set_a', 'set_b']
+    assert sorted(report.dashboard['Participant']) == sorted(['Machine', *USERS] * 2)
+    assert list(report.summary['Dataset']) == ['set_a', 'set_b']
+    assert list(report.summary['Participants']) == [2, 2]
+
+    # Bootstrap CIs bracket each human's estimate; the machine row has none
+    humans = report.dashboard[report.dashboard['Participant'] != 'Machine']
+    machine = report.dashboard[report.dashboard['Participant'] == 'Machine']
+    for column in batch_report.BOOTSTRAP_COLUMNS.values():
+        assert (humans[f'{column} CI Lower'] <= humans[column] + 1e-9).all()
+        assert (humans[column] <= humans[f'{column} CI Upper'] + 1e-9).all()
+        assert machine[f'{column} CI Lower'].isna().all()
+
+    with open(report.json_path, encoding='utf-8') as f:
+        written = json.load(f)
+    assert written['datasets'] == ['broken', 'set_a', 'set_b']
+    assert len(written['dashboard']) == len(report.dashboard)
+    assert report.csv_path.exists()
+
+
+def test_zero_resamples_skips_intervals(report_dirs):
+    """n_resamples=0 leaves the dashboard without CI columns"""
+    report = batch_report.run_batch_analysis(
+        report_dirs / 'reports', max_workers=1, datasets=['set_a'], n_resamples=0)
+    assert not any(column.endswith('CI Lower') for column in report.dashboard.columns)
+    assert np.isclose(report.dashboard.loc[report.dashboard['Participant'] == 'Machine', 'Kendall τ'], 1.0).all()
+
+
+def test_pool_workers_never_resolve_sources(report_dirs, monkeypatch, capsys):
+    """The export manifest is read (and saved) by the parent only; each warning prints once"""
+    parent = os.getpid()
+    original_resolve = batch_report.StatsForUI.resolve_participant_sources
+    resolved = []
+
+    def parent_only_resolve(dataset_stem, *args):
+        if os.getpid() != parent:
+            raise AssertionError("sources resolved in a pool worker")
+        resolved.append(dataset_stem)
+        print(f"resolving {dataset_stem}")
+        return original_resolve(dataset_stem, *args)
+
+    monkeypatch.setattr(batch_report.StatsForUI, "resolve_participant_sources", staticmethod(parent_only_resolve))
+    progress = []
+    report = batch_report.run_batch_analysis(
+        report_dirs / 'reports', max_workers=2, n_resamples=0,
+        progress_callback=lambda done, total: progress.append(done))
+
+    assert sorted(resolved) == ['broken', 'set_a', 'set_b']
+    out = capsys.readouterr().out
+    assert out.count("resolving set_a") == 1
+    assert out.count("Analysis failed for dataset broken") == 1
+    assert progress == [1, 2, 3]
+    assert sorted(report.dashboard['Dataset'].unique()) == ['set_a', 'set_b']
@@ -0,0 +1,86 @@
+# tests/test_bootstrap.py
+import sys
+import os
+import random
+import numpy as np
+import pytest
+from scipy.stats import kendalltau, spearmanr
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.text_ranking_tool.stats import bootstrap                                    # noqa: E402
+from src.text_ranking_tool.stats import metric_kernels                               # noqa: E402
+from src.text_ranking_tool.stats.statistics_calculator import StatisticsCalculator  # noqa: E402
+from src.text_ranking_tool.data.csv_loader import load_ranking_data                 # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+
+N_RESAMPLES = 200
+SEED = 11
+
+
+@pytest.fixture(scope='module')
+def rankings():
+    """Machine order of the mock data and a noisy human-like reordering of it"""
+    data = load_ranking_data(data_path)
+    machine = [item['id'] for item in sorted(data, key=lambda x: int(x['ranking']))]
+    rng = random.Random(5)
+    human = sorted(machine, key=lambda text_id: machine.index(text_id) + rng.gauss(0, 6))
+    return machine, human
+
+
+@pytest.fixture(scope='module')
+def positions(rankings):
+    return metric_kernels.aligned_positions(*rankings)
+
+
+def per_resample_baseline(pos1, pos2, draws, k):
+    """One resample at a time: SciPy correlations and top-k overlap of the stable re-rankings"""
+    kendall, spearman, overlap = [], [], []
+    for row in draws:
+        x, y = pos1[row], pos2[row]
+        kendall.append(kendalltau(x, y)[0])
+        spearman.append(spearmanr(x, y)[0])
+        top1 = set(np.argsort(x, kind='stable')[:k])
+        top2 = set(np.argsort(y, kind='stable')[:k])
+        overlap.append(len(top1 & top2) / k)
+    return np.array(kendall), np.array(spearman), np.array(overlap)
+
+
+def test_batched_samples_match_per_resample_scipy(positions):
+    pos1, pos2 = positions
+    samples = bootstrap.bootstrap_samples(pos1, pos2, N_RESAMPLES, (10, 20), SEED)
+    draws = bootstrap.resample_draws(len(pos1), N_RESAMPLES, np.random.default_rng(SEED))
+
+    kendall, spearman, overlap_10 = per_resample_baseline(pos1, pos2, draws, 10)
+    np.testing.assert_allclose(samples['kendall_tau'], kendall, atol=1e-5)
+    np.testing.assert_allclose(samples['spearman_rho'], spearman, atol=1e-9)
+    np.testing.assert_allclose(samples['overlap_at_10'], overlap_10)
+    assert samples['overlap_at_20'].shape == (N_RESAMPLES,)
+
+
+def test_draw_weights_count_repeats():
+    draws = np.array([[0, 0, 2], [1, 1, 1]])
+    np.testing.assert_array_equal(bootstrap.draw_weights(draws), [[2, 0, 1], [0, 3, 0]])
+
+
+def test_parallel_samples_are_reproducible(positions):
+    pos1, pos2 = positions
+    first = bootstrap.parallel_bootstrap_samples(pos1, pos2, 50, (10,), seed=SEED, n_jobs=2)
+    second = bootstrap.parallel_bootstrap_samples(pos1, pos2, 50, (10,), seed=SEED, n_jobs=2)
+    assert set(first) == {'kendall_tau', 'spearman_rho', 'overlap_at_10'}
+    for key in first:
+        assert len(first[key]) == 50
+        np.testing.assert_array_equal(first[key], second[key])
+
+
+def test_confidence_intervals_bracket_scipy_estimates(rankings):
+    machine, human = rankings
+    intervals = StatisticsCalculator.bootstrap_confidence_intervals(
+        machine, human, n_resamples=N_RESAMPLES, seed=SEED)
+
+    pos1, pos2 = metric_kernels.aligned_positions(machine, human)
+    assert intervals['kendall_tau'].estimate == pytest.approx(kendalltau(pos1, pos2)[0])
+    assert intervals['spearman_rho'].estimate == pytest.approx(spearmanr(pos1, pos2)[0])
+    for interval in intervals.values():
+        assert interval.lower <= interval.estimate <= interval.upper
@@ -0,0 +1,119 @@
+# tests/test_consensus.py
+import sys
+import os
+import random
+from itertools import combinations, permutations
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.text_ranking_tool.ranking.consensus import (                  # noqa: E402
+    borda_consensus, copeland_consensus, kemeny_consensus
+)
+
+PROFILE = {
+    'v1': ['A', 'B', 'C', 'D'],
+    'v2': ['A', 'C', 'B', 'D'],
+    'v3': ['B', 'A', 'D', 'C'],
+}
+
+
+def kemeny_cost(order, rankings):
+    """Total pairwise disagreements of order with every ranking (on the items each ranked)"""
+    position = {item: i for i, item in enumerate(order)}
+    cost = 0
+    for ranking in rankings.values():
+        for a, b in combinations(ranking, 2):  # a ranked above b
+            cost += position[a] > position[b]
+    return cost
+
+
+def test_borda_known_profile():
+    result = borda_consensus(PROFILE)
+    assert result.ranking == ['A', 'B', 'C', 'D']
+    assert result.scores == pytest.approx({'A': 8 / 9, 'B': 6 / 9, 'C': 3 / 9, 'D': 1 / 9})
+    assert result.n_annotators == 3
+
+
+def test_borda_partial_rankings_weigh_equally():
+    """A two-item ranking gives its top item a full point, like a complete ranking does"""
+    result = borda_consensus({**PROFILE, 'v4': ['D', 'C']})
+    assert result.scores['D'] == pytest.approx((0 + 0 + 1 / 3 + 1) / 4)
+    assert result.scores['A'] == pytest.approx(8 / 9)  # A's score averages only the rankings containing it
+
+
+def copeland_baseline(memories, items):
+    """Pair-by-pair majority vote with dictionaries"""
+    votes = {}
+    for memory in memories:
+        for (a, b), a_won in memory.items():
+            winner, loser = (a, b) if a_won else (b, a)
+            key = tuple(sorted((a, b)))
+            votes.setdefault(key, {a: 0, b: 0})[winner] += 1
+    scores = {item: 0.0 for item in items}
+    for (a, b), tally in votes.items():
+        if tally[a] == tally[b]:
+            scores[a] += 0.5
+            scores[b] += 0.5
+        else:
+            scores[a if tally[a] > tally[b] else b] += 1
+    return scores
+
+
+def test_copeland_known_profile():
+    memories = [
+        {('A', 'B'): True, ('A', 'C'): True, ('B', 'C'): True},
+        {('B', 'A'): False, ('C', 'A'): False, ('C', 'B'): True},
+        {('A', 'B'): False, ('B', 'C'): True},
+    ]
+    result = copeland_consensus(memories)
+    assert result.ranking == ['A', 'B', 'C']
+    assert result.scores == {'A': 2.0, 'B': 1.0, 'C': 0.0}
+    assert result.n_annotators == 3
+
+
+def test_copeland_tied_pair_and_unseen_items():
+    result = copeland_consensus([{('X', 'Y'): True}, {('Y', 'X'): True}], items=['Z', 'Y', 'X'])
+    assert result.scores == {'Z': 0.0, 'Y': 0.5, 'X': 0.5}
+    assert result.ranking == ['Y', 'X', 'Z']  # equal scores and margins keep input order
+
+
+def test_copeland_matches_pairwise_baseline():
+    rng = random.Random(1)
+    items = [f'T{i:02d}' for i in range(12)]
+    memories = []
+    for _ in range(5):
+        memory = {}
+        for a, b in rng.sample(list(combinations(items, 2)), 40):
+            pair = (a, b) if rng.random() < 0.5 else (b, a)
+            memory[pair] = rng.random() < 0.6
+        memories.append(memory)
+    result = copeland_consensus(memories, items=items)
+    assert result.scores == pytest.approx(copeland_baseline(memories, items))
+
+
+def test_kemeny_recovers_condorcet_order_from_reversed_start():
+    rankings = {
+        'v1': ['A', 'B', 'C', 'D'],
+        'v2': ['A', 'B', 'D', 'C'],
+        'v3': ['B', 'A', 'C', 'D'],
+    }
+    result = kemeny_consensus(rankings, initial=['D', 'C', 'B', 'A'])
+    assert result.ranking == ['A', 'B', 'C', 'D']
+    assert result.scores['A'] == 1.0 and result.scores['D'] == 0.0
+
+
+def test_kemeny_is_locally_optimal_and_no_worse_than_borda():
+    rng = random.Random(4)
+    items = list('ABCDEF')
+    for _ in range(10):
+        rankings = {f'v{n}': rng.sample(items, len(items)) for n in range(5)}
+        result = kemeny_consensus(rankings)
+        cost = kemeny_cost(result.ranking, rankings)
+        assert cost <= kemeny_cost(borda_consensus(rankings).ranking, rankings)
+        for i in range(len(items) - 1):
+            swapped = result.ranking.copy()
+            swapped[i], swapped[i + 1] = swapped[i + 1], swapped[i]
+            assert kemeny_cost(swapped, rankings) >= cost
+        # Never better than the exact optimum
+        assert cost >= min(kemeny_cost(order, rankings) for order in permutations(items))
@@ -0,0 +1,64 @@
+# tests/test_csv_loader.py
+import sys
+import os
+import csv
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.data.dataset_cache as dataset_cache       # noqa: E402
+from src.text_ranking_tool.data.csv_loader import iter_csv_columns, load_ranking_data  # noqa: E402
+from src.text_ranking_tool.data.text_store import load_text_store     # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_cache, "_dataset_cache_instance", dataset_cache.DatasetCache(tmp_path / 'cache'))
+
+
+def dict_reader_baseline(path):
+    """The loader before column projection: csv.DictReader with every field stripped"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [{key: row[key].strip() for key in ('id', 'valence', 'ranking', 'text')} for row in csv.DictReader(f)]
+
+
+def test_full_load_matches_dict_reader():
+    assert load_ranking_data(data_path) == dict_reader_baseline(data_path)
+    assert load_ranking_data(data_path, use_cache=False) == dict_reader_baseline(data_path)
+
+
+def test_projection_keeps_id_first():
+    projected = load_ranking_data(data_path, columns=('ranking',))
+    expected = [{'id': row['id'], 'ranking': row['ranking']} for row in dict_reader_baseline(data_path)]
+    assert projected == expected
+    assert list(projected[0]) == ['id', 'ranking']
+
+
+def test_iter_csv_columns_skips_blank_lines(tmp_path):
+    path = tmp_path / 'export.csv'
+    path.write_text('id,new_ranking,text\nT1,2,a\n\nT2,1,b\n', encoding='utf-8')
+    assert list(iter_csv_columns(path, ('new_ranking', 'id'))) == [('2', 'T1'), ('1', 'T2')]
+    with pytest.raises(KeyError):
+        list(iter_csv_columns(path, ('id', 'score')))
+
+
+def test_short_row_raises_a_clear_error(tmp_path):
+    path = tmp_path / 'ragged.csv'
+    path.write_text('id,valence,ranking,text\nT1,0.5,1,fine\nT2,0.1\n', encoding='utf-8')
+
+    with pytest.raises(ValueError, match=r"ragged.csv line 3: row has 2 fields, expected at least 3"):
+        list(iter_csv_columns(path, ('id', 'ranking')))
+    # Columns that every row holds still stream
+    assert list(iter_csv_columns(path, ('id', 'valence'))) == [('T1', '0.5'), ('T2', '0.1')]
+
+
+def test_loaders_report_ragged_files(tmp_path, capsys):
+    path = tmp_path / 'ragged.csv'
+    path.write_text('id,valence,ranking,text\nT1,0.5,1,fine\nT2,0.1,2\n', encoding='utf-8')
+
+    assert load_ranking_data(str(path)) is None
+    assert "ragged.csv line 3: row has 3 fields, expected at least 4" in capsys.readouterr().out
+    assert load_text_store(str(path)) is None
+    assert "ragged.csv line 3: row has 3 fields, expected at least 4" in capsys.readouterr().out
@@ -0,0 +1,79 @@
+# tests/test_dataset.py
+import sys
+import os
+import numpy as np
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.data.dataset_cache as dataset_cache       # noqa: E402
+from src.text_ranking_tool.data.csv_loader import load_ranking_data   # noqa: E402
+from src.text_ranking_tool.data.dataset import Dataset, as_dataset, load_dataset  # noqa: E402
+from src.text_ranking_tool.data.text_store import load_text_store     # noqa: E402
+from src.text_ranking_tool.stats.stats_for_ui import StatsForUI       # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_cache, "_dataset_cache_instance", dataset_cache.DatasetCache(tmp_path / 'cache'))
+
+
+def write_dataset(path, rankings):
+    lines = ['id,valence,ranking,text']
+    lines += [f'T{i},0.{i},{ranking},text {i}' for i, ranking in enumerate(rankings)]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def test_machine_ranking_matches_baseline():
+    """Same order as sorting the raw rows by int(ranking)"""
+    data = load_ranking_data(data_path)
+    expected = [item['id'] for item in sorted(data, key=lambda x: int(x['ranking']))]
+    assert StatsForUI.load_machine_ranking_from_csv(data_path) == expected
+
+
+def test_machine_ranking_rejects_unparsable_rankings(tmp_path):
+    """Rows without a numeric ranking fail loudly instead of being sorted last"""
+    path = tmp_path / 'bad.csv'
+    write_dataset(path, ['2', 'n/a', '1', ''])
+    with pytest.raises(ValueError, match=r"2 text\(s\) in bad.csv: T1, T3"):
+        StatsForUI.load_machine_ranking_from_csv(path)
+
+
+def test_store_and_item_datasets_agree():
+    """A Dataset over the text store matches one over load_ranking_data dicts"""
+    items = load_ranking_data(data_path)
+    from_items = Dataset.from_items(items)
+    from_store = load_dataset(data_path)
+
+    assert from_store.ids == from_items.ids == [item['id'] for item in items]
+    np.testing.assert_array_equal(from_store.valence, [float(item['valence']) for item in items])
+    np.testing.assert_array_equal(from_store.ranking, from_items.ranking)
+    assert [dict(item) for item in from_store] == items
+    assert from_store.text(items[4]['id']) == items[4]['text']
+    assert not from_store.valence.flags.writeable
+
+
+def test_typed_lookups_mark_unknown_and_unparsable_values():
+    dataset = Dataset.from_items([
+        {'id': 'a', 'valence': '0.5', 'ranking': '2', 'text': ''},
+        {'id': 'b', 'valence': 'x', 'ranking': '', 'text': ''},
+        {'id': 'c', 'valence': '-1', 'ranking': '1', 'text': ''},
+    ])
+    np.testing.assert_array_equal(dataset.positions(['c', 'zzz', 'a']), [2, -1, 0])
+    np.testing.assert_array_equal(dataset.valences(['c', 'zzz', 'b']), [-1.0, np.nan, np.nan])
+    np.testing.assert_array_equal(dataset.rankings(['a', 'b']), [2.0, np.nan])
+    # Ascending valence, NaN last
+    np.testing.assert_array_equal(dataset.valence_rank, [1, 2, 0])
+    assert dataset.ids_by_ranking() == ['c', 'a', 'b']
+
+
+def test_as_dataset_accepts_every_representation():
+    items = load_ranking_data(data_path)
+    dataset = Dataset.from_items(items)
+    assert as_dataset(dataset) is dataset
+    assert as_dataset(items).ids == dataset.ids
+    store = load_text_store(data_path)
+    with store:
+        assert as_dataset(store).ids == dataset.ids
@@ -0,0 +1,102 @@
+# tests/test_dataset_cache.py
+import sys
+import os
+import shutil
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.data.dataset_cache as dataset_cache       # noqa: E402
+from src.text_ranking_tool.data.dataset_cache import DatasetCache     # noqa: E402
+from src.text_ranking_tool.data.csv_loader import load_ranking_data   # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+
+
+class CountingParser:
+    """Column parser stand-in recording which columns each call parsed"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def __call__(self, path, columns):
+        self.calls.append(list(columns))
+        return {col: [row[col] for row in self.rows] for col in columns}
+
+
+def set_mtime(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def dataset_file(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('id,valence,ranking,text\nT1,0.5,1,a\n', encoding='utf-8')
+    set_mtime(path, 1_700_000_000_000_000_000)
+    return path
+
+
+def test_columns_are_parsed_once_and_projected(tmp_path, dataset_file):
+    parser = CountingParser([{'id': 'T1', 'ranking': '1', 'valence': '0.5'}])
+    cache = DatasetCache(tmp_path / 'cache')
+
+    assert cache.load_columns(dataset_file, ('id', 'ranking'), parser) == {'id': ['T1'], 'ranking': ['1']}
+    assert cache.load_columns(dataset_file, ('ranking',), parser) == {'ranking': ['1']}
+    # Only the column not seen yet is parsed
+    cache.load_columns(dataset_file, ('id', 'valence'), parser)
+    assert parser.calls == [['id', 'ranking'], ['valence']]
+
+    # A new process reads the pickled columns from disk
+    DatasetCache(tmp_path / 'cache').load_columns(dataset_file, ('id', 'ranking', 'valence'), parser)
+    assert len(parser.calls) == 2
+
+
+def test_size_or_mtime_change_reparses(tmp_path, dataset_file):
+    parser = CountingParser([{'id': 'T1'}])
+    cache = DatasetCache(tmp_path / 'cache')
+    cache.load_columns(dataset_file, ('id',), parser)
+
+    set_mtime(dataset_file, 1_800_000_000_000_000_000)
+    cache.load_columns(dataset_file, ('id',), parser)
+    assert len(parser.calls) == 2
+
+    dataset_file.write_text('id,valence,ranking,text\nT1,0.5,1,a\nT2,0.1,2,b\n', encoding='utf-8')
+    set_mtime(dataset_file, 1_800_000_000_000_000_000)
+    cache.load_columns(dataset_file, ('id',), parser)
+    assert len(parser.calls) == 3
+
+    cache.load_columns(dataset_file, ('id',), parser)
+    assert len(parser.calls) == 3
+
+
+def test_invalid_files_are_not_cached(tmp_path, dataset_file):
+    cache = DatasetCache(tmp_path / 'cache')
+    assert cache.load_columns(dataset_file, ('id',), lambda path, columns: None) is None
+    assert not (tmp_path / 'cache').exists() or not list((tmp_path / 'cache').iterdir())
+
+
+def test_version_bump_invalidates(tmp_path, dataset_file, monkeypatch):
+    parser = CountingParser([{'id': 'T1'}])
+    DatasetCache(tmp_path / 'cache').load_columns(dataset_file, ('id',), parser)
+    monkeypatch.setattr(dataset_cache, "DATASET_CACHE_VERSION", dataset_cache.DATASET_CACHE_VERSION + 1)
+    DatasetCache(tmp_path / 'cache').load_columns(dataset_file, ('id',), parser)
+    assert len(parser.calls) == 2
+
+
+def test_text_is_never_cached(tmp_path, monkeypatch):
+    """Full loads cache only index columns; text comes from the CSV each time"""
+    cache = DatasetCache(tmp_path / 'cache')
+    monkeypatch.setattr(dataset_cache, "_dataset_cache_instance", cache)
+    path = tmp_path / 'data.csv'
+    shutil.copy(data_path, path)
+
+    first = load_ranking_data(str(path))
+    assert first and first[0]['text']
+    cached_columns = {entry.stem.split('_', 1)[1] for entry in (tmp_path / 'cache').glob('*.pkl')}
+    assert 'text' not in cached_columns
+    assert {'id', 'valence', 'ranking'} <= cached_columns
+
+    # Served from the cached index on a fresh instance, text still read from the file
+    monkeypatch.setattr(dataset_cache, "_dataset_cache_instance", DatasetCache(tmp_path / 'cache'))
+    assert load_ranking_data(str(path)) == first
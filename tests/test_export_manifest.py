@@ -0,0 +1,64 @@
+# tests/test_export_manifest.py
+import sys
+import os
+import csv
+import time
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.text_ranking_tool.export.manifest import ExportManifest  # noqa: E402
+
+
+def write_export(export_dir, name: str, user: str = "User Alpha", dataset: str = "mock_data_30",
+                 algorithm: str = "recursive_median"):
+    path = export_dir / name
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['user_name', 'file_name', 'algorithm', 'id'])
+        writer.writerow([user, dataset, algorithm, '1'])
+    return path
+
+
+def count_rebuilds(monkeypatch) -> list:
+    calls = []
+    original = ExportManifest.rebuild
+    def spy(self):
+        calls.append(1)
+        original(self)
+    monkeypatch.setattr(ExportManifest, "rebuild", spy)
+    return calls
+
+
+def test_recording_exports_does_not_rebuild(tmp_path, monkeypatch):
+    """Each export writes its CSV before recording it; that alone must not trigger a re-scan"""
+    rebuilds = count_rebuilds(monkeypatch)
+    manifest = ExportManifest(tmp_path)
+    manifest.rebuild()
+
+    for i in range(5):
+        time.sleep(0.05)
+        timestamp = f"20250101_00000{i}"
+        path = write_export(tmp_path, f"UserAlpha_mock_data_30_{timestamp}.csv")
+        manifest.record_export("UserAlpha", "mock_data_30", "recursive_median", path, timestamp)
+
+    assert len(rebuilds) == 1
+    assert [p.name for p in manifest.history("UserAlpha", "mock_data_30")][-1] == "UserAlpha_mock_data_30_20250101_000004.csv"
+    assert len(manifest.history("UserAlpha", "mock_data_30")) == 5
+
+
+def test_files_added_or_removed_behind_its_back(tmp_path, monkeypatch):
+    """Foreign additions are indexed and deletions dropped without a full rebuild"""
+    rebuilds = count_rebuilds(monkeypatch)
+    write_export(tmp_path, "UserAlpha_mock_data_30_20250101_000000.csv")
+    manifest = ExportManifest(tmp_path)
+    assert len(manifest.history("UserAlpha", "mock_data_30")) == 1
+
+    time.sleep(0.05)
+    write_export(tmp_path, "UserBeta_mock_data_30_20250101_000001.csv", user="User Beta")
+    (tmp_path / "UserAlpha_mock_data_30_20250101_000000.csv").unlink()
+
+    assert manifest.history("UserAlpha", "mock_data_30") == []
+    assert manifest.latest("UserBeta", "mock_data_30").name == "UserBeta_mock_data_30_20250101_000001.csv"
+    # Another process picks the same state up from the saved manifest
+    assert ExportManifest(tmp_path).latest("UserBeta", "mock_data_30") is not None
+    assert len(rebuilds) == 1
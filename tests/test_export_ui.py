@@ -0,0 +1,60 @@
+# tests/test_export_ui.py
+import sys
+import os
+import shutil
+import types
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.ux.admin_iu.export_ui as export_ui       # noqa: E402
+import src.text_ranking_tool.export.formatters as formatters           # noqa: E402
+from tests.test_record_writers import make_exporter, read_csv_rows, USERS  # noqa: E402
+
+
+@pytest.fixture
+def exporter(tmp_path, monkeypatch):
+    exporter = make_exporter(tmp_path, monkeypatch)
+    internal = tmp_path / 'internal'
+    # Another algorithm's export and an older export of the same ranking
+    first = sorted(internal.glob('*.csv'))[0]
+    shutil.copy(first, internal / first.name.replace(exporter.algorithm, 'tournament'))
+    shutil.copy(first, internal / (first.stem[:-15] + '19990101_000000.csv'))
+    monkeypatch.setattr(export_ui, "INTERNAL_EXPORT_DIR", internal)
+    monkeypatch.setattr(export_ui, "EXTERNAL_EXPORT_DIR", tmp_path / 'external')
+    monkeypatch.setattr(export_ui, "USER_MAPPING", {username: username.replace(' ', '') for username in USERS})
+    monkeypatch.setattr(formatters, "_ranking_exporter_instance", exporter)
+    monkeypatch.setattr(export_ui, "_clear_screen", lambda: None)
+    monkeypatch.setattr(export_ui, "columnar_available", lambda: False)
+    return exporter
+
+
+def run_export_menu(monkeypatch, menu_choice, *answers):
+    """Pick one export menu entry, answer the follow-up prompts, then go back"""
+    menu = iter([(menu_choice, None), ('b', 'back')])
+    monkeypatch.setattr(export_ui, "get_admin_choice_with_navigation", lambda *args: next(menu))
+    pending = list(answers) + ['']
+    monkeypatch.setattr(export_ui, "Prompt", types.SimpleNamespace(ask=lambda *args, **kwargs: pending.pop(0)))
+    export_ui.export_mode()
+
+
+@pytest.mark.parametrize("menu_choice, subdir", [("1", None), ("2", None), ("3", "overall")])
+def test_csv_exports_copy_every_internal_file(tmp_path, exporter, monkeypatch, menu_choice, subdir):
+    """Other algorithms' results and older exports are copied too"""
+    internal_names = sorted(path.name for path in (tmp_path / 'internal').glob('*.csv'))
+    run_export_menu(monkeypatch, menu_choice)
+
+    external = tmp_path / 'external'
+    copied = sorted(path.name for path in external.rglob('*.csv'))
+    assert copied == internal_names
+    if subdir:
+        assert {path.parent.name for path in external.rglob('*.csv')} == {subdir}
+
+
+def test_latest_rankings_export_is_a_separate_option(tmp_path, exporter, monkeypatch):
+    run_export_menu(monkeypatch, "5", "3")
+
+    [output] = (tmp_path / 'external').glob('overall_project_data_*.csv')
+    rows = read_csv_rows(output)
+    assert {row['algorithm'] for row in rows} == {exporter.algorithm}
+    assert len(rows) == len(USERS) * 2 * 30
@@ -0,0 +1,171 @@
+# tests/test_initialization.py
+import sys
+import os
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.data.initialization as initialization     # noqa: E402
+from src.text_ranking_tool.data.initialization import mirror_external_data  # noqa: E402
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    """External and internal data directories, with every copy recorded"""
+    external, internal = tmp_path / 'external', tmp_path / 'internal'
+    external.mkdir()
+    internal.mkdir()
+    monkeypatch.setattr(initialization, "EXTERNAL_DATA_DIR", external)
+    monkeypatch.setattr(initialization, "INTERNAL_DATA_DIR", internal)
+    monkeypatch.setattr(initialization, "INTERNAL_EXPORT_DIR", tmp_path / 'exports')
+    monkeypatch.setattr(initialization, "INTERNAL_USERS_DIR", tmp_path / 'users')
+
+    copies = []
+    original_copy = initialization._copy_file
+
+    def recording_copy(source, destination):
+        copies.append(source.name)
+        return original_copy(source, destination)
+
+    monkeypatch.setattr(initialization, "_copy_file", recording_copy)
+    return external, internal, copies
+
+
+def write(path, content: str, mtime_ns: int = 1_700_000_000_000_000_000):
+    path.write_text(content, encoding='utf-8')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_first_pass_copies_and_second_pass_is_unchanged(dirs):
+    external, internal, copies = dirs
+    write(external / 'a.csv', 'id,valence,ranking,text\n')
+    write(external / 'b.csv', 'id,valence,ranking,text\n')
+    (external / 'notes.txt').write_text('ignored')
+
+    first = mirror_external_data(max_workers=1)
+    assert first.added == ['a.csv', 'b.csv'] and first.copied == ['a.csv', 'b.csv']
+    assert (internal / 'a.csv').read_text(encoding='utf-8') == 'id,valence,ranking,text\n'
+    assert not (internal / 'notes.txt').exists()
+
+    copies.clear()
+    second = mirror_external_data(max_workers=1)
+    assert copies == []
+    assert second.unchanged == ['a.csv', 'b.csv']
+    assert not second.changed
+    assert second.summary() == "0 copied, 2 unchanged, 0 removed"
+
+
+def test_changed_size_is_copied(dirs):
+    external, internal, copies = dirs
+    write(external / 'a.csv', 'one')
+    mirror_external_data(max_workers=1)
+
+    copies.clear()
+    write(external / 'a.csv', 'one two')  # same mtime, different size
+    report = mirror_external_data(max_workers=1)
+    assert copies == ['a.csv']
+    assert report.updated == ['a.csv']
+    assert (internal / 'a.csv').read_text(encoding='utf-8') == 'one two'
+
+
+def test_changed_mtime_is_copied(dirs):
+    external, internal, copies = dirs
+    write(external / 'a.csv', 'one')
+    mirror_external_data(max_workers=1)
+
+    copies.clear()
+    write(external / 'a.csv', 'two', mtime_ns=1_800_000_000_000_000_000)  # same size, newer mtime
+    report = mirror_external_data(max_workers=1)
+    assert copies == ['a.csv']
+    assert report.updated == ['a.csv']
+    assert (internal / 'a.csv').read_text(encoding='utf-8') == 'two'
+
+
+def test_verify_hash_skips_touched_identical_files(dirs):
+    external, _, copies = dirs
+    write(external / 'a.csv', 'one')
+    mirror_external_data(verify_hash=True, max_workers=1)
+
+    copies.clear()
+    write(external / 'a.csv', 'one', mtime_ns=1_800_000_000_000_000_000)
+    report = mirror_external_data(verify_hash=True, max_workers=1)
+    assert copies == []
+    assert report.unchanged == ['a.csv']
+
+
+def test_missing_mirror_is_restored(dirs):
+    external, internal, copies = dirs
+    write(external / 'a.csv', 'one')
+    mirror_external_data(max_workers=1)
+    (internal / 'a.csv').unlink()
+
+    report = mirror_external_data(max_workers=1)
+    assert report.added == ['a.csv']
+    assert (internal / 'a.csv').exists()
+
+
+def test_uppercase_extension_is_mirrored_as_csv(dirs):
+    external, internal, _ = dirs
+    write(external / 'DATA.CSV', 'one')
+
+    report = mirror_external_data(max_workers=1)
+    assert report.added == ['DATA.CSV']
+    assert (internal / 'DATA.csv').read_text(encoding='utf-8') == 'one'
+    assert mirror_external_data(max_workers=1).unchanged == ['DATA.CSV']
+
+
+def test_removed_sources_are_reported_and_mirror_kept(dirs):
+    external, internal, _ = dirs
+    write(external / 'a.csv', 'one')
+    write(external / 'b.csv', 'two')
+    mirror_external_data(max_workers=1)
+    (external / 'b.csv').unlink()
+
+    report = mirror_external_data(max_workers=1)
+    assert report.removed == ['b.csv']
+    assert report.changed
+    assert (internal / 'b.csv').exists()
+    # Reported once: the manifest forgets the file afterwards
+    assert mirror_external_data(max_workers=1).removed == []
+
+
+def test_initialize_prints_sync_counts(dirs, capsys):
+    external, _, _ = dirs
+    write(external / 'a.csv', 'one')
+    write(external / 'b.csv', 'two')
+    initialization.initialize_data_directories(max_workers=2)
+    assert "Data sync: 2 copied, 0 unchanged, 0 removed" in capsys.readouterr().out
+
+    # Nothing copied or removed: no summary on re-entry
+    initialization.initialize_data_directories()
+    assert "Data sync" not in capsys.readouterr().out
+
+    (external / 'b.csv').unlink()
+    initialization.initialize_data_directories()
+    assert "Data sync: 0 copied, 1 unchanged, 1 removed" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_names_differing_only_in_case_are_mirrored_once(dirs, capsys, max_workers):
+    """DATA.CSV, data.csv and data.Csv share one mirror: the first by name wins on every pass"""
+    external, internal, copies = dirs
+    write(external / 'DATA.CSV', 'upper')
+    write(external / 'data.Csv', 'mixed')
+    write(external / 'data.csv', 'lower')
+    write(external / 'other.csv', 'other')
+
+    report = initialization.initialize_data_directories(max_workers=max_workers)
+    assert sorted(copies) == ['DATA.CSV', 'other.csv']
+    assert report.added == ['DATA.CSV', 'other.csv']
+    assert report.duplicates == [('data.Csv', 'DATA.CSV'), ('data.csv', 'DATA.CSV')]
+    assert sorted(path.name for path in internal.glob('*.csv')) == ['DATA.csv', 'other.csv']
+    assert (internal / 'DATA.csv').read_text(encoding='utf-8') == 'upper'
+
+    out = capsys.readouterr().out
+    assert "Warning: Skipped data.csv: same dataset name as DATA.CSV" in out
+    assert "Data sync: 2 copied, 0 unchanged, 0 removed, 2 skipped (duplicate name)" in out
+
+    copies.clear()
+    again = mirror_external_data(max_workers=max_workers)
+    assert copies == [] and again.unchanged == ['DATA.CSV', 'other.csv']
+    assert again.duplicates == report.duplicates
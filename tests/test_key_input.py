@@ -0,0 +1,119 @@
+# tests/test_key_input.py
+import sys
+import os
+import types
+import pytest
+from rich.console import Console
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.ux.key_input as key_input   # noqa: E402
+
+
+class FakeStdin:
+    def __init__(self, tty=True):
+        self.tty = tty
+
+    def fileno(self):
+        return 7
+
+    def isatty(self):
+        return self.tty
+
+
+class FakeTerminal:
+    """termios/tty stand-in recording the mode changes read_key makes"""
+    TCSADRAIN = 1
+
+    def __init__(self):
+        self.calls = []
+
+    def tcgetattr(self, fd):
+        self.calls.append(('get', fd))
+        return ['saved']
+
+    def tcsetattr(self, fd, when, attrs):
+        self.calls.append(('set', fd, when, attrs))
+
+    def setcbreak(self, fd):
+        self.calls.append(('cbreak', fd))
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    fake = FakeTerminal()
+    monkeypatch.setattr(key_input, "termios", fake)
+    monkeypatch.setattr(key_input, "tty", fake)
+    monkeypatch.setattr(key_input.sys, "stdin", FakeStdin())
+    monkeypatch.setattr(key_input, "INPUT_MODE", "keystroke")
+    return fake
+
+
+def feed_keys(monkeypatch, *chunks):
+    """os.read returning each chunk in turn"""
+    pending = list(chunks)
+    monkeypatch.setattr(key_input.os, "read", lambda fd, n: pending.pop(0))
+    return pending
+
+
+@pytest.mark.parametrize("data, expected", [
+    (b'a', 'a'), (b'Q', 'Q'), (b'\n', ''), (b'\r', ''), (b'\x1b[A', ''), (b'ab', ''),
+])
+def test_read_key(terminal, monkeypatch, data, expected):
+    feed_keys(monkeypatch, data)
+    assert key_input.read_key() == expected
+    # Terminal restored to the saved attributes after the read
+    assert terminal.calls == [('get', 7), ('cbreak', 7), ('set', 7, FakeTerminal.TCSADRAIN, ['saved'])]
+
+
+def test_read_key_restores_terminal_on_eof(terminal, monkeypatch):
+    feed_keys(monkeypatch, b'')
+    with pytest.raises(EOFError):
+        key_input.read_key()
+    assert terminal.calls[-1] == ('set', 7, FakeTerminal.TCSADRAIN, ['saved'])
+
+
+def test_keystroke_mode_needs_config_termios_and_tty(terminal, monkeypatch):
+    assert key_input.keystroke_input_enabled()
+    monkeypatch.setattr(key_input.sys, "stdin", FakeStdin(tty=False))
+    assert not key_input.keystroke_input_enabled()
+    monkeypatch.setattr(key_input.sys, "stdin", FakeStdin())
+    monkeypatch.setattr(key_input, "termios", None)
+    assert not key_input.keystroke_input_enabled()
+    monkeypatch.setattr(key_input, "termios", terminal)
+    monkeypatch.setattr(key_input, "INPUT_MODE", "line")
+    assert not key_input.keystroke_input_enabled()
+
+
+def test_comparison_prompt_ignores_keys_outside_a_b_u_q(terminal, monkeypatch):
+    console = Console(record=True, width=80)
+    pending = feed_keys(monkeypatch, b'\n', b'\x1b', b'\x1b[B', b'x', b'U', b'a')
+    assert key_input.ask_choice(console, "Your choice") == 'u'
+    assert pending == [b'a']
+    output = console.export_text()
+    assert output == "Your choice: u\n"
+    assert "Invalid" not in output
+
+
+def test_explicit_choices_replace_comparison_keys(terminal, monkeypatch):
+    console = Console(record=True, width=80)
+    feed_keys(monkeypatch, b'u', b'B')
+    assert key_input.ask_choice(console, "Enter your choice", choices=["A", "B", "a", "b", "q"]) == 'b'
+
+
+def test_line_mode_falls_back_to_prompt(monkeypatch):
+    asked = []
+    answers = [' A ', 'B']
+
+    def fake_ask(prompt, **kwargs):
+        asked.append((prompt, kwargs))
+        return answers.pop(0)
+
+    monkeypatch.setattr(key_input, "INPUT_MODE", "line")
+    monkeypatch.setattr(key_input, "Prompt", types.SimpleNamespace(ask=fake_ask))
+    monkeypatch.setattr(key_input.os, "read", lambda fd, n: pytest.fail("line mode must not read raw keys"))
+    console = Console(record=True, width=80)
+
+    assert key_input.ask_choice(console, "Your choice") == 'a'
+    assert key_input.ask_choice(console, "Enter your choice", choices=["A", "b"]) == 'b'
+    assert asked == [("Your choice", {}), ("Enter your choice", {'choices': ["A", "b"]})]
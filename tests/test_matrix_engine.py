@@ -0,0 +1,85 @@
+# tests/test_matrix_engine.py
+import sys
+import os
+import random
+import numpy as np
+import pytest
+from scipy.stats import kendalltau, spearmanr
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.stats.matrix_engine as matrix_engine       # noqa: E402
+from src.text_ranking_tool.stats.matrix_engine import compute_correlation_matrices  # noqa: E402
+from src.text_ranking_tool.data.csv_loader import load_ranking_data   # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+
+
+def mock_rankings(subset: bool = False):
+    """Machine order, valence order and two shuffles of the mock dataset (optionally partial)"""
+    data = load_ranking_data(data_path)
+    rng = random.Random(7)
+    machine = [item['id'] for item in sorted(data, key=lambda x: int(x['ranking']))]
+    by_valence = [item['id'] for item in sorted(data, key=lambda x: float(x['valence']))]
+    rankings = {
+        'Machine': machine,
+        'Valence': by_valence,
+        'User Alpha': rng.sample(machine, len(machine)),
+        'User Beta': rng.sample(machine, len(machine)),
+    }
+    if subset:
+        rankings['User Alpha'] = rankings['User Alpha'][:22]
+        rankings['User Beta'] = rankings['User Beta'][5:]
+    return rankings
+
+
+def scipy_matrix(rankings, metric):
+    """Baseline: SciPy on each pair's common items, by position"""
+    names = list(rankings)
+    matrix = np.eye(len(names))
+    for i, a in enumerate(names):
+        for j, b in enumerate(names):
+            if i == j:
+                continue
+            common = [item for item in rankings[a] if item in set(rankings[b])]
+            pos_a = [rankings[a].index(item) for item in common]
+            pos_b = [rankings[b].index(item) for item in common]
+            matrix[i, j] = metric(pos_a, pos_b)[0]
+    return matrix
+
+
+def overlap_matrix(rankings, k):
+    names = list(rankings)
+    return np.array([[len(set(rankings[a][:k]) & set(rankings[b][:k])) / k for b in names] for a in names])
+
+
+@pytest.mark.parametrize('subset', [False, True], ids=['same-items', 'partial-overlap'])
+def test_matrices_match_scipy(subset):
+    rankings = mock_rankings(subset)
+    participants, matrices = compute_correlation_matrices(rankings, top_k=(10, 20))
+
+    assert participants == list(rankings)
+    np.testing.assert_allclose(matrices['kendall'], scipy_matrix(rankings, kendalltau), atol=1e-9)
+    np.testing.assert_allclose(matrices['spearman'], scipy_matrix(rankings, spearmanr), atol=1e-9)
+    for k in (10, 20):
+        expected = overlap_matrix(rankings, k)
+        np.fill_diagonal(expected, 1.0)
+        np.testing.assert_allclose(matrices[f'overlap_{k}'], expected)
+
+
+def test_large_rankings_fall_back_to_scipy_kendall(monkeypatch):
+    """Above SIGN_MATRIX_MAX_ITEMS the per-pair path gives the same Kendall matrix"""
+    rankings = mock_rankings()
+    _, sign_matrices = compute_correlation_matrices(rankings)
+    monkeypatch.setattr(matrix_engine, "SIGN_MATRIX_MAX_ITEMS", 10)
+    _, pair_matrices = compute_correlation_matrices(rankings)
+    np.testing.assert_allclose(pair_matrices['kendall'], sign_matrices['kendall'], atol=1e-9)
+
+
+def test_sign_matrix_chunking(monkeypatch):
+    """Splitting the item pairs into small chunks does not change the result"""
+    rankings = mock_rankings()
+    _, whole = compute_correlation_matrices(rankings)
+    monkeypatch.setattr(matrix_engine, "_SIGN_CHUNK_CELLS", 7)
+    _, chunked = compute_correlation_matrices(rankings)
+    np.testing.assert_allclose(chunked['kendall'], whole['kendall'], atol=1e-6)
@@ -0,0 +1,99 @@
+# tests/test_metric_kernels.py
+import sys
+import os
+import random
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from scipy.stats import pearsonr                                              # noqa: E402
+from src.text_ranking_tool.stats.statistics_calculator import StatisticsCalculator  # noqa: E402
+from src.text_ranking_tool.data.csv_loader import load_ranking_data          # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+
+
+# --- Baseline implementations the kernels replaced ---
+def baseline_kendall_distance(list1, list2):
+    disagreements = 0
+    for i in range(len(list1)):
+        for j in range(i + 1, len(list1)):
+            if (list1[i] < list1[j]) != (list2[i] < list2[j]):
+                disagreements += 1
+    return disagreements
+
+
+def baseline_rbo(ranking1, ranking2, p=0.9):
+    rbo_sum = 0.0
+    for d in range(1, min(len(ranking1), len(ranking2)) + 1):
+        rbo_sum += len(set(ranking1[:d]) & set(ranking2[:d])) / d * (p ** (d - 1))
+    return (1 - p) * rbo_sum
+
+
+def baseline_average_precision(ranking1, ranking2, k):
+    top_k_1 = set(ranking1[:k])
+    precision_sum, found = 0.0, 0
+    for i in range(min(k, len(ranking2))):
+        if ranking2[i] in top_k_1:
+            found += 1
+            precision_sum += found / (i + 1)
+    return precision_sum / min(k, len(top_k_1))
+
+
+def baseline_footrule(ranking1, ranking2):
+    pos1 = {text: i + 1 for i, text in enumerate(ranking1)}
+    pos2 = {text: i + 1 for i, text in enumerate(ranking2)}
+    common = set(ranking1) & set(ranking2)
+    n = len(common)
+    max_footrule = n * (n - 1) // 2 if n % 2 == 0 else n * n // 2
+    return sum(abs(pos1[text] - pos2[text]) for text in common) / max_footrule
+
+
+def mock_rankings(seed: int):
+    """The mock dataset's ranking order and a partially shuffled copy"""
+    ranking = [item['id'] for item in sorted(load_ranking_data(data_path), key=lambda item: int(item['ranking']))]
+    rng = random.Random(seed)
+    other = ranking.copy()
+    for _ in range(10):
+        i, j = rng.randrange(len(other)), rng.randrange(len(other))
+        other[i], other[j] = other[j], other[i]
+    return ranking, other
+
+
+@pytest.mark.parametrize("list1, list2", [
+    ([1, 1, 1], [1, 2, 3]),            # constant input
+    ([1, 2, 3], [3, 3, 3]),
+    ([1, 2, 2, 3], [2, 1, 3, 3]),      # ties on both sides
+    ([3, 1, 2, 1], [1, 1, 2, 2]),
+    ([], []),
+    ([5], [7]),
+])
+def test_kendall_distance_ties_and_constant_input(list1, list2):
+    assert StatisticsCalculator.calculate_kendall_distance(list1, list2) == baseline_kendall_distance(list1, list2)
+
+
+def test_kendall_distance_matches_pairwise_loop():
+    rng = random.Random(1)
+    for n in (2, 7, 30, 200):
+        list1 = list(range(1, n + 1))
+        list2 = rng.sample(list1, n)
+        assert StatisticsCalculator.calculate_kendall_distance(list1, list2) == baseline_kendall_distance(list1, list2)
+        ties = [rng.randint(1, 5) for _ in range(n)]
+        assert StatisticsCalculator.calculate_kendall_distance(ties, list2) == baseline_kendall_distance(ties, list2)
+
+
+def test_list_metrics_match_baseline():
+    for seed in range(3):
+        ranking1, ranking2 = mock_rankings(seed)
+        assert StatisticsCalculator.calculate_rank_biased_overlap(ranking1, ranking2) == pytest.approx(baseline_rbo(ranking1, ranking2))
+        assert StatisticsCalculator.calculate_footrule_distance(ranking1, ranking2) == pytest.approx(baseline_footrule(ranking1, ranking2))
+        for k in (1, 5, 10, 30):
+            assert StatisticsCalculator.calculate_average_precision_at_k(ranking1, ranking2, k) == \
+                pytest.approx(baseline_average_precision(ranking1, ranking2, k))
+            assert StatisticsCalculator.calculate_top_k_overlap(ranking1, ranking2, k) == \
+                pytest.approx(len(set(ranking1[:k]) & set(ranking2[:k])) / k)
+
+        positions2 = [ranking2.index(text) + 1 for text in ranking1]
+        positions1 = list(range(1, len(ranking1) + 1))
+        assert StatisticsCalculator.calculate_pearson_correlation(positions1, positions2) == \
+            pytest.approx(pearsonr(positions1, positions2)[0])
@@ -0,0 +1,123 @@
+# tests/test_pairwise_agreement.py
+import sys
+import os
+import random
+from collections import Counter
+from itertools import combinations, permutations
+import numpy as np
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.text_ranking_tool.stats.pairwise_agreement import compute_pairwise_agreement  # noqa: E402
+
+
+def krippendorff_alpha_nominal(units):
+    """Textbook nominal alpha from the coincidence matrix; units are lists of values (None: missing)"""
+    coincidences = Counter()
+    for unit in units:
+        values = [value for value in unit if value is not None]
+        if len(values) < 2:
+            continue
+        for i, j in permutations(range(len(values)), 2):
+            coincidences[(values[i], values[j])] += 1 / (len(values) - 1)
+    totals = Counter()
+    for (c, _), weight in coincidences.items():
+        totals[c] += weight
+    n = sum(totals.values())
+    disagreement_observed = sum(weight for (c, k), weight in coincidences.items() if c != k)
+    disagreement_expected = sum(totals[c] * totals[k] for c in totals for k in totals if c != k) / (n - 1)
+    return 1 - disagreement_observed / disagreement_expected
+
+
+# Krippendorff (2011), "Computing Krippendorff's Alpha-Reliability": binary data, two observers
+BINARY_A = [0, 1, 0, 0, 0, 0, 0, 0, 1, 0]
+BINARY_B = [1, 1, 1, 0, 0, 1, 0, 0, 0, 0]
+
+
+def test_reference_alpha_reproduces_textbook_values():
+    assert krippendorff_alpha_nominal(list(zip(BINARY_A, BINARY_B))) == pytest.approx(0.095, abs=5e-4)
+    # Same source: four observers, nominal values 1-5 with missing data
+    N = None
+    units = list(zip(
+        [1, 2, 3, 3, 2, 1, 4, 1, 2, N, N, N],
+        [1, 2, 3, 3, 2, 2, 4, 1, 2, 5, N, 3],
+        [N, 3, 3, 3, 2, 3, 4, 2, 2, 5, 1, N],
+        [1, 2, 3, 3, 2, 4, 4, 1, 2, 5, 1, N],
+    ))
+    assert krippendorff_alpha_nominal(units) == pytest.approx(0.743, abs=5e-4)
+
+
+def memories_from_units(columns, flip_every=3):
+    """
+    One comparison pair per unit; a 1 means the first text was judged more negative.
+    Some answers are stored with the pair reversed to exercise canonicalisation.
+    """
+    memories = {}
+    for user, column in enumerate(columns):
+        memory = {}
+        for unit, value in enumerate(column):
+            if value is None:
+                continue
+            first, second = f'A{unit:02d}', f'B{unit:02d}'
+            if (unit + user) % flip_every == 0:
+                memory[(second, first)] = not value
+            else:
+                memory[(first, second)] = bool(value)
+        memories[f'user{user}'] = memory
+    return memories
+
+
+def test_alpha_on_textbook_binary_data():
+    """Alpha equals the nominal alpha of the units counted in both orientations"""
+    result = compute_pairwise_agreement(memories_from_units([BINARY_A, BINARY_B]))
+    units = list(zip(BINARY_A, BINARY_B))
+    both_orientations = units + [tuple(1 - value for value in unit) for unit in units]
+
+    assert result.judgments == 20
+    assert result.shared_pairs == 10
+    assert result.observed_agreement == pytest.approx(6 / 10)
+    assert result.krippendorff_alpha == pytest.approx(krippendorff_alpha_nominal(both_orientations))
+
+
+def test_agreement_matches_pairwise_baseline_with_missing_answers():
+    rng = random.Random(2)
+    columns = [[rng.choice([0, 1, 1, None]) for _ in range(40)] for _ in range(4)]
+    result = compute_pairwise_agreement(memories_from_units(columns))
+
+    units = list(zip(*columns))
+    both_orientations = units + [tuple(None if v is None else 1 - v for v in unit) for unit in units]
+    assert result.krippendorff_alpha == pytest.approx(krippendorff_alpha_nominal(both_orientations))
+
+    agreeing = total = 0
+    for unit in units:
+        values = [value for value in unit if value is not None]
+        for a, b in combinations(values, 2):
+            agreeing += a == b
+            total += 1
+    assert result.observed_agreement == pytest.approx(agreeing / total)
+    assert result.shared_pairs == sum(sum(v is not None for v in unit) >= 2 for unit in units)
+
+    for i, j in combinations(range(4), 2):
+        both = [(a, b) for a, b in zip(columns[i], columns[j]) if a is not None and b is not None]
+        assert result.user_overlap[i, j] == len(both)
+        assert result.user_agreement[i, j] == pytest.approx(sum(a == b for a, b in both) / len(both))
+
+
+def test_hotspots_rank_the_most_contested_items_first():
+    memories = {
+        'u1': {('X', 'Y'): True, ('X', 'Z'): True, ('Y', 'Z'): True},
+        'u2': {('X', 'Y'): False, ('Z', 'X'): True, ('Y', 'Z'): True},
+        'u3': {('X', 'Y'): True, ('X', 'Z'): True, ('Y', 'Z'): True},
+    }
+    result = compute_pairwise_agreement(memories)
+    assert [hotspot['id'] for hotspot in result.hotspots] == ['X', 'Y', 'Z']
+    assert result.hotspots[0]['contested_pairs'] == 2
+    assert result.hotspots[0]['disagreement'] == pytest.approx(4 / 6)
+
+
+def test_no_answers():
+    result = compute_pairwise_agreement({'u1': {}, 'u2': {}})
+    assert result.judgments == 0
+    assert np.isnan(result.krippendorff_alpha)
+    assert result.hotspots == []
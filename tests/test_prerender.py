@@ -0,0 +1,188 @@
+# tests/test_prerender.py
+import sys
+import os
+import io
+from concurrent.futures import Future
+import pytest
+from rich.console import Console
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.ux.comparison_ui as comparison_ui          # noqa: E402
+from src.text_ranking_tool.ux.screen import CLEAR_SEQUENCE               # noqa: E402
+from src.text_ranking_tool.ranking.comparison_engine import ComparisonEngine  # noqa: E402
+
+RENDERER = comparison_ui._render_tournament_screen
+
+
+def comparison(number=1, id1='T1', id2='T2'):
+    return {
+        "text1": {"id": id1, "text": f"first text {id1}", "valence": 0.1, "ranking": 1},
+        "text2": {"id": id2, "text": f"second text {id2}", "valence": -0.2, "ranking": 2},
+        "comparison_number": number,
+        "algorithm": "tournament",
+    }
+
+
+def make_console(terminal=True, width=100):
+    return Console(file=io.StringIO(), force_terminal=terminal, width=width,
+                   color_system='truecolor' if terminal else None, legacy_windows=False)
+
+
+def live_frame(console, data):
+    return comparison_ui._render_to_string(RENDERER, data, console.width, console.color_system)
+
+
+class RenderSpy:
+    """Counts live renders made after a test starts watching"""
+
+    def __init__(self, monkeypatch):
+        self.calls = 0
+        self._render = comparison_ui._render_to_string
+        monkeypatch.setattr(comparison_ui, "_render_to_string", self)
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self._render(*args)
+
+
+@pytest.fixture
+def console(monkeypatch):
+    """Fresh prerender state around a terminal console shared with the UI"""
+    terminal = make_console()
+    monkeypatch.setattr(comparison_ui, "get_console", lambda: terminal)
+    monkeypatch.setattr(comparison_ui, "_prerendered", {})
+    monkeypatch.setattr(comparison_ui, "_prerender_executor", None)
+    yield terminal
+    if comparison_ui._prerender_executor is not None:
+        comparison_ui._prerender_executor.shutdown(wait=True)
+
+
+def buffered(frame):
+    future = Future()
+    future.set_result(frame)
+    return future
+
+
+def test_prerendered_frame_is_used_and_matches_live_render(console, monkeypatch):
+    data = comparison(3)
+    comparison_ui.prerender_comparison(data)
+    [future] = comparison_ui._prerendered.values()
+    frame = future.result(timeout=10)
+    assert frame == live_frame(console, data)
+
+    spy = RenderSpy(monkeypatch)
+    comparison_ui._show_screen(console, RENDERER, data)
+    assert spy.calls == 0
+    assert console.file.getvalue() == CLEAR_SEQUENCE + frame
+    assert not comparison_ui._prerendered
+
+
+@pytest.mark.parametrize("stale_number, stale_width", [(3, 80), (4, 100)])
+def test_stale_frame_falls_back_to_live_render(console, monkeypatch, stale_number, stale_width):
+    data = comparison(3)
+    stale_key = comparison_ui._screen_key(comparison(stale_number), stale_width)
+    comparison_ui._prerendered[stale_key] = buffered("STALE FRAME")
+
+    spy = RenderSpy(monkeypatch)
+    comparison_ui._show_screen(console, RENDERER, data)
+    assert spy.calls == 1
+    output = console.file.getvalue()
+    assert "STALE FRAME" not in output
+    assert output == CLEAR_SEQUENCE + live_frame(console, data)
+
+
+def test_failed_or_cancelled_prerender_falls_back_to_live_render(console):
+    failed = Future()
+    failed.set_exception(RuntimeError("render failed"))
+    comparison_ui._prerendered[comparison_ui._screen_key(comparison(1), console.width)] = failed
+    comparison_ui._show_screen(console, RENDERER, comparison(1))
+    assert console.file.getvalue() == CLEAR_SEQUENCE + live_frame(console, comparison(1))
+
+    cancelled = Future()
+    cancelled.cancel()
+    comparison_ui._prerendered[comparison_ui._screen_key(comparison(2), console.width)] = cancelled
+    comparison_ui._show_screen(console, RENDERER, comparison(2))
+    assert console.file.getvalue().endswith(CLEAR_SEQUENCE + live_frame(console, comparison(2)))
+
+
+def test_oldest_prerender_is_evicted_and_cancelled(console, monkeypatch):
+    class HeldExecutor:
+        """Executor whose jobs never start, so evicted futures can still be cancelled"""
+
+        def __init__(self):
+            self.futures = []
+
+        def submit(self, *args):
+            self.futures.append(Future())
+            return self.futures[-1]
+
+        def shutdown(self, wait=True):
+            pass
+
+    executor = HeldExecutor()
+    monkeypatch.setattr(comparison_ui, "_prerender_executor", executor)
+    screens = [comparison(number, f'T{number}', f'T{number + 10}') for number in range(1, 5)]
+    for data in screens:
+        comparison_ui.prerender_comparison(data)
+    # Announcing the same screen again submits nothing new
+    comparison_ui.prerender_comparison(screens[-1])
+
+    assert len(executor.futures) == len(screens)
+    assert len(comparison_ui._prerendered) == comparison_ui.PRERENDER_SLOTS
+    evicted = len(screens) - comparison_ui.PRERENDER_SLOTS
+    assert all(future.cancelled() for future in executor.futures[:evicted])
+    assert not any(future.cancelled() for future in executor.futures[evicted:])
+    assert list(comparison_ui._prerendered) == [
+        comparison_ui._screen_key(data, console.width) for data in screens[evicted:]]
+
+
+def test_nothing_is_prerendered_for_a_non_terminal_console(monkeypatch):
+    plain = make_console(terminal=False)
+    monkeypatch.setattr(comparison_ui, "get_console", lambda: plain)
+    monkeypatch.setattr(comparison_ui, "_prerendered", {})
+    monkeypatch.setattr(comparison_ui, "_prerender_executor", None)
+
+    comparison_ui.prerender_comparison(comparison(1))
+    assert not comparison_ui._prerendered
+    assert comparison_ui._prerender_executor is None
+
+    comparison_ui._show_screen(plain, RENDERER, comparison(1))
+    output = plain.file.getvalue()
+    assert "first text T1" in output
+    assert CLEAR_SEQUENCE not in output and "\x1b" not in output
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """Engine over three texts whose UI always picks the first text"""
+    comparison_engine = ComparisonEngine()
+    comparison_engine.text_data = {text_id: {'text': f'text {text_id}', 'valence': 0.0, 'ranking': 1}
+                                   for text_id in ('T1', 'T2', 'T3')}
+    monkeypatch.setattr(comparison_engine, "_get_user_comparison_choice",
+                        lambda data: data["text1"]["id"])
+    announced = []
+    monkeypatch.setattr(comparison_ui, "prerender_comparison", announced.append)
+    return comparison_engine, announced
+
+
+def test_engine_prerenders_the_announced_next_comparison(engine):
+    comparison_engine, announced = engine
+    comparison_engine.prepare_comparison('T2', 'T3')
+    assert comparison_engine.ask_if_more_negative('T1', 'T2')
+
+    [next_data] = announced
+    assert (next_data["text1"]["id"], next_data["text2"]["id"]) == ('T2', 'T3')
+    assert next_data["comparison_number"] == 2
+    # The announcement is used once
+    comparison_engine.ask_if_more_negative('T1', 'T3')
+    assert len(announced) == 1
+
+
+@pytest.mark.parametrize("next_pair", [('T1', 'T2'), ('T2', 'T1')])
+def test_engine_skips_pairs_already_answered(engine, next_pair):
+    comparison_engine, announced = engine
+    comparison_engine.comparison_memory[('T1', 'T2')] = True
+    comparison_engine.prepare_comparison(*next_pair)
+    comparison_engine.ask_if_more_negative('T1', 'T3')
+    assert announced == []
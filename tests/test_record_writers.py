@@ -0,0 +1,110 @@
+# tests/test_record_writers.py
+import sys
+import os
+import csv
+import random
+import shutil
+import subprocess
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.export.formatters as formatters           # noqa: E402
+import src.text_ranking_tool.data.file_scanner as file_scanner         # noqa: E402
+import src.text_ranking_tool.data.dataset_cache as dataset_cache       # noqa: E402
+from src.text_ranking_tool.data.csv_loader import load_ranking_data   # noqa: E402
+from src.text_ranking_tool.export.record_writers import open_record_writer  # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+USERS = ['User Alpha', 'User Beta']
+
+
+def make_exporter(tmp_path, monkeypatch) -> formatters.RankingExporter:
+    """Exporter over two copies of the mock dataset, each ranked by both users"""
+    for name in ('data', 'internal', 'external', 'cache'):
+        (tmp_path / name).mkdir()
+    for stem in ('set_a', 'set_b'):
+        shutil.copy(data_path, tmp_path / 'data' / f'{stem}.csv')
+    monkeypatch.setattr(dataset_cache, "_dataset_cache_instance", dataset_cache.DatasetCache(tmp_path / 'cache'))
+    monkeypatch.setattr(file_scanner, "INTERNAL_DATA_DIR", tmp_path / 'data')
+    monkeypatch.setattr(formatters, "INTERNAL_EXPORT_DIR", tmp_path / 'internal')
+    monkeypatch.setattr(formatters, "EXTERNAL_EXPORT_DIR", tmp_path / 'external')
+
+    exporter = formatters.RankingExporter()
+    rng = random.Random(0)
+    for stem in ('set_a', 'set_b'):
+        data = load_ranking_data(str(tmp_path / 'data' / f'{stem}.csv'))
+        ids = [item['id'] for item in data]
+        for user in USERS:
+            exporter.export_per_user_internal(user, stem, rng.sample(ids, len(ids)), data)
+    return exporter
+
+
+def read_csv_rows(path) -> list:
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_columnar_writer_types():
+    """valence is float64, rankings int64; empty and unparsable numbers become nulls"""
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    import tempfile
+    from pathlib import Path
+
+    fieldnames = ['id', 'valence', 'ranking', 'new_ranking']
+    records = [
+        {'id': 'T1', 'valence': '0.95', 'ranking': '1', 'new_ranking': 2},
+        {'id': 'T2', 'valence': '-0.5', 'ranking': '2.0', 'new_ranking': 1},
+        {'id': 'T3', 'valence': '', 'ranking': 'n/a', 'new_ranking': 3},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for export_format in ('parquet', 'arrow'):
+            path = Path(tmp) / f"out.{export_format}"
+            with open_record_writer(path, fieldnames, export_format) as writer:
+                for record in records:
+                    writer.writerow(record)
+            if export_format == 'parquet':
+                table = pq.read_table(path)
+            else:
+                with pa.ipc.open_file(path) as reader:
+                    table = reader.read_all()
+
+            assert table.schema.field('valence').type == pa.float64()
+            assert table.schema.field('ranking').type == pa.int64()
+            assert table.schema.field('new_ranking').type == pa.int64()
+            assert table.column('valence').to_pylist() == [0.95, -0.5, None]
+            assert table.column('ranking').to_pylist() == [1, 2, None]
+
+
+def test_csv_and_columnar_exports_have_the_same_records(tmp_path, monkeypatch):
+    """Every format is written from the same record stream"""
+    pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    exporter = make_exporter(tmp_path, monkeypatch)
+
+    for export in (exporter.export_per_user_external, exporter.export_per_file_external,
+                   exporter.export_overall_project_external):
+        csv_result = export(USERS, "csv")
+        parquet_result = export(USERS, "parquet")
+        assert csv_result['total_records'] == parquet_result['total_records'] > 0
+
+        for csv_file, parquet_file in zip(sorted(csv_result['files']), sorted(parquet_result['files'])):
+            csv_rows = read_csv_rows(csv_file)
+            parquet_rows = pq.read_table(parquet_file).to_pylist()
+            assert len(csv_rows) == len(parquet_rows)
+            for csv_row, parquet_row in zip(csv_rows, parquet_rows):
+                assert csv_row['id'] == parquet_row['id']
+                assert float(csv_row['valence']) == parquet_row['valence']
+                assert int(csv_row['ranking']) == parquet_row['ranking']
+                assert int(csv_row['new_ranking']) == parquet_row['new_ranking']
+                assert csv_row.get('text') == parquet_row.get('text')
+
+
+def test_exporter_import_does_not_load_pyarrow():
+    """The auto export after every session must not pay for importing pyarrow"""
+    probe = ("import sys; import src.text_ranking_tool.export.formatters; "
+             "print('pyarrow' in sys.modules)")
+    output = subprocess.run([sys.executable, "-c", probe], cwd=project_root,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip().splitlines()[-1] == "False"
@@ -0,0 +1,73 @@
+# tests/test_screen.py
+import sys
+import os
+import io
+import types
+import pytest
+from rich.console import Console
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.ux.screen as screen                       # noqa: E402
+from src.text_ranking_tool.ux.screen import CLEAR_SEQUENCE, clear_terminal, redraw, supports_redraw  # noqa: E402
+
+
+class WriteLog(io.StringIO):
+    """Terminal stand-in recording each write separately"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return super().write(text)
+
+
+@pytest.fixture
+def shell(monkeypatch):
+    """Commands clear_terminal would hand to the shell, with os.name set per test"""
+    fake_os = types.SimpleNamespace(name='posix', commands=[])
+    fake_os.system = fake_os.commands.append
+    monkeypatch.setattr(screen, "os", fake_os)
+    return fake_os
+
+
+def make_console(terminal=True, legacy_windows=False):
+    return Console(file=WriteLog(), force_terminal=terminal, legacy_windows=legacy_windows, width=80)
+
+
+def test_frame_is_one_write_after_the_clear_sequence(shell):
+    console = make_console()
+    assert supports_redraw(console)
+
+    redraw(console, "FRAME\nlines")
+    assert console.file.writes == [CLEAR_SEQUENCE + "FRAME\nlines"]
+
+    clear_terminal(console)
+    assert console.file.writes[-1] == CLEAR_SEQUENCE
+    assert shell.commands == []
+
+
+def test_non_terminal_output_gets_no_clear_sequence(shell):
+    console = make_console(terminal=False)
+    assert not supports_redraw(console)
+
+    clear_terminal(console)
+    redraw(console, "FRAME")
+    assert console.file.getvalue() == "FRAME"
+    assert shell.commands == []
+
+
+@pytest.mark.parametrize("os_name, command", [("nt", "cls"), ("posix", "clear")])
+def test_legacy_windows_console_falls_back_to_shell_clear(shell, os_name, command):
+    shell.name = os_name
+    console = make_console(legacy_windows=True)
+    assert console.is_terminal and not supports_redraw(console)
+
+    clear_terminal(console)
+    assert shell.commands == [command]
+
+    redraw(console, "FRAME")
+    assert shell.commands == [command, command]
+    assert console.file.getvalue() == "FRAME"
@@ -0,0 +1,102 @@
+# tests/test_session_progress.py
+import sys
+import os
+import json
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.text_ranking_tool.ranking.session_manager import SessionManager, PROGRESS_INDEX_NAME  # noqa: E402
+from src.text_ranking_tool.ranking.comparison_engine import ComparisonEngine                  # noqa: E402
+from src.text_ranking_tool.config.constants import get_user_id                                # noqa: E402
+
+USER = 'User Alpha'
+
+
+@pytest.fixture
+def manager(tmp_path):
+    session_manager = SessionManager()
+    session_manager.users_dir = tmp_path / 'users'
+    return session_manager
+
+
+@pytest.fixture
+def engine(manager):
+    comparison_engine = ComparisonEngine()
+    comparison_engine.session_manager = manager
+    comparison_engine.current_user = USER
+    comparison_engine.current_file = 'set_a'
+    return comparison_engine
+
+
+def fresh_manager(manager) -> SessionManager:
+    """A second process: nothing memoised, everything read from disk"""
+    other = SessionManager()
+    other.users_dir = manager.users_dir
+    return other
+
+
+def parsed_progress(manager, stem):
+    """Baseline: progress read by parsing the session file itself"""
+    with open(manager.get_session_path(USER, stem), 'r', encoding='utf-8') as f:
+        return json.load(f)['comparisons_count']
+
+
+def indexed_count(manager, stem):
+    index_path = manager.users_dir / get_user_id(USER) / PROGRESS_INDEX_NAME
+    with open(index_path, 'r', encoding='utf-8') as f:
+        return json.load(f)['sessions'][stem]['comparisons_made']
+
+
+def test_progress_follows_answers_and_undo(manager, engine):
+    answers = [('T1', 'T2', True), ('T3', 'T1', False), ('T2', 'T3', True)]
+    for made, (a, b, result) in enumerate(answers, 1):
+        engine._cache_comparison_result(a, b, result)
+        for reader in (manager, fresh_manager(manager)):
+            assert reader.get_session_progress(USER, 'set_a')['comparisons_made'] == made
+        assert indexed_count(manager, 'set_a') == parsed_progress(manager, 'set_a') == made
+
+    assert engine.undo_last_comparison()
+    assert engine.undo_last_comparison()
+    for reader in (manager, fresh_manager(manager)):
+        progress = reader.get_session_progress(USER, 'set_a')
+        assert progress['exists'] and progress['comparisons_made'] == 1
+    assert indexed_count(manager, 'set_a') == parsed_progress(manager, 'set_a') == 1
+
+    memory, order = fresh_manager(manager).load_session(USER, 'set_a')
+    assert memory == {('T1', 'T2'): True} and order == [('T1', 'T2')]
+
+
+def test_user_progress_and_reset(manager, engine):
+    engine._cache_comparison_result('T1', 'T2', True)
+    manager.save_session(USER, 'set_b', {('X', 'Y'): False, ('Y', 'Z'): True}, [('X', 'Y'), ('Y', 'Z')])
+
+    progress = fresh_manager(manager).get_user_progress(USER)
+    assert {stem: entry['comparisons_made'] for stem, entry in progress.items()} == {'set_a': 1, 'set_b': 2}
+    sessions = fresh_manager(manager).list_user_sessions(USER)
+    assert sorted(session['filename'] for session in sessions) == ['set_a.json', 'set_b.json']
+
+    assert engine.reset_session()
+    assert not fresh_manager(manager).get_session_progress(USER, 'set_a')['exists']
+    assert set(fresh_manager(manager).get_user_progress(USER)) == {'set_b'}
+
+
+def test_stale_index_entry_is_reparsed(manager):
+    """A session rewritten without the index (e.g. by an older version) is parsed and re-indexed"""
+    manager.save_session(USER, 'set_a', {('T1', 'T2'): True}, [('T1', 'T2')])
+    session_path = manager.get_session_path(USER, 'set_a')
+    data = json.loads(session_path.read_text())
+    data['comparison_memory'] = {'T1||T2': True, 'T2||T3': True, 'T3||T4': False}
+    data['comparisons_count'] = 3
+    session_path.write_text(json.dumps(data))
+
+    assert fresh_manager(manager).get_session_progress(USER, 'set_a')['comparisons_made'] == 3
+    assert indexed_count(manager, 'set_a') == 3
+
+
+def test_missing_index_is_rebuilt(manager):
+    manager.save_session(USER, 'set_a', {('T1', 'T2'): True}, [('T1', 'T2')])
+    (manager.users_dir / get_user_id(USER) / PROGRESS_INDEX_NAME).unlink()
+
+    assert fresh_manager(manager).get_user_progress(USER)['set_a']['comparisons_made'] == 1
+    assert indexed_count(manager, 'set_a') == 1
@@ -0,0 +1,49 @@
+# tests/test_startup_time.py
+import sys
+import os
+import json
+import subprocess
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+# Cold import of the annotator entry point, best of a few fresh interpreters
+IMPORT_BUDGET_SECONDS = 0.5
+RUNS = 3
+
+# Must not be loaded before the annotator reaches the screen that needs them
+HEAVY_MODULES = ['numpy', 'pandas', 'scipy']
+
+_PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import src.text_ranking_tool.main
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def measure_cold_import(runs: int = RUNS) -> dict:
+    """Import src.text_ranking_tool.main in fresh interpreters; fastest run wins"""
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", _PROBE], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return min(results, key=lambda result: result['seconds'])
+
+
+def test_annotator_import_within_budget():
+    """The annotator path imports without NumPy/pandas/SciPy and under the time budget"""
+    result = measure_cold_import()
+    assert result['loaded'] == [], f"Heavy modules imported eagerly: {result['loaded']}"
+    assert result['seconds'] < IMPORT_BUDGET_SECONDS, \
+        f"Cold import took {result['seconds']:.3f}s (budget {IMPORT_BUDGET_SECONDS}s)"
+
+
+# Usage
+if __name__ == "__main__":
+    print("🚀 Annotator cold import time")
+    print("=" * 50)
+    result = measure_cold_import(runs=5)
+    print(f"Best of 5:     {1000 * result['seconds']:.1f}ms (budget {1000 * IMPORT_BUDGET_SECONDS:.0f}ms)")
+    print(f"Heavy modules: {', '.join(result['loaded']) or 'none'}")
@@ -0,0 +1,93 @@
+# tests/test_streaming_export.py
+import sys
+import os
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.export.formatters as formatters           # noqa: E402
+from src.text_ranking_tool.config.constants import get_user_id         # noqa: E402
+from tests.test_record_writers import make_exporter, read_csv_rows, USERS  # noqa: E402
+
+DATASETS = ['set_a', 'set_b']
+
+
+@pytest.fixture
+def exporter(tmp_path, monkeypatch):
+    return make_exporter(tmp_path, monkeypatch)
+
+
+def internal_rows(tmp_path, username, dataset):
+    """The user's ranking as written by the automatic internal export (the baseline records)"""
+    [path] = (tmp_path / 'internal').glob(f"{get_user_id(username)}_{dataset}_*.csv")
+    return read_csv_rows(path)
+
+
+def project(rows, fieldnames):
+    return [{name: row[name] for name in fieldnames} for row in rows]
+
+
+def test_per_user_export_streams_every_dataset(tmp_path, exporter):
+    result = exporter.export_per_user_external(USERS)
+    assert len(result['files']) == len(USERS)
+
+    for username, path in zip(USERS, result['files']):
+        expected = [row for dataset in DATASETS for row in internal_rows(tmp_path, username, dataset)]
+        assert read_csv_rows(path) == expected
+    assert result['total_records'] == 2 * 2 * 30
+
+
+def test_per_file_export_groups_users_by_dataset(tmp_path, exporter):
+    fieldnames = ['file_name', 'id', 'valence', 'ranking', 'new_ranking', 'algorithm', 'user_name', 'text']
+    result = exporter.export_per_file_external(USERS)
+    assert len(result['files']) == len(DATASETS)
+
+    for dataset, path in zip(DATASETS, result['files']):
+        expected = [row for username in USERS for row in internal_rows(tmp_path, username, dataset)]
+        assert read_csv_rows(path) == project(expected, fieldnames)
+
+
+def test_overall_export_drops_text(tmp_path, exporter):
+    fieldnames = ['file_name', 'id', 'valence', 'ranking', 'new_ranking', 'algorithm', 'user_name']
+    result = exporter.export_overall_project_external(USERS)
+
+    expected = [row for dataset in DATASETS for username in USERS
+                for row in internal_rows(tmp_path, username, dataset)]
+    assert read_csv_rows(result['files'][0]) == project(expected, fieldnames)
+
+
+def test_grouped_streams_keep_one_file_open(tmp_path, monkeypatch, exporter):
+    """With grouped keys each output is closed before the next one opens"""
+    open_writers = []
+    peak = []
+    original_open = formatters.open_record_writer
+
+    class TrackingWriter:
+        def __init__(self, writer):
+            self._writer = writer
+
+        def __enter__(self):
+            open_writers.append(self)
+            peak.append(len(open_writers))
+            self._writer.__enter__()
+            return self._writer
+
+        def __exit__(self, *exc_info):
+            open_writers.remove(self)
+            return self._writer.__exit__(*exc_info)
+
+    monkeypatch.setattr(formatters, "open_record_writer",
+                        lambda *args, **kwargs: TrackingWriter(original_open(*args, **kwargs)))
+
+    keyed = [('a', {'x': 1}), ('a', {'x': 2}), ('b', {'x': 3}), ('c', {'x': 4})]
+    written = exporter._stream_records(iter(keyed), lambda key: tmp_path / f'{key}.csv', ['x'], grouped=True)
+
+    assert {key: count for key, (_, count) in written.items()} == {'a': 2, 'b': 1, 'c': 1}
+    assert max(peak) == 1 and not open_writers
+    assert read_csv_rows(tmp_path / 'a.csv') == [{'x': '1'}, {'x': '2'}]
+
+
+def test_no_records_writes_no_files(tmp_path, exporter):
+    result = exporter.export_per_user_external(['Nobody'])
+    assert result == {'files': [], 'total_records': 0, 'export_type': 'per_user_external'}
+    assert not list((tmp_path / 'external').iterdir())
@@ -0,0 +1,69 @@
+# tests/test_text_formatters.py
+import sys
+import os
+import random
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from rich.text import Text                                                              # noqa: E402
+import src.text_ranking_tool.utils.text_formatters as text_formatters                  # noqa: E402
+from src.text_ranking_tool.utils.text_formatters import _compile_patterns, _regex_spans, _stylize_matches  # noqa: E402
+from src.text_ranking_tool.utils.aho_corasick import AhoCorasickMatcher                # noqa: E402
+from tests.bench_text_formatters import covered, legacy_spans, make_dictionary         # noqa: E402
+
+# (patterns, text) pairs where branches of the combined trie compete
+CASES = [
+    (['a b*', 'a bc d'], 'a bc d'),
+    (['a bc d', 'a b*'], 'a bc d'),
+    (['a b*', 'a bc d'], 'a  bc d and a\tbcx'),
+    (['the cat*', 'the dog', 'the dog sat'], 'the dog sat, the  catalogue, the dogs'),
+    (['x y z*', 'x y', 'x yy*'], 'x y zed; x yy; x  y zz'),
+    (['run*', 'running late', 'run fast*'], 'running late, run faster, rerun'),
+    (['not good', 'not*', 'no'], 'not good at all, nothing, no, No'),
+    (['e.g.', 'i.e. th*'], 'e.g. this; i.e. that, i.e.  those'),
+]
+
+
+def test_regex_matches_legacy_per_pattern_scan():
+    """The combined regex styles exactly the characters the per-pattern scans did"""
+    for patterns, text in CASES:
+        expected = legacy_spans(patterns, text)
+        assert covered(_regex_spans(_compile_patterns(tuple(patterns)), text)) == expected, (patterns, text)
+
+        styled = _stylize_matches(Text(text), patterns, "strike")
+        assert covered([(span.start, span.end) for span in styled.spans]) == expected, (patterns, text)
+
+
+def random_cases(n_cases: int = 30):
+    """Small dictionaries over a tiny alphabet, so patterns share prefixes and overlap often"""
+    rng_state = random.getstate()
+    random.seed(1)
+    vocab = sorted({''.join(random.choices('abcde', k=random.randint(2, 4))) for _ in range(300)})
+    cases = []
+    for _ in range(n_cases):
+        patterns = make_dictionary(20, vocab)
+        text = ' '.join(random.choice(vocab) + random.choice(['', ' ', '  ', '\t']) for _ in range(60))
+        cases.append((patterns, text))
+    random.setstate(rng_state)
+    return cases
+
+
+@pytest.mark.parametrize('matcher', ['regex', 'aho_corasick'])
+def test_both_engines_match_legacy_per_pattern_scan(monkeypatch, matcher):
+    """Whichever engine is configured, styled characters equal the per-pattern scan's"""
+    monkeypatch.setattr(text_formatters, "TEXT_FORMATTING_RULE", {"type": "strike", "matcher": matcher})
+    for patterns, text in CASES + random_cases():
+        expected = legacy_spans(patterns, text)
+        if matcher == 'aho_corasick':
+            assert covered(AhoCorasickMatcher(patterns).spans(text)) == expected, (patterns, text)
+
+        styled = _stylize_matches(Text(text), patterns, "strike")
+        assert covered([(span.start, span.end) for span in styled.spans]) == expected, (patterns, text)
+
+
+def test_longest_phrase_wins_regardless_of_order():
+    """'a bc d' is styled in full even when the shorter 'a b*' comes first"""
+    for patterns in (['a b*', 'a bc d'], ['a bc d', 'a b*']):
+        assert covered(_regex_spans(_compile_patterns(tuple(patterns)), 'a bc d')) == set(range(6))
+        assert covered(AhoCorasickMatcher(patterns).spans('a bc d')) == set(range(6))
@@ -0,0 +1,149 @@
+# tests/test_text_store.py
+import sys
+import os
+import shutil
+import types
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import src.text_ranking_tool.data.dataset_cache as dataset_cache       # noqa: E402
+import src.text_ranking_tool.data.text_store as text_store_module      # noqa: E402
+from src.text_ranking_tool.data.csv_loader import load_ranking_data   # noqa: E402
+from src.text_ranking_tool.data.text_store import load_text_store     # noqa: E402
+from tests.test_record_writers import make_exporter, USERS            # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_cache, "_dataset_cache_instance", dataset_cache.DatasetCache(tmp_path / 'cache'))
+    text_store = load_text_store(data_path)
+    yield text_store
+    text_store.close()
+
+
+def test_store_matches_load_ranking_data(store):
+    """Every row reads back exactly as the eager loader returns it"""
+    expected = load_ranking_data(data_path)
+    assert len(store) == len(expected)
+    assert [dict(record) for record in store] == expected
+    assert store.text(expected[-1]['id']) == expected[-1]['text']
+
+
+def test_cached_index_reads_the_same_rows(store):
+    """A second load comes from the dataset cache and still finds the right text"""
+    cached = load_text_store(data_path)
+    assert cached.ids == store.ids
+    assert [cached.text_at(i) for i in range(len(cached))] == [store.text_at(i) for i in range(len(store))]
+    cached.close()
+
+
+def test_subset_and_lookup(store):
+    """subset keeps the requested order; lookup resolves IDs to rows"""
+    wanted = [store.ids[5], store.ids[0], store.ids[12]]
+    subset = store.subset(wanted)
+    assert subset.ids == wanted
+    assert [record['text'] for record in subset] == [store.text(text_id) for text_id in wanted]
+    assert store.ids[3] in store.lookup
+    assert 'missing' not in store.lookup
+    assert store.lookup[store.ids[3]]['valence'] == store.valence[3]
+    with pytest.raises(KeyError):
+        store.lookup['missing']
+
+
+def test_close_releases_map_and_reopens_on_demand(store):
+    """close drops the map; reading text again maps the file again"""
+    first_text = store.text_at(0)
+    assert store._source._map is not None
+    store.close()
+    assert store._source._map is None
+    assert store.text_at(0) == first_text
+
+
+@pytest.fixture
+def opened_maps(monkeypatch):
+    """Every _MappedCsv whose file gets mapped during the test"""
+    opened = []
+    original_open = text_store_module._MappedCsv._open
+
+    def tracking_open(self):
+        original_open(self)
+        opened.append(self)
+
+    monkeypatch.setattr(text_store_module._MappedCsv, "_open", tracking_open)
+    return opened
+
+
+def test_export_leaves_no_open_maps(tmp_path, monkeypatch, opened_maps):
+    """Exporting every dataset closes each dataset's map before moving on"""
+    exporter = make_exporter(tmp_path, monkeypatch)
+
+    exporter.export_per_user_external(USERS)
+    exporter.export_per_file_external(USERS)
+    exporter.export_overall_project_external(USERS)
+
+    assert opened_maps, "export should have read text from the datasets"
+    assert all(source._map is None for source in opened_maps)
+
+
+class ReadingAlgorithm:
+    """Algorithm stand-in that reads every text while sorting, then keeps the file order"""
+    NAME = "Reading"
+
+    def __init__(self, interrupt):
+        self.interrupt = interrupt
+        self.comparison_engine = None
+        self.text_data = None
+
+    def initialize_from_data(self, text_data):
+        self.text_data = text_data
+        return True
+
+    def sort(self, text_ids):
+        assert all(self.text_data.text(text_id) for text_id in text_ids)
+        if self.interrupt:
+            raise KeyboardInterrupt
+        return list(text_ids)
+
+
+@pytest.mark.parametrize("interrupt", [False, True])
+def test_session_dataset_is_closed_before_main_restarts(tmp_path, monkeypatch, opened_maps, interrupt):
+    """Ranking another dataset (or quitting mid-session) leaves no map open for the next mirror"""
+    import src.text_ranking_tool.main as main_module
+    import src.text_ranking_tool.ux.file_selection_ui as file_selection_ui
+    import src.text_ranking_tool.ux.auto_export_ui as auto_export_ui
+    import src.text_ranking_tool.ranking.comparison_engine as comparison_engine
+    from src.text_ranking_tool.algorithms.registry import algorithm_registry
+
+    (tmp_path / 'data').mkdir()
+    shutil.copy(data_path, tmp_path / 'data' / 'set_a.csv')
+    monkeypatch.setattr(main_module, "INTERNAL_DATA_DIR", tmp_path / 'data')
+
+    mirrors = []
+
+    def check_mirror():
+        # What the next pass over the internal CSVs would see
+        mirrors.append([source._map is None for source in opened_maps])
+
+    users = iter(['User Alpha', None])
+    monkeypatch.setattr(main_module, "initialize_data_directories", check_mirror)
+    monkeypatch.setattr(main_module, "show_user_selection", lambda: next(users))
+    monkeypatch.setattr(main_module, "show_user_welcome", lambda user: None)
+    monkeypatch.setattr(main_module, "auto_export_completed_ranking", lambda *args: None)
+    monkeypatch.setattr(file_selection_ui, "show_file_selection", lambda user: 'set_a')
+    monkeypatch.setattr(file_selection_ui, "show_file_loading_status", lambda *args: None)
+    monkeypatch.setattr(comparison_engine, "initialize_comparison_engine",
+                        lambda *args: types.SimpleNamespace(get_progress_info=lambda: {'comparisons_made': 0}))
+    monkeypatch.setattr(algorithm_registry, "create_algorithm", lambda name: ReadingAlgorithm(interrupt))
+    monkeypatch.setattr(auto_export_ui, "show_completion_results", lambda *args: True)
+    monkeypatch.setattr('builtins.input', lambda *args: '')
+
+    main_module.main()
+
+    assert opened_maps, "the session should have read text from the dataset"
+    assert all(source._map is None for source in opened_maps)
+    if not interrupt:
+        # main() ran again for the next dataset only after the first one was closed
+        assert mirrors == [[], [True] * len(opened_maps)]
@@ -0,0 +1,99 @@
+# tests/test_transitive_pivot.py
+import sys
+import os
+import math
+import random
+import statistics
+import pytest
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.text_ranking_tool.algorithms.transitive_quick.transitive_quick_core import TransitiveQuickRank  # noqa: E402
+from src.text_ranking_tool.data.csv_loader import load_ranking_data                                      # noqa: E402
+from src.text_ranking_tool.data.dataset import Dataset                                                    # noqa: E402
+from tests.utils import MockComparisonEngine, get_expected_order                                          # noqa: E402
+
+data_path = os.path.join(project_root, 'tests', 'data', 'mock_data_30.csv')
+
+
+def parsed_valences(dataset: Dataset, text_ids):
+    """(id, valence) for every ID with a parsable valence"""
+    pairs = []
+    for text_id in text_ids:
+        try:
+            value = float(dataset.lookup[text_id]['valence'])
+        except (KeyError, ValueError):
+            continue
+        if not math.isnan(value):
+            pairs.append((text_id, value))
+    return pairs
+
+
+def closest_to_median_valence(dataset: Dataset, text_ids):
+    """Valence of the pre-index pivot: statistics.median, then the closest ID by linear scan"""
+    pairs = parsed_valences(dataset, text_ids)
+    median_val = statistics.median(value for _, value in pairs)
+    return min(pairs, key=lambda pair: abs(pair[1] - median_val))[1]
+
+
+def lower_median_valence(dataset: Dataset, text_ids):
+    values = sorted(value for _, value in parsed_valences(dataset, text_ids))
+    return values[(len(values) - 1) // 2]
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    return Dataset.from_items(load_ranking_data(data_path))
+
+
+@pytest.mark.parametrize('size', [1, 2, 5, 12, 17, 30])
+def test_median_valence_id_matches_brute_force(dataset, size):
+    """Odd sizes pick the old closest-to-median valence; even sizes the lower of the two middle ones"""
+    rng = random.Random(size)
+    for _ in range(20):
+        text_ids = rng.sample(dataset.ids, size)
+        pivot = dataset.median_valence_id(text_ids)
+        assert pivot in text_ids
+        pivot_valence = dataset.valence[dataset.id_index[pivot]]
+        assert pivot_valence == lower_median_valence(dataset, text_ids)
+        if size % 2:
+            assert pivot_valence == closest_to_median_valence(dataset, text_ids)
+
+
+def test_median_valence_id_ignores_unparsable_and_unknown_ids():
+    items = [
+        {'id': 'a', 'valence': '0.9', 'ranking': '1', 'text': ''},
+        {'id': 'b', 'valence': 'n/a', 'ranking': '2', 'text': ''},
+        {'id': 'c', 'valence': '-0.4', 'ranking': '3', 'text': ''},
+        {'id': 'd', 'valence': '', 'ranking': '4', 'text': ''},
+        {'id': 'e', 'valence': '0.1', 'ranking': '5', 'text': ''},
+    ]
+    dataset = Dataset.from_items(items)
+    assert dataset.median_valence_id(['a', 'b', 'c', 'd', 'e', 'zzz']) == 'e'
+    assert dataset.median_valence_id(['b', 'a', 'c']) == 'c'  # lower median of {-0.4, 0.9}
+    assert dataset.median_valence_id(['b', 'd', 'zzz']) is None
+    assert dataset.median_valence_id([]) is None
+
+
+def run_sorts(deep: bool, runs: int = 10):
+    data = load_ranking_data(data_path)
+    algorithm = TransitiveQuickRank()  # type: ignore
+    algorithm.initialize_from_data(data)
+    algorithm.comparison_engine = MockComparisonEngine(data, debug=False)  # type: ignore
+    ids = [item['id'] for item in data]
+    expected_order = get_expected_order(data)
+
+    counts = []
+    for _ in range(runs):
+        assert algorithm.sort(ids.copy(), deep_valence_pivots=deep) == expected_order
+        counts.append(algorithm.comparison_count)
+    return counts
+
+
+def test_deep_valence_pivots_need_fewer_comparisons():
+    """Valence pivots at every level sort correctly with fewer oracle comparisons than top-level only"""
+    random.seed(0)
+    top_counts = run_sorts(deep=False)
+    deep_counts = run_sorts(deep=True)
+    assert statistics.mean(deep_counts) < statistics.mean(top_counts)
+    assert max(deep_counts) < statistics.mean(top_counts)